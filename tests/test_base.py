@@ -15,6 +15,7 @@ from vectorbt.base import (
     indexing,
     reshape_fns
 )
+from vectorbt.utils import shm
 
 settings.broadcasting['index_from'] = 'stack'
 settings.broadcasting['columns_from'] = 'stack'
@@ -2190,6 +2191,30 @@ class TestReshapeFns:
                     assert bc_arg_2d[i, col] == reshape_fns.flex_select_nb(
                         i, col, raw_arg, def_i, def_col, bc_arg.ndim == 2)
 
+    @pytest.mark.parametrize(
+        "test_inputs",
+        [
+            (0, a1, a2, sr_none, sr1, sr2),
+            (0, a1, a2, a3, a4, a5, sr_none, sr1, sr2, df_none, df1, df2, df3, df4)
+        ],
+    )
+    def test_flex_select_cols(self, test_inputs):
+        raw_args = reshape_fns.broadcast(*test_inputs, keep_raw=True)
+        bc_args = reshape_fns.broadcast(*test_inputs, keep_raw=False)
+        for r in range(len(test_inputs)):
+            raw_arg = raw_args[r]
+            bc_arg = np.array(bc_args[r])
+            flex_2d = bc_arg.ndim == 2
+            bc_arg_2d = reshape_fns.to_2d(bc_arg)
+            for cols in (slice(1, None), np.array([0, 2])):
+                if bc_arg_2d.shape[1] < 3:
+                    continue
+                sel_arg = reshape_fns.flex_select_cols(raw_arg, cols, flex_2d)
+                target = bc_arg_2d[:, cols]
+                for col in range(target.shape[1]):
+                    for i in range(target.shape[0]):
+                        assert target[i, col] == reshape_fns.flex_select_auto_nb(i, col, sel_arg, flex_2d)
+
 
 # ############# indexing.py ############# #
 
@@ -2567,6 +2592,64 @@ class TestCombineFns:
         )
 
 
+    @pytest.mark.parametrize(
+        "test_transport",
+        ['shm', 'mmap'],
+    )
+    def test_pool_apply(self, test_transport):
+        @njit
+        def apply_func_nb(i, x, a):
+            return x + a[i]
+
+        @njit
+        def apply_multiple_func_nb(i, x, a):
+            return (x, x + a[i])
+
+        @njit
+        def combine_func_nb(x, y, a):
+            return x + y + a
+
+        pool_kwargs = dict(max_workers=2)
+        shm_kwargs = dict(transport=test_transport, min_nbytes=0)
+        np.testing.assert_array_equal(
+            combine_fns.apply_and_concat_one_pool(
+                3, apply_func_nb, df4.values, np.array([10, 20, 30]),
+                pool_kwargs=pool_kwargs, shm_kwargs=shm_kwargs),
+            combine_fns.apply_and_concat_one(3, apply_func_nb, df4.values, np.array([10, 20, 30]))
+        )
+        a, b = combine_fns.apply_and_concat_multiple_pool(
+            3, apply_multiple_func_nb, df4.values, np.array([10, 20, 30]),
+            pool_kwargs=pool_kwargs, shm_kwargs=shm_kwargs)
+        a2, b2 = combine_fns.apply_and_concat_multiple(3, apply_multiple_func_nb, df4.values, np.array([10, 20, 30]))
+        np.testing.assert_array_equal(a, a2)
+        np.testing.assert_array_equal(b, b2)
+        np.testing.assert_array_equal(
+            combine_fns.combine_and_concat_pool(
+                df4.values, (df4.values * 2, df4.values * 3), combine_func_nb, 100,
+                pool_kwargs=pool_kwargs, shm_kwargs=shm_kwargs),
+            combine_fns.combine_and_concat(df4.values, (df4.values * 2, df4.values * 3), combine_func_nb, 100)
+        )
+
+    def test_attach_and_apply(self):
+        def apply_func(i, x, y=None):
+            return x[i], y
+
+        with shm.shared_arrays((df4.values, np.arange(3)), min_nbytes=0) as (shared_x, shared_y):
+            for i in range(2):
+                x_row, y = combine_fns.attach_and_apply(i, apply_func, shared_x, y=shared_y)
+                np.testing.assert_array_equal(x_row, df4.values[i])
+                np.testing.assert_array_equal(y, np.arange(3))
+                assert len(shm._attached) == 0
+
+        def raise_func(i, x):
+            raise ValueError
+
+        with shm.shared_arrays((df4.values,), min_nbytes=0) as (shared_x,):
+            with pytest.raises(ValueError) as e_info:
+                combine_fns.attach_and_apply(0, raise_func, shared_x)
+        assert len(shm._attached) == 0
+
+
 # ############# common.py ############# #
 
 class TestCommon:
@@ -187,6 +187,42 @@ class TestAccessors:
             df.rolling(test_window).max()
         )
 
+    @pytest.mark.parametrize(
+        "test_window,test_minp",
+        list(product([1, 2, 3, 4, 5], [1, None]))
+    )
+    def test_rolling_argmin(self, test_window, test_minp):
+        pd.testing.assert_frame_equal(
+            df.vbt.rolling_argmin(test_window, minp=test_minp),
+            df.vbt.rolling_apply(
+                test_window,
+                njit(lambda i, col, a: i + 1 - len(a) + nb.argmin_reduce_nb(col, a)),
+                minp=test_minp
+            )
+        )
+        pd.testing.assert_series_equal(
+            df['b'].vbt.rolling_argmin(2, minp=1),
+            pd.Series(np.array([np.nan, 1., 2., 3., 4.]), index=df.index, name='b')
+        )
+
+    @pytest.mark.parametrize(
+        "test_window,test_minp",
+        list(product([1, 2, 3, 4, 5], [1, None]))
+    )
+    def test_rolling_argmax(self, test_window, test_minp):
+        pd.testing.assert_frame_equal(
+            df.vbt.rolling_argmax(test_window, minp=test_minp),
+            df.vbt.rolling_apply(
+                test_window,
+                njit(lambda i, col, a: i + 1 - len(a) + nb.argmax_reduce_nb(col, a)),
+                minp=test_minp
+            )
+        )
+        pd.testing.assert_series_equal(
+            pd.Series([1., 2., 2., np.nan, 1.]).vbt.rolling_argmax(3, minp=1),
+            pd.Series([0., 1., 1., 1., 2.])
+        )
+
     @pytest.mark.parametrize(
         "test_window,test_minp",
         list(product([1, 2, 3, 4, 5], [1, None]))
@@ -207,6 +243,44 @@ class TestAccessors:
             df.rolling(test_window).mean()
         )
 
+    @pytest.mark.parametrize(
+        "test_window,test_minp",
+        list(product([1, 2, 3, 4, 5], [1, None]))
+    )
+    def test_rolling_median(self, test_window, test_minp):
+        if test_minp is None:
+            test_minp = test_window
+        pd.testing.assert_series_equal(
+            df['a'].vbt.rolling_median(test_window, minp=test_minp),
+            df['a'].rolling(test_window, min_periods=test_minp).median()
+        )
+        pd.testing.assert_frame_equal(
+            df.vbt.rolling_median(test_window, minp=test_minp),
+            df.rolling(test_window, min_periods=test_minp).median()
+        )
+
+    @pytest.mark.parametrize(
+        "test_window,test_minp,test_q",
+        list(product([1, 2, 3, 4, 5], [1, None], [0., 0.3, 0.5, 1.]))
+    )
+    def test_rolling_quantile(self, test_window, test_minp, test_q):
+        if test_minp is None:
+            test_minp = test_window
+        pd.testing.assert_series_equal(
+            df['a'].vbt.rolling_quantile(test_window, test_q, minp=test_minp),
+            df['a'].rolling(test_window, min_periods=test_minp).quantile(test_q)
+        )
+        pd.testing.assert_frame_equal(
+            df.vbt.rolling_quantile(test_window, test_q, minp=test_minp),
+            df.rolling(test_window, min_periods=test_minp).quantile(test_q)
+        )
+        pd.testing.assert_frame_equal(
+            df.vbt.rolling_quantile(test_window, test_q),
+            df.rolling(test_window).quantile(test_q)
+        )
+        with pytest.raises(Exception) as e_info:
+            df.vbt.rolling_quantile(test_window, 1.5)
+
     @pytest.mark.parametrize(
         "test_window,test_minp,test_ddof",
         list(product([1, 2, 3, 4, 5], [1, None], [0, 1]))
@@ -468,6 +542,54 @@ class TestAccessors:
             )
         )
 
+    def test_parallel(self):
+        for sr_or_df in [df['a'], df]:
+            assert_equal = pd.testing.assert_series_equal \
+                if isinstance(sr_or_df, pd.Series) else pd.testing.assert_frame_equal
+            for method, args in [
+                ('rolling_min', (2,)),
+                ('rolling_max', (2, 1)),
+                ('rolling_argmin', (3,)),
+                ('rolling_argmax', (3, 1)),
+                ('rolling_mean', (3,)),
+                ('rolling_median', (3, 1)),
+                ('rolling_quantile', (3, 0.3)),
+                ('rolling_std', (3, 2)),
+                ('expanding_min', ()),
+                ('expanding_max', (2,)),
+                ('expanding_mean', ()),
+                ('expanding_std', (2,)),
+                ('ewm_mean', (2,)),
+                ('ewm_std', (3, 1))
+            ]:
+                assert_equal(
+                    getattr(sr_or_df.vbt, method)(*args, parallel=True),
+                    getattr(sr_or_df.vbt, method)(*args)
+                )
+            assert_equal(
+                sr_or_df.vbt.rolling_apply(2, i_col_nanmean_nb, minp=1, parallel=True),
+                sr_or_df.vbt.rolling_apply(2, i_col_nanmean_nb, minp=1)
+            )
+            assert_equal(
+                sr_or_df.vbt.expanding_apply(i_col_nanmean_nb, parallel=True),
+                sr_or_df.vbt.expanding_apply(i_col_nanmean_nb)
+            )
+            assert_equal(
+                sr_or_df.vbt.groupby_apply(np.asarray([1, 1, 2, 2, 3]), i_col_nanmean_nb, parallel=True),
+                sr_or_df.vbt.groupby_apply(np.asarray([1, 1, 2, 2, 3]), i_col_nanmean_nb)
+            )
+            assert_equal(
+                sr_or_df.vbt.resample_apply('3d', i_col_nanmean_nb, parallel=True),
+                sr_or_df.vbt.resample_apply('3d', i_col_nanmean_nb)
+            )
+        with pytest.raises(Exception) as e_info:
+            df.vbt.rolling_mean(2, minp=3, parallel=True)
+        vbt.settings.generic['parallel'] = True
+        try:
+            pd.testing.assert_frame_equal(df.vbt.rolling_mean(2), df.vbt.rolling_mean(2, parallel=False))
+        finally:
+            vbt.settings.generic['parallel'] = False
+
     def test_applymap(self):
         @njit
         def mult_nb(i, col, x):
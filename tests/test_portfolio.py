@@ -1,3 +1,7 @@
+import os
+import sys
+import subprocess
+import textwrap
 import numpy as np
 import pandas as pd
 from numba import njit, typeof
@@ -857,6 +861,60 @@ class TestFromSignals:
             ], dtype=order_dt)
         )
 
+    def test_stops(self):
+        stop_price = pd.Series([10., 12., 9., 11., 8.], index=price.index)
+        stop_entries = pd.Series([True, False, False, True, False], index=price.index)
+        record_arrays_close(
+            from_signals_longonly(
+                price=stop_price, entries=stop_entries, exits=False,
+                sl_stop=[[0.2, 0.2, 0.]], sl_trail=[[False, True, False]], tp_stop=[[0., 0., 0.1]]
+            ).order_records,
+            np.array([
+                (0, 0, 0, 10.0, 10.0, 0.0, 0), (1, 4, 0, 10.0, 8.0, 0.0, 1), (2, 0, 1, 10.0, 10.0, 0.0, 0),
+                (3, 2, 1, 10.0, 9.0, 0.0, 1), (4, 3, 1, 8.181818181818182, 11.0, 0.0, 0),
+                (5, 4, 1, 8.181818181818182, 8.0, 0.0, 1), (6, 0, 2, 10.0, 10.0, 0.0, 0),
+                (7, 1, 2, 10.0, 12.0, 0.0, 1), (8, 3, 2, 10.909090909090908, 11.0, 0.0, 0)
+            ], dtype=order_dt)
+        )
+        record_arrays_close(
+            from_signals_shortonly(
+                price=stop_price, entries=stop_entries, exits=False,
+                sl_stop=[[0.1, 0.]], tp_stop=[[0., 0.1]]
+            ).order_records,
+            np.array([
+                (0, 0, 0, 10.0, 10.0, 0.0, 1), (1, 1, 0, 10.0, 12.0, 0.0, 0), (2, 3, 0, 7.2727272727272725, 11.0, 0.0, 1),
+                (3, 0, 1, 10.0, 10.0, 0.0, 1), (4, 2, 1, 10.0, 9.0, 0.0, 0), (5, 3, 1, 10.0, 11.0, 0.0, 1),
+                (6, 4, 1, 10.0, 8.0, 0.0, 0)
+            ], dtype=order_dt)
+        )
+        # Same as generating stop exits beforehand
+        _price = big_price_wide.iloc[:100, :10]
+        _entries = pd.DataFrame(np.random.uniform(size=_price.shape) > 0.9, index=_price.index, columns=_price.columns)
+        for stop, trailing in [(-0.1, False), (-0.1, True), (0.1, False)]:
+            new_entries, new_exits = _entries.vbt.signals.generate_stop_exits(
+                _price, stop, trailing=trailing, iteratively=True)
+            if stop < 0:
+                stop_kwargs = dict(sl_stop=-stop, sl_trail=trailing)
+            else:
+                stop_kwargs = dict(tp_stop=stop)
+            record_arrays_close(
+                from_signals_longonly(price=_price, entries=_entries, exits=False, **stop_kwargs).order_records,
+                from_signals_longonly(price=_price, entries=new_entries, exits=new_exits).order_records
+            )
+        sl_stops = [0.05, 0.1, 0.2]
+        portfolio = from_signals_longonly(
+            price=_price.vbt.tile(3, keys=pd.Index(sl_stops, name='sl_stop')),
+            entries=_entries.vbt.tile(3, keys=pd.Index(sl_stops, name='sl_stop')),
+            exits=False,
+            sl_stop=[np.repeat(sl_stops, 10)]
+        )
+        for sl_stop in sl_stops:
+            pd.testing.assert_frame_equal(
+                portfolio[sl_stop].orders.records.drop(columns='id').reset_index(drop=True),
+                from_signals_longonly(price=_price, entries=_entries, exits=False, sl_stop=sl_stop)
+                .orders.records.drop(columns='id')
+            )
+
     def test_allow_partial(self):
         record_arrays_close(
             from_signals_all(size=1000, allow_partial=[[True, False]]).order_records,
@@ -1224,16 +1282,230 @@ class TestFromSignals:
         )
 
     def test_max_orders(self):
-        _ = from_signals_all(price=price_wide)
-        _ = from_signals_all(price=price_wide, max_orders=6)
-        with pytest.raises(Exception) as e_info:
-            _ = from_signals_all(price=price_wide, max_orders=5)
+        portfolio = from_signals_all(price=price_wide)
+        for max_orders in [0, 1, 5, 6, 100]:
+            record_arrays_close(
+                from_signals_all(price=price_wide, max_orders=max_orders).order_records,
+                portfolio.order_records
+            )
 
     def test_max_logs(self):
-        _ = from_signals_all(price=price_wide, log=True)
-        _ = from_signals_all(price=price_wide, log=True, max_logs=6)
+        portfolio = from_signals_all(price=price_wide, log=True)
+        for max_logs in [0, 1, 5, 6, 100]:
+            record_arrays_close(
+                from_signals_all(price=price_wide, log=True, max_logs=max_logs).log_records,
+                portfolio.log_records
+            )
+
+    def test_parallel(self):
+        kwargs = dict(
+            price=big_price_wide.iloc[:100, :50],
+            entries=big_price_wide.iloc[:100, :50] > 0.5,
+            exits=big_price_wide.iloc[:100, :50] < 0.5,
+            size=[np.arange(50)],
+            fees=0.01,
+            log=True
+        )
+        portfolio = from_signals_all(**kwargs)
+        for n_chunks in [1, 3, 50, 100]:
+            par_portfolio = from_signals_all(**kwargs, parallel=True, n_chunks=n_chunks)
+            record_arrays_close(par_portfolio.order_records, portfolio.order_records)
+            record_arrays_close(par_portfolio.log_records, portfolio.log_records)
+        par_portfolio = from_signals_all(**kwargs, parallel=True, group_by=np.arange(50) // 10)
+        record_arrays_close(par_portfolio.order_records, portfolio.order_records)
+        kwargs['group_by'] = np.arange(50) // 10
+        kwargs['cash_sharing'] = True
+        kwargs['call_seq'] = 'auto'
+        portfolio = from_signals_all(**kwargs)
+        for n_chunks in [2, 3, 10]:
+            par_portfolio = from_signals_all(**kwargs, parallel=True, n_chunks=n_chunks)
+            record_arrays_close(par_portfolio.order_records, portfolio.order_records)
+            record_arrays_close(par_portfolio.log_records, portfolio.log_records)
+            np.testing.assert_array_equal(par_portfolio.call_seq.values, portfolio.call_seq.values)
+            np.testing.assert_array_equal(par_portfolio.sim_state.last_cash, portfolio.sim_state.last_cash)
+
+    def test_chunk_len(self):
+        kwargs = dict(
+            price=big_price_wide.iloc[:100, :50],
+            entries=big_price_wide.iloc[:100, :50] > 0.5,
+            exits=big_price_wide.iloc[:100, :50] < 0.5,
+            size=[np.arange(50)],
+            log=True
+        )
+        portfolio = from_signals_all(**kwargs)
+        for chunk_len in [1, 7, 50, 100]:
+            for parallel in [False, True]:
+                chunk_portfolio = from_signals_all(**kwargs, chunk_len=chunk_len, parallel=parallel)
+                record_arrays_close(chunk_portfolio.order_records, portfolio.order_records)
+                record_arrays_close(chunk_portfolio.log_records, portfolio.log_records)
+                pd.testing.assert_frame_equal(chunk_portfolio.close, portfolio.close)
+                np.testing.assert_array_equal(chunk_portfolio.call_seq.values, portfolio.call_seq.values)
+        chunk_portfolio = from_signals_all(**kwargs, chunk_len=7)
+        assert not chunk_portfolio.close.values.flags.owndata
+        assert not chunk_portfolio.call_seq.values.flags.writeable
+        pd.testing.assert_series_equal(chunk_portfolio.total_return(), portfolio.total_return())
+        kwargs['group_by'] = np.arange(50) // 10
+        kwargs['cash_sharing'] = True
+        kwargs['call_seq'] = 'auto'
+        portfolio = from_signals_all(**kwargs)
+        chunk_portfolio = from_signals_all(**kwargs, chunk_len=15)
+        record_arrays_close(chunk_portfolio.order_records, portfolio.order_records)
+        np.testing.assert_array_equal(chunk_portfolio.call_seq.values, portfolio.call_seq.values)
+
+    def test_emit_trades(self):
+        kwargs = dict(
+            price=big_price_wide.iloc[:100, :50],
+            entries=big_price_wide.iloc[:100, :50] > 0.5,
+            exits=big_price_wide.iloc[:100, :50] < 0.3,
+            size=[np.arange(50)],
+            fees=0.01,
+            accumulate=True
+        )
+        portfolio = from_signals_all(**kwargs)
+        for n_chunks in [1, 3, 50]:
+            trades_portfolio = from_signals_all(**kwargs, parallel=True, n_chunks=n_chunks, emit_trades=True)
+            assert trades_portfolio._trade_records is not None
+            record_arrays_close(trades_portfolio.trades.values, portfolio.trades.values)
+            record_arrays_close(trades_portfolio.positions.values, portfolio.positions.values)
+        trades_portfolio = from_signals_all(**kwargs, emit_trades=True, group_by=np.arange(50) // 10,
+                                            cash_sharing=True, call_seq='auto')
+        portfolio = from_signals_all(**kwargs, group_by=np.arange(50) // 10, cash_sharing=True, call_seq='auto')
+        record_arrays_close(trades_portfolio.trades.values, portfolio.trades.values)
+        record_arrays_close(trades_portfolio.iloc[[1, 3]].trades.values, portfolio.trades.iloc[[1, 3]].values)
+        record_arrays_close(
+            vbt.Trades.from_orders(portfolio.orders, parallel=True).values,
+            portfolio.trades.values
+        )
+
+    def test_sparse_signals(self):
+        _price = big_price_wide.iloc[:100, :20]
+        _entries = _price > 0.9
+        _exits = _price < 0.1
+        _sparse_entries = _entries.vbt.signals.to_sparse()
+        _sparse_exits = _exits.vbt.signals.to_sparse()
+        for kwargs in [
+            dict(),
+            dict(sl_stop=0.1, sl_trail=True, tp_stop=0.2),
+            dict(direction='all', accumulate=True, log=True),
+            dict(group_by=np.arange(20) // 5, cash_sharing=True, call_seq='auto', size=0.5, size_type='percent'),
+            dict(chunk_len=7, parallel=True)
+        ]:
+            portfolio = vbt.Portfolio.from_signals(_price, _entries, _exits, **kwargs)
+            for sparse_portfolio in [
+                vbt.Portfolio.from_signals(_price, _sparse_entries, _sparse_exits, **kwargs),
+                vbt.Portfolio.from_signals(_price, _entries, _sparse_exits, **kwargs)
+            ]:
+                record_arrays_close(sparse_portfolio.order_records, portfolio.order_records)
+                record_arrays_close(sparse_portfolio.log_records, portfolio.log_records)
+                np.testing.assert_array_equal(sparse_portfolio.call_seq.values, portfolio.call_seq.values)
+                for a, b in zip(sparse_portfolio.sim_state[:4], portfolio.sim_state[:4]):
+                    np.testing.assert_array_equal(a, b)
         with pytest.raises(Exception) as e_info:
-            _ = from_signals_all(price=price_wide, log=True, max_logs=5)
+            _ = vbt.Portfolio.from_signals(_price.iloc[:50], _sparse_entries, _sparse_exits)
+        with pytest.raises(Exception) as e_info:
+            _ = vbt.Portfolio.from_signals(_price, _sparse_entries._replace(col_lens=_sparse_entries.col_lens + 1), _exits)
+
+    def test_from_signals_batch(self):
+        _close = [
+            pd.Series(big_price_wide.iloc[:n, i].values, index=pd.date_range('2020', periods=n), name=str(i))
+            for i, n in enumerate([100, 1, 37, 64])
+        ]
+        _entries = [c > 0.5 for c in _close]
+        _exits = [(c < 0.5).values for c in _close]
+        _fees = [0.01, 0., np.full(37, 0.02), 0.]
+        _direction = ['longonly', 'all', 'shortonly', 'all']
+        portfolios = vbt.Portfolio.from_signals_batch(
+            _close, _entries, _exits, size=10., direction=_direction, fees=_fees,
+            log=True, sl_stop=0.05, init_cash=[100., 200., 300., 400.], freq='1D')
+        assert len(portfolios) == 4
+        for k in range(4):
+            portfolio = vbt.Portfolio.from_signals(
+                _close[k], _entries[k], _exits[k], size=10., direction=_direction[k], fees=_fees[k],
+                log=True, sl_stop=0.05, init_cash=[100., 200., 300., 400.][k], freq='1D')
+            record_arrays_close(portfolios[k].order_records, portfolio.order_records)
+            record_arrays_close(portfolios[k].log_records, portfolio.log_records)
+            pd.testing.assert_series_equal(portfolios[k].value(), portfolio.value())
+            for a, b in zip(portfolios[k].sim_state, portfolio.sim_state):
+                np.testing.assert_array_equal(a, b)
+        assert portfolios[-1] is portfolios[3]
+        assert len(portfolios[1:3]) == 2
+        np.testing.assert_array_equal(portfolios.offsets, np.array([0, 100, 101, 138, 202]))
+        assert len(portfolios.order_records) == portfolios.order_offsets[-1]
+        assert len(portfolios.log_records) == portfolios.log_offsets[-1]
+        # appending to a portfolio from the batch
+        _new_close = pd.Series(
+            big_price_wide.iloc[100:120, 0].values,
+            index=pd.date_range('2020', periods=120)[100:],
+            name='0'
+        )
+        appended = portfolios[0].append(
+            _new_close, _new_close > 0.5, _new_close < 0.5, size=10., direction='longonly',
+            fees=0.01, log=True, sl_stop=0.05)
+        full_close = pd.concat((_close[0], _new_close))
+        record_arrays_close(
+            appended.order_records,
+            vbt.Portfolio.from_signals(
+                full_close, full_close > 0.5, full_close < 0.5, size=10., direction='longonly',
+                fees=0.01, log=True, sl_stop=0.05, init_cash=100., freq='1D').order_records
+        )
+        with pytest.raises(Exception) as e_info:
+            _ = vbt.Portfolio.from_signals_batch(_close, _entries, _exits, fees=[0.01, 0.01])
+        with pytest.raises(Exception) as e_info:
+            _ = vbt.Portfolio.from_signals_batch(_close, _entries, _exits, fees=[0.01, 0., np.full(36, 0.02), 0.])
+
+    def test_append(self):
+        _price = big_price_wide.iloc[:100, :20]
+        _entries = _price > 0.5
+        _exits = _price < 0.5
+        kwargs = dict(size=[np.arange(20)], fees=0.01, log=True, sl_stop=0.05, sl_trail=True)
+
+        def _test_append(portfolio, **_kwargs):
+            appended = from_signals_all(
+                price=_price.iloc[:50], entries=_entries.iloc[:50], exits=_exits.iloc[:50], **_kwargs)
+            for split in [70, 99]:
+                appended = appended.append(
+                    _price.iloc[appended.wrapper.shape[0]:split],
+                    _entries.iloc[appended.wrapper.shape[0]:split],
+                    _exits.iloc[appended.wrapper.shape[0]:split],
+                    direction='all', **kwargs
+                )
+            appended = appended.append(_price.iloc[99:], _entries.iloc[99:], _exits.iloc[99:], direction='all', **kwargs)
+            record_arrays_close(appended.order_records, portfolio.order_records)
+            record_arrays_close(appended.log_records, portfolio.log_records)
+            pd.testing.assert_frame_equal(appended.close, portfolio.close)
+            pd.testing.assert_frame_equal(appended.call_seq, portfolio.call_seq)
+            pd.testing.assert_frame_equal(appended.value(), portfolio.value())
+            for a1, a2 in zip(appended.sim_state, portfolio.sim_state):
+                np.testing.assert_array_equal(a1, a2)
+
+        _test_append(from_signals_all(price=_price, entries=_entries, exits=_exits, **kwargs), **kwargs)
+        kwargs['group_by'] = np.arange(20) // 5
+        kwargs['cash_sharing'] = True
+        kwargs['call_seq'] = 'auto'
+        portfolio = from_signals_all(price=_price, entries=_entries, exits=_exits, **kwargs)
+        _test_append(portfolio, **kwargs)
+        del kwargs['group_by'], kwargs['cash_sharing']
+        _test_append(from_signals_all(price=_price, entries=_entries, exits=_exits, **kwargs), **kwargs)
+        np.testing.assert_array_equal(
+            portfolio.sim_state.last_cash,
+            portfolio.cash().values[-1]
+        )
+        np.testing.assert_array_equal(
+            portfolio.sim_state.last_shares,
+            portfolio.shares().values[-1]
+        )
+        np.testing.assert_array_equal(
+            portfolio[[0, 1]].sim_state.last_cash,
+            portfolio.sim_state.last_cash[[0, 1]]
+        )
+        np.testing.assert_array_equal(
+            portfolio[[0, 1]].sim_state.last_shares,
+            portfolio.sim_state.last_shares[:10]
+        )
+        with pytest.raises(Exception) as e_info:
+            portfolio.append(_price.values, _entries.values, _exits.values)
+        with pytest.raises(Exception) as e_info:
+            portfolio.copy(sim_state=None).append(_price, _entries, _exits)
 
 
 # ############# from_holding ############# #
@@ -2053,16 +2325,72 @@ class TestFromOrders:
         )
 
     def test_max_orders(self):
-        _ = from_orders_all(price=price_wide)
-        _ = from_orders_all(price=price_wide, max_orders=9)
-        with pytest.raises(Exception) as e_info:
-            _ = from_orders_all(price=price_wide, max_orders=8)
+        portfolio = from_orders_all(price=price_wide)
+        for max_orders in [0, 1, 8, 9, 100]:
+            record_arrays_close(
+                from_orders_all(price=price_wide, max_orders=max_orders).order_records,
+                portfolio.order_records
+            )
 
     def test_max_logs(self):
-        _ = from_orders_all(price=price_wide, log=True)
-        _ = from_orders_all(price=price_wide, log=True, max_logs=15)
-        with pytest.raises(Exception) as e_info:
-            _ = from_orders_all(price=price_wide, log=True, max_logs=14)
+        portfolio = from_orders_all(price=price_wide, log=True)
+        for max_logs in [0, 1, 14, 15, 100]:
+            record_arrays_close(
+                from_orders_all(price=price_wide, log=True, max_logs=max_logs).log_records,
+                portfolio.log_records
+            )
+
+    def test_parallel(self):
+        kwargs = dict(
+            price=big_price_wide.iloc[:100, :50],
+            size=np.where(big_price_wide.iloc[:100, :50] > 0.5, 1., -1.),
+            size_type=[[SizeType.Shares, SizeType.TargetPercent] * 25],
+            fees=0.01,
+            log=True
+        )
+        portfolio = from_orders_all(**kwargs)
+        for n_chunks in [1, 3, 50, 100]:
+            par_portfolio = from_orders_all(**kwargs, parallel=True, n_chunks=n_chunks)
+            record_arrays_close(par_portfolio.order_records, portfolio.order_records)
+            record_arrays_close(par_portfolio.log_records, portfolio.log_records)
+        kwargs['group_by'] = np.arange(50) // 10
+        kwargs['cash_sharing'] = True
+        kwargs['call_seq'] = 'auto'
+        portfolio = from_orders_all(**kwargs)
+        for n_chunks in [2, 3, 10]:
+            par_portfolio = from_orders_all(**kwargs, parallel=True, n_chunks=n_chunks)
+            record_arrays_close(par_portfolio.order_records, portfolio.order_records)
+            record_arrays_close(par_portfolio.log_records, portfolio.log_records)
+            np.testing.assert_array_equal(par_portfolio.call_seq.values, portfolio.call_seq.values)
+            np.testing.assert_array_equal(par_portfolio.sim_state.last_cash, portfolio.sim_state.last_cash)
+
+    def test_parallel_seed(self):
+        kwargs = dict(
+            price=big_price_wide.iloc[:100, :50],
+            size=np.where(big_price_wide.iloc[:100, :50] > 0.5, 1., -1.),
+            reject_prob=0.5,
+            seed=42
+        )
+        portfolio = from_orders_all(**kwargs, chunk_len=10)
+        for _ in range(3):
+            par_portfolio = from_orders_all(**kwargs, parallel=True, n_chunks=5)
+            record_arrays_close(par_portfolio.order_records, portfolio.order_records)
+
+    def test_chunk_len(self):
+        kwargs = dict(
+            price=big_price_wide.iloc[:100, :50],
+            size=np.where(big_price_wide.iloc[:100, :50] > 0.5, 1., -1.),
+            log=True,
+            group_by=np.arange(50) // 10,
+            cash_sharing=True,
+            call_seq='auto'
+        )
+        portfolio = from_orders_all(**kwargs)
+        for chunk_len in [1, 15, 100]:
+            chunk_portfolio = from_orders_all(**kwargs, chunk_len=chunk_len)
+            record_arrays_close(chunk_portfolio.order_records, portfolio.order_records)
+            record_arrays_close(chunk_portfolio.log_records, portfolio.log_records)
+            np.testing.assert_array_equal(chunk_portfolio.call_seq.values, portfolio.call_seq.values)
 
 
 # ############# from_order_func ############# #
@@ -2766,26 +3094,249 @@ class TestFromOrderFunc:
         [False, True],
     )
     def test_max_orders(self, test_row_wise):
-        _ = vbt.Portfolio.from_order_func(
+        portfolio = vbt.Portfolio.from_order_func(
             price_wide, order_func_nb, np.inf, row_wise=test_row_wise)
-        _ = vbt.Portfolio.from_order_func(
-            price_wide, order_func_nb, np.inf, row_wise=test_row_wise, max_orders=15)
-        with pytest.raises(Exception) as e_info:
-            _ = vbt.Portfolio.from_order_func(
-                price_wide, order_func_nb, np.inf, row_wise=test_row_wise, max_orders=14)
+        for max_orders in [0, 1, 14, 15, 100]:
+            record_arrays_close(
+                vbt.Portfolio.from_order_func(
+                    price_wide, order_func_nb, np.inf, row_wise=test_row_wise,
+                    max_orders=max_orders).order_records,
+                portfolio.order_records
+            )
 
     @pytest.mark.parametrize(
         "test_row_wise",
         [False, True],
     )
     def test_max_logs(self, test_row_wise):
-        _ = vbt.Portfolio.from_order_func(
+        portfolio = vbt.Portfolio.from_order_func(
             price_wide, log_order_func_nb, np.inf, row_wise=test_row_wise)
-        _ = vbt.Portfolio.from_order_func(
-            price_wide, log_order_func_nb, np.inf, row_wise=test_row_wise, max_logs=15)
+        for max_logs in [0, 1, 14, 15, 100]:
+            record_arrays_close(
+                vbt.Portfolio.from_order_func(
+                    price_wide, log_order_func_nb, np.inf, row_wise=test_row_wise,
+                    max_logs=max_logs).log_records,
+                portfolio.log_records
+            )
+
+    @pytest.mark.parametrize(
+        "test_row_wise",
+        [False, True],
+    )
+    def test_use_sim_cache(self, test_row_wise, tmp_path):
+        from vectorbt.portfolio import sim_cache
+
+        def make_order_func_nb(mult):
+            @njit
+            def _order_func_nb(oc, size):
+                return nb.create_order_nb(size=mult * size if oc.i % 2 == 0 else -size, price=oc.close[oc.i, oc.col])
+
+            return _order_func_nb
+
+        portfolio = vbt.Portfolio.from_order_func(
+            price_wide, log_order_func_nb, np.inf, row_wise=test_row_wise)
+        portfolio2 = vbt.Portfolio.from_order_func(
+            price_wide, log_order_func_nb, np.inf, row_wise=test_row_wise,
+            use_sim_cache=True, sim_cache_dir=tmp_path)
+        record_arrays_close(portfolio.order_records, portfolio2.order_records)
+        record_arrays_close(portfolio.log_records, portfolio2.log_records)
+        assert len(list(tmp_path.glob('vbt_sim_*.py'))) == 1
+        # same code gives same fingerprint, different closure gives different one
+        fingerprints = [
+            sim_cache.get_fingerprint(
+                test_row_wise, nb.empty_prep_nb, nb.empty_prep_nb, nb.empty_prep_nb, make_order_func_nb(m))
+            for m in [1., 1., 2.]
+        ]
+        assert fingerprints[0] == fingerprints[1]
+        assert fingerprints[0] != fingerprints[2]
+        record_arrays_close(
+            vbt.Portfolio.from_order_func(
+                price_wide, make_order_func_nb(2.), 1., row_wise=test_row_wise,
+                use_sim_cache=True, sim_cache_dir=tmp_path).order_records,
+            vbt.Portfolio.from_order_func(
+                price_wide, make_order_func_nb(2.), 1., row_wise=test_row_wise).order_records
+        )
+        assert len(list(tmp_path.glob('vbt_sim_*.py'))) == 2
+        # warmup compiles on the first rows only
+        portfolio3 = vbt.Portfolio.warmup_order_func(
+            price_wide, make_order_func_nb(3.), 1., row_wise=test_row_wise, sim_cache_dir=tmp_path)
+        assert portfolio3.wrapper.shape == (2, 3)
+        assert len(list(tmp_path.glob('vbt_sim_*.py'))) == 3
         with pytest.raises(Exception) as e_info:
             _ = vbt.Portfolio.from_order_func(
-                price_wide, log_order_func_nb, np.inf, row_wise=test_row_wise, max_logs=14)
+                price_wide, order_func_nb.py_func, np.inf, use_sim_cache=True, sim_cache_dir=tmp_path)
+        # modules that others could have written are never executed
+        sim_cache._sim_modules.clear()
+        for path in tmp_path.glob('vbt_sim_*.py'):
+            os.chmod(path, 0o666)
+        with pytest.raises(PermissionError) as e_info:
+            _ = vbt.Portfolio.from_order_func(
+                price_wide, log_order_func_nb, np.inf, row_wise=test_row_wise,
+                use_sim_cache=True, sim_cache_dir=tmp_path)
+        shared_dir = tmp_path / 'shared'
+        shared_dir.mkdir()
+        os.chmod(shared_dir, 0o777)
+        with pytest.raises(PermissionError) as e_info:
+            _ = vbt.Portfolio.from_order_func(
+                price_wide, log_order_func_nb, np.inf, row_wise=test_row_wise,
+                use_sim_cache=True, sim_cache_dir=shared_dir)
+
+    @pytest.mark.parametrize(
+        "test_row_wise",
+        [False, True],
+    )
+    def test_parallel(self, test_row_wise):
+        @njit
+        def segment_prep_func_nb(sc, size, size_type, direction, temp_float_arr):
+            for k in range(sc.group_len):
+                col = sc.from_col + k
+                size[k] = 1 / sc.group_len
+                size_type[k] = SizeType.TargetPercent
+                direction[k] = Direction.LongOnly
+                sc.last_val_price[col] = sc.close[sc.i, col]
+            nb.auto_call_seq_ctx_nb(sc, size, size_type, direction, temp_float_arr)
+            return size, size_type, direction
+
+        @njit
+        def prep_func_nb(simc):
+            size = np.empty(simc.target_shape[1], dtype=np.float_)
+            size_type = np.empty(simc.target_shape[1], dtype=np.int_)
+            direction = np.empty(simc.target_shape[1], dtype=np.int_)
+            temp_float_arr = np.empty(simc.target_shape[1], dtype=np.float_)
+            return size, size_type, direction, temp_float_arr
+
+        @njit
+        def group_prep_func_nb(gc, size, size_type, direction, temp_float_arr):
+            return (
+                size[gc.from_col:gc.to_col],
+                size_type[gc.from_col:gc.to_col],
+                direction[gc.from_col:gc.to_col],
+                temp_float_arr[gc.from_col:gc.to_col]
+            )
+
+        @njit
+        def row_prep_func_nb(rc, size, size_type, direction, temp_float_arr):
+            return size, size_type, direction, temp_float_arr
+
+        @njit
+        def row_segment_prep_func_nb(sc, size, size_type, direction, temp_float_arr):
+            return segment_prep_func_nb(
+                sc,
+                size[sc.from_col:sc.to_col],
+                size_type[sc.from_col:sc.to_col],
+                direction[sc.from_col:sc.to_col],
+                temp_float_arr[sc.from_col:sc.to_col]
+            )
+
+        @njit
+        def order_func_nb(oc, size, size_type, direction, fees):
+            col_i = oc.call_seq_now[oc.call_idx]
+            return nb.create_order_nb(
+                size=size[col_i],
+                size_type=size_type[col_i],
+                price=oc.close[oc.i, oc.col],
+                fees=fees,
+                direction=direction[col_i],
+                log=True
+            )
+
+        kwargs = dict(
+            active_mask=2,
+            prep_func_nb=prep_func_nb,
+            group_prep_func_nb=group_prep_func_nb,
+            row_prep_func_nb=row_prep_func_nb,
+            segment_prep_func_nb=row_segment_prep_func_nb if test_row_wise else segment_prep_func_nb,
+            row_wise=test_row_wise,
+            cash_sharing=True,
+            group_by=np.arange(50) // 10
+        )
+        portfolio = vbt.Portfolio.from_order_func(big_price_wide.iloc[:100, :50], order_func_nb, 0.01, **kwargs)
+        for n_chunks in [1, 2, 3, 10]:
+            par_portfolio = vbt.Portfolio.from_order_func(
+                big_price_wide.iloc[:100, :50], order_func_nb, 0.01, parallel=True, n_chunks=n_chunks, **kwargs)
+            record_arrays_close(par_portfolio.order_records, portfolio.order_records)
+            record_arrays_close(par_portfolio.log_records, portfolio.log_records)
+            np.testing.assert_array_equal(par_portfolio.call_seq.values, portfolio.call_seq.values)
+            pd.testing.assert_series_equal(par_portfolio.final_value(), portfolio.final_value())
+
+    @pytest.mark.parametrize(
+        "test_row_wise",
+        [False, True],
+    )
+    def test_parallel_seed(self, test_row_wise):
+        @njit
+        def order_func_nb(oc):
+            if np.random.uniform(0, 1) < 0.5:
+                return NoOrder
+            return nb.create_order_nb(size=1. if oc.i % 2 == 0 else -1., price=oc.close[oc.i, oc.col])
+
+        portfolio = vbt.Portfolio.from_order_func(
+            big_price_wide.iloc[:100, :50], order_func_nb, row_wise=test_row_wise,
+            seed=42, parallel=True, n_chunks=5)
+        for _ in range(3):
+            par_portfolio = vbt.Portfolio.from_order_func(
+                big_price_wide.iloc[:100, :50], order_func_nb, row_wise=test_row_wise,
+                seed=42, parallel=True, n_chunks=5)
+            record_arrays_close(par_portfolio.order_records, portfolio.order_records)
+
+    @pytest.mark.parametrize(
+        "test_row_wise",
+        [False, True],
+    )
+    def test_from_order_func_sweep(self, test_row_wise):
+        grid = [1., 2., np.inf]
+        for group_by, cash_sharing in [(None, False), (None, True), (np.array([0, 0, 1]), True)]:
+            portfolio = vbt.Portfolio.from_order_func_sweep(
+                price_wide, log_order_func_nb, grid, group_by=group_by, cash_sharing=cash_sharing,
+                row_wise=test_row_wise, n_workers=2, n_shards=3)
+            pd.testing.assert_index_equal(
+                portfolio.wrapper.columns,
+                pd.MultiIndex.from_tuples([
+                    (0, 'a'), (0, 'b'), (0, 'c'),
+                    (1, 'a'), (1, 'b'), (1, 'c'),
+                    (2, 'a'), (2, 'b'), (2, 'c')
+                ], names=['param_idx', None])
+            )
+            for k, size in enumerate(grid):
+                portfolio2 = vbt.Portfolio.from_order_func(
+                    price_wide, log_order_func_nb, size, group_by=True if group_by is None else group_by,
+                    cash_sharing=cash_sharing, row_wise=test_row_wise)
+                np.testing.assert_array_equal(portfolio[k].shares().values, portfolio2.shares().values)
+                np.testing.assert_array_equal(portfolio[k].value().values, portfolio2.value().values)
+                np.testing.assert_array_equal(portfolio[k].call_seq.values, portfolio2.call_seq.values)
+        assert len(portfolio.wrapper.grouper.get_group_lens()) == 6
+        np.testing.assert_array_equal(portfolio.log_records['id'], np.arange(len(portfolio.log_records)))
+        np.testing.assert_array_equal(
+            portfolio.order_records['id'],
+            portfolio.log_records['order_id'][portfolio.log_records['order_id'] != -1]
+        )
+        with pytest.raises(Exception) as e_info:
+            _ = vbt.Portfolio.from_order_func_sweep(price_wide, log_order_func_nb, [])
+
+    def test_from_order_func_sweep_after_parallel(self, tmp_path):
+        # forking after Numba has started its threading layer hangs, thus run in a separate process
+        script = tmp_path / 'sweep.py'
+        script.write_text(textwrap.dedent("""
+            import numpy as np
+            from numba import njit
+            import vectorbt as vbt
+            from vectorbt.portfolio.nb import create_order_nb
+
+            @njit
+            def order_func_nb(oc, size):
+                return create_order_nb(size=size, price=oc.close[oc.i, oc.col])
+
+            if __name__ == '__main__':
+                vbt.generic.nb.rolling_mean_parallel_nb(np.ones((10, 4)), 2)
+                portfolio = vbt.Portfolio.from_order_func_sweep(
+                    np.array([1., 2., 3.]), order_func_nb, [1., 2.], n_workers=2)
+                print(portfolio.shares().values[-1].tolist())
+        """))
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run(
+            [sys.executable, str(script)], env=env, capture_output=True, text=True, timeout=600)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == '[3.0, 6.0]'
 
 
 # ############# Portfolio ############# #
@@ -2828,6 +3379,27 @@ class TestPortfolio:
         portfolio.save(tmp_path / 'portfolio')
         assert vbt.Portfolio.load(tmp_path / 'portfolio') == portfolio
 
+    @pytest.mark.parametrize(
+        "test_mmap",
+        [False, True],
+    )
+    def test_save_store(self, tmp_path, test_mmap):
+        portfolio.save(tmp_path / 'portfolio', format='npy')
+        loaded = vbt.Portfolio.load(tmp_path / 'portfolio', mmap=test_mmap)
+        assert loaded == portfolio
+        loaded.save(tmp_path / 'portfolio.pkl')
+        assert vbt.Portfolio.load(tmp_path / 'portfolio.pkl') == portfolio
+        assert loaded.orders.is_columnar
+        record_arrays_close(loaded.order_records, portfolio.order_records)
+        record_arrays_close(loaded.log_records, portfolio.log_records)
+        assert loaded.wrapper == portfolio.wrapper
+        pd.testing.assert_frame_equal(loaded.close, portfolio.close)
+        pd.testing.assert_frame_equal(loaded.call_seq, portfolio.call_seq)
+        pd.testing.assert_series_equal(loaded.total_profit(), portfolio.total_profit())
+        pd.testing.assert_frame_equal(loaded.trades.records, portfolio.trades.records)
+        pd.testing.assert_series_equal(loaded['b'].value(), portfolio['b'].value())
+        record_arrays_close(loaded['b'].order_records, portfolio['b'].order_records)
+
     def test_wrapper(self):
         pd.testing.assert_index_equal(
             portfolio.wrapper.index,
@@ -3296,6 +3868,61 @@ class TestPortfolio:
             price_na.ffill().bfill()
         )
 
+    def test_float_dtype(self):
+        portfolio32 = vbt.Portfolio.from_orders(
+            price_na, order_size_new, size_type='shares', direction=directions,
+            fees=0.01, fixed_fees=0.1, slippage=0.01, log=True,
+            call_seq='reversed', group_by=group_by, cash_sharing=True,
+            init_cash=[200., 100.], freq='1D', float_dtype='float32'
+        )
+        assert portfolio_shared.float_dtype == np.float64
+        assert portfolio32.float_dtype == np.float32
+        assert portfolio32.order_records.dtype == order_dt
+        assert portfolio32.log_records.dtype == log_dt
+        for name in ['close', 'fill_close', 'share_flow', 'shares', 'cash_flow', 'cash',
+                     'holding_value', 'value', 'returns', 'market_value', 'gross_exposure']:
+            obj32 = getattr(portfolio32, name)
+            obj32 = obj32 if isinstance(obj32, pd.DataFrame) else obj32()
+            obj64 = getattr(portfolio_shared, name)
+            obj64 = obj64 if isinstance(obj64, pd.DataFrame) else obj64()
+            assert (obj32.dtypes == np.float32).all()
+            np.testing.assert_allclose(obj32.values, obj64.values, rtol=1e-5, atol=1e-5)
+        assert (portfolio32.cash(in_sim_order=True).dtypes == np.float32).all()
+        assert (portfolio32.cash_flow(group_by=False, short_cash=False).dtypes == np.float32).all()
+        assert (portfolio32.share_flow(direction='longonly').dtypes == np.float32).all()
+        assert portfolio32['first'].float_dtype == np.float32
+        assert portfolio32['first'].value().dtype == np.float32
+        record_arrays_close(
+            vbt.Portfolio.from_signals(price_wide, True, False, float_dtype='float32').order_records,
+            vbt.Portfolio.from_signals(price_wide, True, False).order_records
+        )
+        assert vbt.Portfolio.from_order_func(
+            price_wide, order_func_nb, np.inf, float_dtype='float32').value().dtypes.unique() == [np.float32]
+
+    def test_state(self):
+        for _portfolio in [portfolio, portfolio_grouped, portfolio_shared]:
+            col_map = _portfolio.orders.col_mapper.col_map
+            share_flow = vbt.portfolio.nb.share_flow_nb(
+                _portfolio.wrapper.shape_2d, _portfolio.order_records, col_map, 2)
+            np.testing.assert_array_equal(_portfolio.state.share_flow, share_flow)
+            np.testing.assert_array_equal(_portfolio.state.shares, vbt.portfolio.nb.shares_nb(share_flow))
+            np.testing.assert_array_equal(
+                _portfolio.state.cash_flow,
+                vbt.portfolio.nb.cash_flow_nb(_portfolio.wrapper.shape_2d, _portfolio.order_records, col_map, True)
+            )
+        filled_portfolio = vbt.Portfolio.from_orders(
+            price_na, order_size_new, size_type='shares', direction=directions,
+            fees=0.01, fixed_fees=0.1, slippage=0.01, log=True,
+            call_seq='reversed', group_by=group_by, cash_sharing=True,
+            init_cash=[200., 100.], freq='1D', fill_state=True
+        )
+        assert filled_portfolio.state is filled_portfolio.config['state']
+        filled_portfolio2 = vbt.Portfolio.from_orders(price_na, order_size_new, fill_state=True)
+        assert filled_portfolio2.regroup(group_by).state is filled_portfolio2.state
+        np.testing.assert_array_equal(filled_portfolio['first'].state.shares, portfolio_shared.state.shares[:, :2])
+        pd.testing.assert_frame_equal(filled_portfolio.value(), portfolio_shared.value())
+        pd.testing.assert_series_equal(filled_portfolio['second'].returns(), portfolio_shared['second'].returns())
+
     def test_share_flow(self):
         pd.testing.assert_frame_equal(
             portfolio.share_flow(direction='longonly'),
@@ -4625,6 +5252,37 @@ class TestPortfolio:
             portfolio_grouped.stats(column='second')
         )
 
+    def test_fused_stats(self):
+        for _portfolio, _group_by in [
+            (portfolio, None),
+            (portfolio, group_by),
+            (portfolio_grouped, None),
+            (portfolio_shared, None)
+        ]:
+            for incl_unrealized in [False, True]:
+                stats_df = _portfolio.stats(agg_func=None, group_by=_group_by, incl_unrealized=incl_unrealized)
+                fused_stats_df = _portfolio.fused_stats(group_by=_group_by, incl_unrealized=incl_unrealized)
+                pd.testing.assert_index_equal(fused_stats_df.index, stats_df.index)
+                np.testing.assert_allclose(fused_stats_df['total_return'] * 100, stats_df['Total Return [%]'])
+                np.testing.assert_allclose(-fused_stats_df['max_drawdown'] * 100, stats_df['Max. Drawdown [%]'])
+                np.testing.assert_allclose(fused_stats_df['sharpe_ratio'], stats_df['Sharpe Ratio'])
+                np.testing.assert_allclose(fused_stats_df['sortino_ratio'], stats_df['Sortino Ratio'])
+                np.testing.assert_allclose(fused_stats_df['calmar_ratio'], stats_df['Calmar Ratio'])
+                np.testing.assert_array_equal(
+                    fused_stats_df['closed_trades' if not incl_unrealized else 'total_trades'],
+                    stats_df['Num. Trades']
+                )
+                np.testing.assert_allclose(fused_stats_df['win_rate'] * 100, stats_df['Win Rate [%]'])
+                np.testing.assert_allclose(fused_stats_df['expectancy'], stats_df['Expectancy'])
+                trades = _portfolio.get_trades(group_by=_group_by)
+                if not incl_unrealized:
+                    trades = trades.closed
+                np.testing.assert_allclose(fused_stats_df['profit_factor'], trades.profit_factor())
+        stats_arr = portfolio.fused_stats(raw=True)
+        assert stats_arr.dtype == vbt.portfolio.enums.stats_dt
+        np.testing.assert_array_equal(stats_arr['total_trades'], np.array([2, 2, 2]))
+        np.testing.assert_array_equal(stats_arr['open_trades'], np.array([1, 1, 0]))
+
     def test_returns_stats(self):
         pd.testing.assert_series_equal(
             portfolio.returns_stats(),
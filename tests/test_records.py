@@ -7,6 +7,8 @@ import pytest
 
 from vectorbt.generic.enums import drawdown_dt
 from vectorbt.portfolio.enums import order_dt, trade_dt, position_dt, log_dt
+from vectorbt.records.col_mapper import ColumnMapper
+from vectorbt.records.columnar import ColumnarArray
 
 from tests.utils import record_arrays_close
 
@@ -158,6 +160,44 @@ class TestColumnMapper:
         assert records.col_mapper.is_sorted()
         assert not records_nosort.col_mapper.is_sorted()
 
+    def test_shared(self):
+        assert records.map_field('some_field1').col_mapper is records.col_mapper
+        assert records.copy().col_mapper is records.col_mapper
+        assert records_nosort.col_mapper is not records.col_mapper
+        regrouped = records.regroup(group_by)
+        assert regrouped.col_mapper is not records.col_mapper
+        assert regrouped.col_mapper.col_map is records.col_mapper.col_map
+        np.testing.assert_array_equal(
+            regrouped.col_mapper.get_col_map()[1],
+            records_grouped.col_mapper.get_col_map()[1]
+        )
+
+    @pytest.mark.parametrize(
+        "test_records",
+        [records, records_nosort],
+    )
+    def test_filter_by_mask(self, test_records):
+        mask = test_records.values['some_field1'] > 11
+        col_mapper = test_records.col_mapper.filter_by_mask(mask)
+        expected = ColumnMapper(wrapper, test_records.col_mapper.col_arr[mask])
+        np.testing.assert_array_equal(col_mapper.col_map[0], expected.col_map[0])
+        np.testing.assert_array_equal(col_mapper.col_map[1], expected.col_map[1])
+        assert col_mapper.is_sorted() == expected.is_sorted()
+        if expected.is_sorted():
+            np.testing.assert_array_equal(col_mapper.col_range, expected.col_range)
+        filtered = test_records.filter_by_mask(mask)
+        np.testing.assert_array_equal(filtered.col_mapper.col_arr, expected.col_arr)
+        np.testing.assert_array_equal(filtered.count().values, np.array([1, 3, 1, 0]))
+
+    def test_col_idxs(self):
+        for test_records in [records, records_nosort]:
+            selected = test_records[['c', 'a']]
+            expected = ColumnMapper(selected.wrapper, selected.values['col'])
+            np.testing.assert_array_equal(selected.col_mapper.col_range, expected.col_range)
+            np.testing.assert_array_equal(selected.col_mapper.col_map[0], expected.col_map[0])
+            np.testing.assert_array_equal(selected.col_mapper.col_map[1], expected.col_map[1])
+            assert selected.col_mapper.is_sorted()
+
 
 # ############# mapped_array.py ############# #
 
@@ -246,6 +286,16 @@ class TestMappedArray:
         np.testing.assert_array_equal(filtered.idx_arr, mapped_array.idx_arr[mask])
         assert mapped_array_grouped.filter_by_mask(mask).wrapper == mapped_array_grouped.wrapper
         assert mapped_array_grouped.filter_by_mask(mask, group_by=False).wrapper.grouper.group_by is None
+        # indices that reorder elements don't keep the column array sorted
+        assert mapped_array.col_mapper.is_sorted()
+        filtered = mapped_array.filter_by_mask(np.array([3, 0, 1]))
+        np.testing.assert_array_equal(filtered.col_arr, np.array([1, 0, 0]))
+        assert not filtered.col_mapper.is_sorted()
+        np.testing.assert_array_equal(filtered.iloc[0].values, np.array([10., 11.]))
+        np.testing.assert_array_equal(filtered.iloc[1].values, np.array([13.]))
+        filtered = mapped_array.filter_by_mask(np.array([0, 1, 3]))
+        assert filtered.col_mapper._is_sorted
+        np.testing.assert_array_equal(filtered.iloc[1].values, np.array([13.]))
 
     def test_map_to_mask(self):
         @njit
@@ -262,24 +312,57 @@ class TestMappedArray:
             mapped_array.top_n_mask(1),
             np.array([False, False,  True, False, True, False, True, False, False])
         )
+        np.testing.assert_array_equal(
+            mapped_array.top_n_mask(1, algorithm='heap'),
+            mapped_array.top_n_mask(1)
+        )
+        np.testing.assert_array_equal(
+            mapped_array.top_n_mask(2, algorithm='heap'),
+            np.array([False, True, True, True, True, False, True, True, False])
+        )
+        big_mapped_array = vbt.MappedArray(
+            wrapper, np.random.uniform(size=1000), np.random.randint(0, 4, size=1000))
+        for n in [1, 10, 1000]:
+            np.testing.assert_array_equal(
+                big_mapped_array.top_n_mask(n, algorithm='heap'),
+                big_mapped_array.top_n_mask(n)
+            )
+            np.testing.assert_array_equal(
+                big_mapped_array.bottom_n_mask(n, algorithm='heap'),
+                big_mapped_array.bottom_n_mask(n)
+            )
+        with pytest.raises(Exception) as e_info:
+            _ = mapped_array.top_n_mask(1, algorithm='quickselect')
 
     def test_bottom_n_mask(self):
         np.testing.assert_array_equal(
             mapped_array.bottom_n_mask(1),
             np.array([True, False, False, True, False, False, False, False, True])
         )
+        np.testing.assert_array_equal(
+            mapped_array.bottom_n_mask(1, algorithm='heap'),
+            mapped_array.bottom_n_mask(1)
+        )
 
     def test_top_n(self):
         np.testing.assert_array_equal(
             mapped_array.top_n(1).id_arr,
             np.array([2, 4, 6])
         )
+        np.testing.assert_array_equal(
+            mapped_array.top_n(1, algorithm='heap').id_arr,
+            np.array([2, 4, 6])
+        )
 
     def test_bottom_n(self):
         np.testing.assert_array_equal(
             mapped_array.bottom_n(1).id_arr,
             np.array([0, 3, 8])
         )
+        np.testing.assert_array_equal(
+            mapped_array.bottom_n(1, algorithm='heap').id_arr,
+            np.array([0, 3, 8])
+        )
 
     def test_to_matrix(self):
         target = pd.DataFrame(
@@ -311,6 +394,32 @@ class TestMappedArray:
         )
         with pytest.raises(Exception) as e_info:
             _ = mapped_array2.to_matrix()
+        with pytest.raises(Exception) as e_info:
+            _ = mapped_array2.to_matrix(sparse=True)
+        mat = mapped_array.to_matrix(sparse=True)
+        assert mat.shape == target.shape
+        assert mat.nnz == len(mapped_array.values)
+        np.testing.assert_array_equal(mat.toarray(), target.fillna(0.).values)
+        mat = mapped_array_grouped.to_matrix(sparse=True, group_by=False)
+        np.testing.assert_array_equal(mat.toarray(), target.fillna(0.).values)
+
+    def test_from_sparse(self):
+        mat = mapped_array.to_matrix(sparse=True)
+        sparse_mapped_array = vbt.MappedArray.from_sparse(wrapper, mat)
+        pd.testing.assert_frame_equal(sparse_mapped_array.to_matrix(), mapped_array.to_matrix())
+        pd.testing.assert_series_equal(sparse_mapped_array.mean(), mapped_array.mean())
+        pd.testing.assert_frame_equal(sparse_mapped_array.describe(), mapped_array.describe())
+        assert sparse_mapped_array.col_mapper._col_range is not None
+        pd.testing.assert_series_equal(
+            vbt.MappedArray.from_sparse(wrapper_grouped, mat).mean(),
+            mapped_array_grouped.mean()
+        )
+        pd.testing.assert_series_equal(
+            vbt.MappedArray.from_sparse(wrapper, mat.tocoo()).mean(),
+            mapped_array.mean()
+        )
+        with pytest.raises(Exception) as e_info:
+            _ = vbt.MappedArray.from_sparse(wrapper, mat[:, :2])
 
     def test_reduce(self):
         @njit
@@ -664,6 +773,45 @@ class TestMappedArray:
                 index=mapped_array.describe().index
             )
         )
+        pd.testing.assert_frame_equal(
+            mapped_array.describe(approx=True),
+            mapped_array.describe()
+        )
+        big_mapped_array = vbt.MappedArray(
+            wrapper, np.random.normal(size=100000), np.random.randint(0, 4, size=100000))
+        pd.testing.assert_frame_equal(
+            big_mapped_array.describe(percentiles=[0, 0.1, 0.9, 1], approx=True),
+            big_mapped_array.describe(percentiles=[0, 0.1, 0.9, 1]),
+            atol=0.01
+        )
+
+    def test_parallel(self):
+        @njit
+        def min_max_reduce_nb(col, a):
+            return np.array([np.min(a), np.max(a)])
+
+        @njit
+        def idxmin_idxmax_reduce_nb(col, a):
+            return np.array([np.argmin(a), np.argmax(a)])
+
+        for ma in [mapped_array, mapped_array_grouped, mapped_array_nosort]:
+            pd.testing.assert_series_equal(ma.mean(parallel=True), ma.mean())
+            pd.testing.assert_series_equal(ma.idxmax(parallel=True), ma.idxmax())
+            pd.testing.assert_frame_equal(ma.describe(parallel=True), ma.describe())
+            pd.testing.assert_frame_equal(
+                ma.reduce(min_max_reduce_nb, to_array=True, parallel=True),
+                ma.reduce(min_max_reduce_nb, to_array=True)
+            )
+            pd.testing.assert_frame_equal(
+                ma.reduce(idxmin_idxmax_reduce_nb, to_array=True, to_idx=True, parallel=True),
+                ma.reduce(idxmin_idxmax_reduce_nb, to_array=True, to_idx=True)
+            )
+            pd.testing.assert_frame_equal(ma.value_counts(parallel=True), ma.value_counts())
+        vbt.settings.mapped_array['parallel'] = True
+        try:
+            pd.testing.assert_series_equal(mapped_array.std(), mapped_array.std(parallel=False))
+        finally:
+            vbt.settings.mapped_array['parallel'] = False
 
     def test_value_counts(self):
         pd.testing.assert_series_equal(
@@ -753,6 +901,14 @@ class TestMappedArray:
                 columns=pd.Index(['g1', 'g2'], dtype='object')
             )
         )
+        np.testing.assert_array_equal(
+            mapped_array.stack(sparse=True).toarray(),
+            mapped_array.stack(default_val=0.).values
+        )
+        np.testing.assert_array_equal(
+            mapped_array_grouped.stack(sparse=True).toarray(),
+            mapped_array_grouped.stack(default_val=0.).values
+        )
 
     def test_indexing(self):
         np.testing.assert_array_equal(
@@ -920,6 +1076,26 @@ class TestRecords:
         records.save(tmp_path / 'records')
         assert vbt.Records.load(tmp_path / 'records') == records
 
+    @pytest.mark.parametrize(
+        "test_records",
+        [records, records_nosort, records_grouped],
+    )
+    def test_save_store(self, tmp_path, test_records):
+        test_records.save(tmp_path / 'records', format='npy')
+        loaded = vbt.Records.load(tmp_path / 'records', mmap=True)
+        assert loaded == test_records
+        assert loaded.is_columnar
+        assert loaded.wrapper == test_records.wrapper
+        record_arrays_close(loaded.values, test_records.values)
+        assert loaded.col_mapper.is_sorted() == test_records.col_mapper.is_sorted()
+        if test_records.col_mapper.is_sorted():
+            np.testing.assert_array_equal(loaded.col_mapper.col_range, test_records.col_mapper.col_range)
+        np.testing.assert_array_equal(loaded.col_mapper.col_map[0], test_records.col_mapper.col_map[0])
+        np.testing.assert_array_equal(loaded.col_mapper.col_map[1], test_records.col_mapper.col_map[1])
+        for col in test_records.wrapper.get_columns():
+            record_arrays_close(loaded[col].values, test_records[col].values)
+        pd.testing.assert_series_equal(loaded.count(), test_records.count())
+
     def test_records(self):
         pd.testing.assert_frame_equal(
             records.records,
@@ -944,6 +1120,44 @@ class TestRecords:
         assert not records_nosort.sort().is_sorted(incl_id=True)
         assert records_nosort.sort(incl_id=True).is_sorted(incl_id=True)
 
+    def test_columnar(self, tmp_path):
+        columnar_records = records.to_columnar()
+        assert columnar_records.is_columnar
+        assert not records.is_columnar
+        assert isinstance(columnar_records.config['records_arr'], ColumnarArray)
+        record_arrays_close(columnar_records.values, records.values)
+        assert columnar_records.values is columnar_records.values
+        pd.testing.assert_frame_equal(columnar_records.records, records.records)
+        assert len(columnar_records) == len(records)
+        assert columnar_records.get_field_arr('some_field1').flags['C_CONTIGUOUS']
+        assert columnar_records.map_field('some_field1').values is columnar_records.get_field_arr('some_field1')
+        @njit
+        def map_func_nb(record):
+            return record['some_field1'] + record['some_field2']
+
+        np.testing.assert_array_equal(
+            columnar_records.map(map_func_nb).values,
+            records.map(map_func_nb).values
+        )
+        mask = records.values['some_field1'] >= records.values['some_field1'].mean()
+        filtered = columnar_records.filter_by_mask(mask)
+        assert filtered.is_columnar
+        record_arrays_close(filtered.values, records.filter_by_mask(mask).values)
+        for test_records, expected_records in [
+            (columnar_records, records),
+            (records_nosort.to_columnar(), records_nosort),
+            (records_grouped.to_columnar(), records_grouped)
+        ]:
+            for col in test_records.wrapper.get_columns():
+                assert test_records[col].is_columnar
+                record_arrays_close(test_records[col].values, expected_records[col].values)
+        record_arrays_close(records_nosort.to_columnar().sort().values, records_nosort.sort().values)
+        pd.testing.assert_series_equal(columnar_records.count(), records.count())
+        record_arrays_close(columnar_records.to_structured().config['records_arr'], records.values)
+        assert vbt.Records.loads(columnar_records.dumps()) == columnar_records
+        columnar_records.save(tmp_path / 'records')
+        assert vbt.Records.load(tmp_path / 'records') == columnar_records
+
     def test_filter_by_mask(self):
         mask_a = records['a'].values['some_field1'] >= records['a'].values['some_field1'].mean()
         record_arrays_close(
@@ -1776,6 +1990,14 @@ class TestTrades:
             vbt.Trades.from_orders(reversed_col_orders).values,
             trades.values
         )
+        record_arrays_close(
+            vbt.Trades.from_orders(orders, parallel=True).values,
+            trades.values
+        )
+        record_arrays_close(
+            vbt.Trades.from_orders(reversed_col_orders, parallel=True).values,
+            trades.values
+        )
 
     def test_records_readable(self):
         pd.testing.assert_frame_equal(
@@ -2223,6 +2445,14 @@ class TestPositions:
             vbt.Positions.from_trades(reversed_col_trades).values,
             positions.values
         )
+        record_arrays_close(
+            vbt.Positions.from_trades(trades, parallel=True).values,
+            positions.values
+        )
+        record_arrays_close(
+            vbt.Positions.from_trades(reversed_col_trades, parallel=True).values,
+            positions.values
+        )
 
     def test_records_readable(self):
         pd.testing.assert_frame_equal(
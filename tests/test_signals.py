@@ -1481,6 +1481,21 @@ class TestAccessors:
             )
         )
 
+    def test_sparse(self):
+        sparse = sig.vbt.signals.to_sparse()
+        assert sparse.shape == (5, 3)
+        np.testing.assert_array_equal(sparse.idxs, np.array([0, 3, 1, 4, 2]))
+        np.testing.assert_array_equal(sparse.col_lens, np.array([2, 2, 1]))
+        pd.testing.assert_frame_equal(
+            pd.DataFrame.vbt.signals.from_sparse(sparse, index=sig.index, columns=sig.columns),
+            sig
+        )
+        pd.testing.assert_series_equal(
+            pd.Series.vbt.signals.from_sparse(
+                sig['a'].vbt.signals.to_sparse(), index=sig.index, name='a'),
+            sig['a']
+        )
+
     @pytest.mark.parametrize(
         "test_func,test_func_pd",
         [
@@ -10,7 +10,9 @@ import pytz
 import dateparser
 
 from vectorbt import settings
-from vectorbt.utils import checks, config, decorators, math, array, random, enum, params, attr, datetime, schedule
+from vectorbt.utils import (
+    checks, config, decorators, math, array, random, enum, params, attr, datetime, schedule, shm, store
+)
 from datetime import datetime as _datetime, timedelta as _timedelta, time as _time, timezone as _timezone
 
 from tests.utils import hash
@@ -1730,3 +1732,99 @@ class TestScheduleManager:
         loop = asyncio.get_event_loop()
         loop.run_until_complete(manager.async_start())
         assert kwargs['call_count'] == 5
+
+
+# ############# shm.py ############# #
+
+class TestShm:
+    @pytest.mark.parametrize(
+        "test_transport",
+        ['shm', 'mmap'],
+    )
+    def test_shared_arrays(self, test_transport):
+        ref_type = shm.SharedArray if test_transport == 'shm' else shm.MmapArray
+        Tup = namedtuple('Tup', ['a', 'b'])
+        obj = (np.arange(3), [np.ones((2, 2))], {'c': Tup(np.array([True]), 1.)}, 'd')
+        with shm.shared_arrays(obj, transport=test_transport, min_nbytes=0) as shared:
+            assert isinstance(shared[0], ref_type)
+            assert isinstance(shared[1][0], ref_type)
+            assert isinstance(shared[2]['c'], Tup)
+            assert isinstance(shared[2]['c'].a, ref_type)
+            assert shared[2]['c'].b == 1.
+            assert shared[3] == 'd'
+            attached = shm.attach_arrays(shared)
+            np.testing.assert_array_equal(attached[0], obj[0])
+            np.testing.assert_array_equal(attached[1][0], obj[1][0])
+            np.testing.assert_array_equal(attached[2]['c'].a, obj[2]['c'].a)
+            assert not np.shares_memory(attached[0], obj[0])
+            attached2 = shm.attach_arrays(shared)
+            if test_transport == 'shm':
+                assert np.shares_memory(attached[0], attached2[0])
+            assert not attached[0].flags.writeable
+            attached3 = shm.attach_arrays(shared, readonly=False)
+            assert attached3[0].flags.writeable
+            del attached, attached2, attached3
+            shm.detach_arrays()
+            assert len(shm._attached) == 0
+        with shm.shared_arrays(obj, transport=test_transport, min_nbytes=10) as shared:
+            assert isinstance(shared[0], ref_type)
+            assert isinstance(shared[2]['c'].a, np.ndarray)
+        with pytest.raises(Exception) as e_info:
+            with shm.shared_arrays(obj, transport='pickle') as shared:
+                pass
+
+
+# ############# store.py ############# #
+
+class TestStore:
+    @pytest.mark.parametrize(
+        "test_mmap",
+        [False, True],
+    )
+    def test_save_load_store(self, tmp_path, test_mmap):
+        from vectorbt.records.columnar import ColumnarArray
+
+        Tup = namedtuple('Tup', ['a', 'b'])
+        records_arr = np.array([(0, 0, 1.), (1, 1, 2.)], dtype=[('id', np.int_), ('col', np.int_), ('x', np.float_)])
+        df = pd.DataFrame(np.arange(6.).reshape((3, 2)), index=['x', 'y', 'z'], columns=pd.Index(['a', 'b'], name='c'))
+        cfg = config.Config(dict(a=1))
+        obj = dict(
+            records_arr=records_arr,
+            df=df,
+            sr=df['a'],
+            tup=Tup(np.arange(3), [np.array([True, False]), 'b']),
+            cfg=cfg,
+            s='s'
+        )
+        store.save_store(obj, tmp_path / 'store')
+        assert store.is_store(tmp_path / 'store')
+        assert not store.is_store(tmp_path)
+        loaded = store.load_store(tmp_path / 'store', mmap=test_mmap)
+        assert isinstance(loaded['records_arr'], ColumnarArray)
+        np.testing.assert_array_equal(loaded['records_arr'].to_structured(), records_arr)
+        pd.testing.assert_frame_equal(loaded['df'], df)
+        assert loaded['df'].values.flags['F_CONTIGUOUS']
+        pd.testing.assert_series_equal(loaded['sr'], df['a'])
+        assert loaded['tup']._fields == Tup._fields
+        np.testing.assert_array_equal(loaded['tup'].a, obj['tup'].a)
+        np.testing.assert_array_equal(loaded['tup'].b[0], obj['tup'].b[0])
+        assert loaded['tup'].b[1] == 'b'
+        assert loaded['cfg'] == cfg
+        assert loaded['s'] == 's'
+        if test_mmap:
+            assert type(loaded['records_arr']['x']) is np.ndarray
+            assert isinstance(loaded['records_arr']['x'].base, np.memmap)
+            assert type(loaded['df'].values) is np.ndarray
+        assert checks.is_deep_equal(loaded['records_arr'], records_arr)
+        np.testing.assert_array_equal(loaded['records_arr'].col_lens, np.array([1, 1]))
+        assert loaded['records_arr'].col_idxs is None
+        store.save_store(dict(records_arr=records_arr[::-1]), tmp_path / 'store_nosort')
+        loaded_nosort = store.load_store(tmp_path / 'store_nosort', mmap=test_mmap)
+        np.testing.assert_array_equal(loaded_nosort['records_arr'].col_lens, np.array([1, 1]))
+        np.testing.assert_array_equal(loaded_nosort['records_arr'].col_idxs, np.array([1, 0]))
+        with pytest.raises(Exception) as e_info:
+            store.save_store(obj, tmp_path / 'store')
+        store.save_store(dict(a=np.arange(2)), tmp_path / 'store', overwrite=True)
+        np.testing.assert_array_equal(store.load_store(tmp_path / 'store')['a'], np.arange(2))
+        with pytest.raises(Exception) as e_info:
+            store.save_store(obj, tmp_path / 'store2', format='csv')
@@ -418,7 +418,7 @@ class BaseAccessor:
         return out
 
     def apply_and_concat(self, ntimes, *args, apply_func=None, keep_pd=False, to_2d=False,
-                         numba_loop=False, use_ray=False, keys=None, wrap_kwargs=None, **kwargs):
+                         numba_loop=False, use_ray=False, use_pool=False, keys=None, wrap_kwargs=None, **kwargs):
         """Apply `apply_func` `ntimes` times and concatenate the results along columns.
         See `vectorbt.base.combine_fns.apply_and_concat_one`.
 
@@ -438,6 +438,10 @@ class BaseAccessor:
 
                 Only works with `numba_loop` set to False and `concat` is set to True.
                 See `vectorbt.base.combine_fns.ray_apply` for related keyword arguments.
+            use_pool (bool): Whether to use a local process pool to execute `combine_func` in parallel.
+
+                Only works with `numba_loop` set to False and `concat` is set to True.
+                See `vectorbt.base.combine_fns.pool_apply` for related keyword arguments.
             keys (list of str or pd.Index): Outermost column level.
             wrap_kwargs (dict): Keyword arguments passed to `vectorbt.base.array_wrapper.ArrayWrapper.wrap`.
             **kwargs: Keyword arguments passed to `combine_func`.
@@ -488,10 +492,14 @@ class BaseAccessor:
         if checks.is_numba_func(apply_func) and numba_loop:
             if use_ray:
                 raise ValueError("Ray cannot be used within Numba")
+            if use_pool:
+                raise ValueError("Process pool cannot be used within Numba")
             result = combine_fns.apply_and_concat_one_nb(ntimes, apply_func, obj, *args, **kwargs)
         else:
             if use_ray:
                 result = combine_fns.apply_and_concat_one_ray(ntimes, apply_func, obj, *args, **kwargs)
+            elif use_pool:
+                result = combine_fns.apply_and_concat_one_pool(ntimes, apply_func, obj, *args, **kwargs)
             else:
                 result = combine_fns.apply_and_concat_one(ntimes, apply_func, obj, *args, **kwargs)
         # Build column hierarchy
@@ -503,7 +511,7 @@ class BaseAccessor:
         return self.wrapper.wrap(result, group_by=False, **merge_dicts(dict(columns=new_columns), wrap_kwargs))
 
     def combine(self, other, *args, allow_multiple=True, combine_func=None, keep_pd=False, to_2d=False,
-                concat=False, numba_loop=False, use_ray=False, broadcast=True, broadcast_kwargs=None,
+                concat=False, numba_loop=False, use_ray=False, use_pool=False, broadcast=True, broadcast_kwargs=None,
                 keys=None, wrap_kwargs=None, **kwargs):
         """Combine with `other` using `combine_func`.
 
@@ -529,6 +537,10 @@ class BaseAccessor:
 
                 Only works with `numba_loop` set to False and `concat` is set to True.
                 See `vectorbt.base.combine_fns.ray_apply` for related keyword arguments.
+            use_pool (bool): Whether to use a local process pool to execute `combine_func` in parallel.
+
+                Only works with `numba_loop` set to False and `concat` is set to True.
+                See `vectorbt.base.combine_fns.pool_apply` for related keyword arguments.
             broadcast (bool): Whether to broadcast all inputs.
             broadcast_kwargs (dict): Keyword arguments passed to `vectorbt.base.reshape_fns.broadcast`.
             keys (list of str or pd.Index): Outermost column level.
@@ -618,6 +630,8 @@ class BaseAccessor:
             if checks.is_numba_func(combine_func) and numba_loop:
                 if use_ray:
                     raise ValueError("Ray cannot be used within Numba")
+                if use_pool:
+                    raise ValueError("Process pool cannot be used within Numba")
                 for i in range(1, len(inputs)):
                     checks.assert_meta_equal(inputs[i - 1], inputs[i])
                 result = combine_fns.combine_and_concat_nb(
@@ -626,6 +640,9 @@ class BaseAccessor:
                 if use_ray:
                     result = combine_fns.combine_and_concat_ray(
                         inputs[0], inputs[1:], combine_func, *args, **kwargs)
+                elif use_pool:
+                    result = combine_fns.combine_and_concat_pool(
+                        inputs[0], inputs[1:], combine_func, *args, **kwargs)
                 else:
                     result = combine_fns.combine_and_concat(
                         inputs[0], inputs[1:], combine_func, *args, **kwargs)
@@ -640,6 +657,8 @@ class BaseAccessor:
             # Combine arguments pairwise into one object
             if use_ray:
                 raise ValueError("Ray cannot be used with concat=False")
+            if use_pool:
+                raise ValueError("Process pool cannot be used with concat=False")
             if checks.is_numba_func(combine_func) and numba_loop:
                 for i in range(1, len(inputs)):
                     checks.assert_dtype_equal(inputs[i - 1], inputs[i])
@@ -551,9 +551,11 @@ class ArrayWrapper(Configured, PandasIndexer):
         raise ValueError(f"{a.ndim}-d input is not supported")
 
     def dummy(self, group_by=None, **kwargs):
-        """Create a dummy Series/DataFrame."""
+        """Create a dummy Series/DataFrame.
+
+        The underlying array is a read-only view that occupies no memory."""
         _self = self.resolve(group_by=group_by)
-        return _self.wrap(np.empty(_self.shape), **kwargs)
+        return _self.wrap(np.broadcast_to(np.empty(1), _self.shape), **kwargs)
 
 
 class Wrapping(Configured, PandasIndexer):
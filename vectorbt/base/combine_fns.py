@@ -5,11 +5,13 @@ done upon stacking the results into one NumPy array - since vectorbt is all abou
 large spaces of hyperparameters, concatenating the results of each hyperparameter combination into
 a single DataFrame is important. All functions are available in both Python and Numba-compiled form."""
 
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from numba import njit
 from numba.typed import List
 from tqdm import tqdm
 
+from vectorbt.utils.shm import shared_arrays, call_attached, get_mp_context
 from vectorbt.base import reshape_fns
 
 
@@ -185,14 +187,68 @@ def combine_multiple_nb(objs, combine_func_nb, *args):
     return result
 
 
+def attach_and_apply(i, apply_func, *args, **kwargs):
+    """Attach arrays shared with `vectorbt.utils.shm.shared_arrays` and apply `apply_func`.
+
+    Arrays are attached read-only, since they are shared by all tasks, and detached once
+    `apply_func` returns (see `vectorbt.utils.shm.call_attached`).
+
+    Meant to be run in a worker process."""
+    return call_attached(apply_func, (i, *args), kwargs)
+
+
+def pool_apply(n, apply_func, *args, pool_kwargs=None, shm_kwargs=None, show_progress=False, **kwargs):
+    """Run `apply_func` in a pool of worker processes.
+
+    `pool_kwargs` will be passed to `concurrent.futures.ProcessPoolExecutor`, where `mp_context`
+    is resolved by `vectorbt.utils.shm.get_mp_context`. `shm_kwargs` will be passed to
+    `vectorbt.utils.shm.shared_arrays`.
+
+    Arrays in `args` and `kwargs` are moved into shared memory once, such that each task only
+    pickles references to them. `apply_func` must be picklable, that is, defined at the top level
+    of a module or Numba-compiled."""
+    if pool_kwargs is None:
+        pool_kwargs = {}
+    if shm_kwargs is None:
+        shm_kwargs = {}
+    pool_kwargs = {**pool_kwargs, 'mp_context': get_mp_context(pool_kwargs.get('mp_context', None))}
+    with shared_arrays((args, kwargs), **shm_kwargs) as (shared_args, shared_kwargs):
+        with ProcessPoolExecutor(**pool_kwargs) as executor:
+            futures = [
+                executor.submit(attach_and_apply, i, apply_func, *shared_args, **shared_kwargs)
+                for i in range(n)
+            ]
+            return [future.result() for future in tqdm(futures, disable=not show_progress)]
+
+
+def apply_and_concat_one_pool(*args, **kwargs):
+    """Process pool version of `apply_and_concat_one`."""
+    results = pool_apply(*args, **kwargs)
+    return np.column_stack(list(map(reshape_fns.to_2d, results)))
+
+
+def apply_and_concat_multiple_pool(*args, **kwargs):
+    """Process pool version of `apply_and_concat_multiple`."""
+    results = pool_apply(*args, **kwargs)
+    return list(map(np.column_stack, list(zip(*results))))
+
+
+def combine_and_concat_pool(obj, others, combine_func, *args, **kwargs):
+    """Process pool version of `combine_and_concat`."""
+    return apply_and_concat_one_pool(len(others), select_and_combine, obj, others, combine_func, *args, **kwargs)
+
+
 def ray_apply(n, apply_func, *args, ray_force_init=False, ray_func_kwargs=None,
-              ray_init_kwargs=None, ray_shutdown=False, **kwargs):
+              ray_init_kwargs=None, ray_shutdown=False, shm_kwargs=None, **kwargs):
     """Run `apply_func` in distributed manner.
 
     Set `ray_reinit` to True to terminate the Ray runtime and initialize a new one.
     `ray_func_kwargs` will be passed to `ray.remote` and `ray_init_kwargs` to `ray.init`.
     Set `ray_shutdown` to True to terminate the Ray runtime upon the job end.
 
+    If `shm_kwargs` is not None, arrays in `args` and `kwargs` are moved into shared memory using
+    `vectorbt.utils.shm.shared_arrays` with `shm_kwargs` instead of being serialized into the object store,
+    and workers attach them read-only. Workers must then run on the same machine.
     """
     import ray
 
@@ -205,19 +261,27 @@ def ray_apply(n, apply_func, *args, ray_force_init=False, ray_func_kwargs=None,
             ray.shutdown()
     if not ray.is_initialized():
         ray.init(**ray_init_kwargs)
-    if len(ray_func_kwargs) > 0:
-        apply_func = ray.remote(**ray_func_kwargs)(apply_func)
+
+    def _run(remote_func, *remote_args, **remote_kwargs):
+        # args and kwargs don't change -> put to object store
+        arg_refs = ()
+        for v in remote_args:
+            arg_refs += (ray.put(v),)
+        kwarg_refs = {}
+        for k, v in remote_kwargs.items():
+            kwarg_refs[k] = ray.put(v)
+        if len(ray_func_kwargs) > 0:
+            remote_func = ray.remote(**ray_func_kwargs)(remote_func)
+        else:
+            remote_func = ray.remote(remote_func)
+        futures = [remote_func.remote(i, *arg_refs, **kwarg_refs) for i in range(n)]
+        return ray.get(futures)
+
+    if shm_kwargs is None:
+        results = _run(apply_func, *args, **kwargs)
     else:
-        apply_func = ray.remote(apply_func)
-    # args and kwargs don't change -> put to object store
-    arg_refs = ()
-    for v in args:
-        arg_refs += (ray.put(v),)
-    kwarg_refs = {}
-    for k, v in kwargs.items():
-        kwarg_refs[k] = ray.put(v)
-    futures = [apply_func.remote(i, *arg_refs, **kwarg_refs) for i in range(n)]
-    results = ray.get(futures)
+        with shared_arrays((args, kwargs), **shm_kwargs) as (shared_args, shared_kwargs):
+            results = _run(attach_and_apply, apply_func, *shared_args, **shared_kwargs)
     if ray_shutdown:
         ray.shutdown()
     return results
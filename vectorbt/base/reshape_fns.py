@@ -865,3 +865,21 @@ def flex_select_auto_nb(i, col, a, flex_2d):
     flex_i, flex_col = flex_choose_i_and_col_nb(a, flex_2d)
     return flex_select_nb(i, col, a, flex_i, flex_col, flex_2d)
 
+
+def flex_select_cols(a, cols, flex_2d):
+    """Select columns `cols` of `a` as if it has been broadcast.
+
+    Dimensions that would be broadcast are left untouched, such that the result can be
+    passed to `flex_select_auto_nb` in place of `a` with columns counted from `cols`.
+
+    `cols` can be an integer array or a slice. Using a slice returns a view."""
+    a = np.asarray(a)
+    if a.ndim == 0:
+        return a
+    if a.ndim == 1:
+        if flex_2d and a.shape[0] > 1:
+            return a[cols]
+        return a
+    if a.shape[1] > 1:
+        return a[:, cols]
+    return a
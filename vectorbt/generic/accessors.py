@@ -124,6 +124,20 @@ except ImportError:
     nanargmin = np.nanargmin
 
 
+def get_nb_func(nb_func, parallel=None):
+    """Get `nb_func` or its version that processes columns in parallel.
+
+    The parallel version has the suffix `_parallel_nb` instead of `_nb` and lives in the same module.
+    `parallel` defaults to `parallel` in `vectorbt.settings.generic`."""
+    from vectorbt import settings
+
+    if parallel is None:
+        parallel = settings.generic['parallel']
+    if not parallel:
+        return nb_func
+    return getattr(nb, nb_func.__name__[:-len('_nb')] + '_parallel_nb')
+
+
 def add_transform_methods(transformers):
     """Class decorator to add scikit-learn transformers as transform methods."""
 
@@ -149,12 +163,6 @@ def add_transform_methods(transformers):
     (nb.ffill_nb, False),
     (nb.cumsum_nb, False),
     (nb.cumprod_nb, False),
-    (nb.rolling_min_nb, False),
-    (nb.rolling_max_nb, False),
-    (nb.rolling_mean_nb, False),
-    (nb.expanding_min_nb, False),
-    (nb.expanding_max_nb, False),
-    (nb.expanding_mean_nb, False),
     (nb.product_nb, True, 'product')
 ], module_name='vectorbt.generic.nb')
 @add_transform_methods([
@@ -178,24 +186,140 @@ class GenericAccessor(BaseAccessor):
 
         BaseAccessor.__init__(self, obj, **kwargs)
 
-    def rolling_std(self, window, minp=None, ddof=1, wrap_kwargs=None):  # pragma: no cover
-        """See `vectorbt.generic.nb.rolling_std_nb`."""
-        out = nb.rolling_std_nb(self.to_2d_array(), window, minp=minp, ddof=ddof)
+    def rolling_min(self, window, minp=None, parallel=None, wrap_kwargs=None):
+        """See `vectorbt.generic.nb.rolling_min_nb`.
+
+        For `parallel`, see `get_nb_func`."""
+        func = get_nb_func(nb.rolling_min_nb, parallel=parallel)
+        out = func(self.to_2d_array(), window, minp=minp)
+        return self.wrapper.wrap(out, **merge_dicts({}, wrap_kwargs))
+
+    def rolling_max(self, window, minp=None, parallel=None, wrap_kwargs=None):
+        """See `vectorbt.generic.nb.rolling_max_nb`.
+
+        For `parallel`, see `get_nb_func`."""
+        func = get_nb_func(nb.rolling_max_nb, parallel=parallel)
+        out = func(self.to_2d_array(), window, minp=minp)
+        return self.wrapper.wrap(out, **merge_dicts({}, wrap_kwargs))
+
+    def rolling_argmin(self, window, minp=None, parallel=None, wrap_kwargs=None):
+        """See `vectorbt.generic.nb.rolling_argmin_nb`.
+
+        For `parallel`, see `get_nb_func`.
+
+        ## Example
+
+        ```python-repl
+        >>> df.vbt.rolling_argmin(3)
+                      a    b    c
+        2020-01-01  NaN  NaN  NaN
+        2020-01-02  NaN  NaN  NaN
+        2020-01-03  0.0  2.0  0.0
+        2020-01-04  1.0  3.0  1.0
+        2020-01-05  2.0  4.0  4.0
+        ```"""
+        func = get_nb_func(nb.rolling_argmin_nb, parallel=parallel)
+        out = func(self.to_2d_array(), window, minp=minp)
+        return self.wrapper.wrap(out, **merge_dicts({}, wrap_kwargs))
+
+    def rolling_argmax(self, window, minp=None, parallel=None, wrap_kwargs=None):
+        """See `vectorbt.generic.nb.rolling_argmax_nb`.
+
+        For `parallel`, see `get_nb_func`."""
+        func = get_nb_func(nb.rolling_argmax_nb, parallel=parallel)
+        out = func(self.to_2d_array(), window, minp=minp)
+        return self.wrapper.wrap(out, **merge_dicts({}, wrap_kwargs))
+
+    def rolling_mean(self, window, minp=None, parallel=None, wrap_kwargs=None):
+        """See `vectorbt.generic.nb.rolling_mean_nb`.
+
+        For `parallel`, see `get_nb_func`."""
+        func = get_nb_func(nb.rolling_mean_nb, parallel=parallel)
+        out = func(self.to_2d_array(), window, minp=minp)
+        return self.wrapper.wrap(out, **merge_dicts({}, wrap_kwargs))
+
+    def rolling_median(self, window, minp=None, parallel=None, wrap_kwargs=None):
+        """See `vectorbt.generic.nb.rolling_median_nb`.
+
+        For `parallel`, see `get_nb_func`."""
+        func = get_nb_func(nb.rolling_median_nb, parallel=parallel)
+        out = func(self.to_2d_array(), window, minp=minp)
         return self.wrapper.wrap(out, **merge_dicts({}, wrap_kwargs))
 
-    def expanding_std(self, minp=1, ddof=1, wrap_kwargs=None):  # pragma: no cover
-        """See `vectorbt.generic.nb.expanding_std_nb`."""
-        out = nb.expanding_std_nb(self.to_2d_array(), minp=minp, ddof=ddof)
+    def rolling_quantile(self, window, q, minp=None, parallel=None, wrap_kwargs=None):
+        """See `vectorbt.generic.nb.rolling_quantile_nb`.
+
+        For `parallel`, see `get_nb_func`.
+
+        ## Example
+
+        ```python-repl
+        >>> df.vbt.rolling_quantile(3, 0.25)
+                      a    b    c
+        2020-01-01  NaN  NaN  NaN
+        2020-01-02  NaN  NaN  NaN
+        2020-01-03  1.5  3.5  1.5
+        2020-01-04  2.5  2.5  2.0
+        2020-01-05  3.5  1.5  1.5
+        ```"""
+        func = get_nb_func(nb.rolling_quantile_nb, parallel=parallel)
+        out = func(self.to_2d_array(), window, q, minp=minp)
+        return self.wrapper.wrap(out, **merge_dicts({}, wrap_kwargs))
+
+    def rolling_std(self, window, minp=None, ddof=1, parallel=None, wrap_kwargs=None):
+        """See `vectorbt.generic.nb.rolling_std_nb`.
+
+        For `parallel`, see `get_nb_func`."""
+        func = get_nb_func(nb.rolling_std_nb, parallel=parallel)
+        out = func(self.to_2d_array(), window, minp=minp, ddof=ddof)
+        return self.wrapper.wrap(out, **merge_dicts({}, wrap_kwargs))
+
+    def expanding_min(self, minp=1, parallel=None, wrap_kwargs=None):
+        """See `vectorbt.generic.nb.expanding_min_nb`.
+
+        For `parallel`, see `get_nb_func`."""
+        func = get_nb_func(nb.expanding_min_nb, parallel=parallel)
+        out = func(self.to_2d_array(), minp=minp)
         return self.wrapper.wrap(out, **merge_dicts({}, wrap_kwargs))
 
-    def ewm_mean(self, span, minp=0, adjust=True, wrap_kwargs=None):  # pragma: no cover
-        """See `vectorbt.generic.nb.ewm_mean_nb`."""
-        out = nb.ewm_mean_nb(self.to_2d_array(), span, minp=minp, adjust=adjust)
+    def expanding_max(self, minp=1, parallel=None, wrap_kwargs=None):
+        """See `vectorbt.generic.nb.expanding_max_nb`.
+
+        For `parallel`, see `get_nb_func`."""
+        func = get_nb_func(nb.expanding_max_nb, parallel=parallel)
+        out = func(self.to_2d_array(), minp=minp)
         return self.wrapper.wrap(out, **merge_dicts({}, wrap_kwargs))
 
-    def ewm_std(self, span, minp=0, adjust=True, ddof=1, wrap_kwargs=None):  # pragma: no cover
-        """See `vectorbt.generic.nb.ewm_std_nb`."""
-        out = nb.ewm_std_nb(self.to_2d_array(), span, minp=minp, adjust=adjust, ddof=ddof)
+    def expanding_mean(self, minp=1, parallel=None, wrap_kwargs=None):
+        """See `vectorbt.generic.nb.expanding_mean_nb`.
+
+        For `parallel`, see `get_nb_func`."""
+        func = get_nb_func(nb.expanding_mean_nb, parallel=parallel)
+        out = func(self.to_2d_array(), minp=minp)
+        return self.wrapper.wrap(out, **merge_dicts({}, wrap_kwargs))
+
+    def expanding_std(self, minp=1, ddof=1, parallel=None, wrap_kwargs=None):
+        """See `vectorbt.generic.nb.expanding_std_nb`.
+
+        For `parallel`, see `get_nb_func`."""
+        func = get_nb_func(nb.expanding_std_nb, parallel=parallel)
+        out = func(self.to_2d_array(), minp=minp, ddof=ddof)
+        return self.wrapper.wrap(out, **merge_dicts({}, wrap_kwargs))
+
+    def ewm_mean(self, span, minp=0, adjust=True, parallel=None, wrap_kwargs=None):
+        """See `vectorbt.generic.nb.ewm_mean_nb`.
+
+        For `parallel`, see `get_nb_func`."""
+        func = get_nb_func(nb.ewm_mean_nb, parallel=parallel)
+        out = func(self.to_2d_array(), span, minp=minp, adjust=adjust)
+        return self.wrapper.wrap(out, **merge_dicts({}, wrap_kwargs))
+
+    def ewm_std(self, span, minp=0, adjust=True, ddof=1, parallel=None, wrap_kwargs=None):
+        """See `vectorbt.generic.nb.ewm_std_nb`.
+
+        For `parallel`, see `get_nb_func`."""
+        func = get_nb_func(nb.ewm_std_nb, parallel=parallel)
+        out = func(self.to_2d_array(), span, minp=minp, adjust=adjust, ddof=ddof)
         return self.wrapper.wrap(out, **merge_dicts({}, wrap_kwargs))
 
     def apply_along_axis(self, apply_func_nb, *args, axis=0, wrap_kwargs=None):
@@ -210,10 +334,13 @@ class GenericAccessor(BaseAccessor):
             raise ValueError("Only axes 0 and 1 are supported")
         return self.wrapper.wrap(out, **merge_dicts({}, wrap_kwargs))
 
-    def rolling_apply(self, window, apply_func_nb, *args, minp=None, on_matrix=False, wrap_kwargs=None):
+    def rolling_apply(self, window, apply_func_nb, *args, minp=None, on_matrix=False,
+                      parallel=None, wrap_kwargs=None):
         """See `vectorbt.generic.nb.rolling_apply_nb` and
         `vectorbt.generic.nb.rolling_matrix_apply_nb` for `on_matrix=True`.
 
+        For `parallel`, see `get_nb_func`. Has no effect if `on_matrix` is True.
+
         ## Example
 
         ```python-repl
@@ -241,13 +368,16 @@ class GenericAccessor(BaseAccessor):
         if on_matrix:
             out = nb.rolling_matrix_apply_nb(self.to_2d_array(), window, minp, apply_func_nb, *args)
         else:
-            out = nb.rolling_apply_nb(self.to_2d_array(), window, minp, apply_func_nb, *args)
+            func = get_nb_func(nb.rolling_apply_nb, parallel=parallel)
+            out = func(self.to_2d_array(), window, minp, apply_func_nb, *args)
         return self.wrapper.wrap(out, **merge_dicts({}, wrap_kwargs))
 
-    def expanding_apply(self, apply_func_nb, *args, minp=1, on_matrix=False, wrap_kwargs=None):
+    def expanding_apply(self, apply_func_nb, *args, minp=1, on_matrix=False, parallel=None, wrap_kwargs=None):
         """See `vectorbt.generic.nb.expanding_apply_nb` and
         `vectorbt.generic.nb.expanding_matrix_apply_nb` for `on_matrix=True`.
 
+        For `parallel`, see `get_nb_func`. Has no effect if `on_matrix` is True.
+
         ## Example
 
         ```python-repl
@@ -275,14 +405,16 @@ class GenericAccessor(BaseAccessor):
         if on_matrix:
             out = nb.expanding_matrix_apply_nb(self.to_2d_array(), minp, apply_func_nb, *args)
         else:
-            out = nb.expanding_apply_nb(self.to_2d_array(), minp, apply_func_nb, *args)
+            func = get_nb_func(nb.expanding_apply_nb, parallel=parallel)
+            out = func(self.to_2d_array(), minp, apply_func_nb, *args)
         return self.wrapper.wrap(out, **merge_dicts({}, wrap_kwargs))
 
-    def groupby_apply(self, by, apply_func_nb, *args, on_matrix=False, wrap_kwargs=None, **kwargs):
+    def groupby_apply(self, by, apply_func_nb, *args, on_matrix=False, parallel=None, wrap_kwargs=None, **kwargs):
         """See `vectorbt.generic.nb.groupby_apply_nb` and
         `vectorbt.generic.nb.groupby_apply_matrix_nb` for `on_matrix=True`.
 
-        For `by`, see `pd.DataFrame.groupby`.
+        For `by`, see `pd.DataFrame.groupby`. For `parallel`, see `get_nb_func`.
+        Has no effect if `on_matrix` is True.
 
         ## Example
 
@@ -311,15 +443,17 @@ class GenericAccessor(BaseAccessor):
         if on_matrix:
             out = nb.groupby_apply_matrix_nb(self.to_2d_array(), groups, apply_func_nb, *args)
         else:
-            out = nb.groupby_apply_nb(self.to_2d_array(), groups, apply_func_nb, *args)
+            func = get_nb_func(nb.groupby_apply_nb, parallel=parallel)
+            out = func(self.to_2d_array(), groups, apply_func_nb, *args)
         wrap_kwargs = merge_dicts(dict(name_or_index=list(regrouped.indices.keys())), wrap_kwargs)
         return self.wrapper.wrap_reduced(out, **wrap_kwargs)
 
-    def resample_apply(self, freq, apply_func_nb, *args, on_matrix=False, wrap_kwargs=None, **kwargs):
+    def resample_apply(self, freq, apply_func_nb, *args, on_matrix=False, parallel=None, wrap_kwargs=None, **kwargs):
         """See `vectorbt.generic.nb.groupby_apply_nb` and
         `vectorbt.generic.nb.groupby_apply_matrix_nb` for `on_matrix=True`.
 
-        For `freq`, see `pd.DataFrame.resample`.
+        For `freq`, see `pd.DataFrame.resample`. For `parallel`, see `get_nb_func`.
+        Has no effect if `on_matrix` is True.
 
         ## Example
 
@@ -348,7 +482,8 @@ class GenericAccessor(BaseAccessor):
         if on_matrix:
             out = nb.groupby_apply_matrix_nb(self.to_2d_array(), groups, apply_func_nb, *args)
         else:
-            out = nb.groupby_apply_nb(self.to_2d_array(), groups, apply_func_nb, *args)
+            func = get_nb_func(nb.groupby_apply_nb, parallel=parallel)
+            out = func(self.to_2d_array(), groups, apply_func_nb, *args)
         out_obj = self.wrapper.wrap(out, index=list(resampled.indices.keys()))
         resampled_arr = np.full((resampled.ngroups, self.to_2d_array().shape[1]), np.nan)
         resampled_obj = self.wrapper.wrap(
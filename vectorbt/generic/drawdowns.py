@@ -93,7 +93,8 @@ class Drawdowns(Records):
         return self.copy(
             wrapper=new_wrapper,
             records_arr=new_records_arr,
-            ts=new_ts
+            ts=new_ts,
+            col_mapper=self.col_mapper._col_idxs_mapper(col_idxs, new_wrapper, new_records_arr['col'])
         )
 
     @classmethod
@@ -195,7 +196,7 @@ class Drawdowns(Records):
     @cached_property
     def active(self):
         """Active drawdowns."""
-        filter_mask = self.values['status'] == DrawdownStatus.Active
+        filter_mask = self.get_field_arr('status') == DrawdownStatus.Active
         return self.filter_by_mask(filter_mask)
 
     @cached_method
@@ -209,7 +210,7 @@ class Drawdowns(Records):
     @cached_property
     def recovered(self):
         """Recovered drawdowns."""
-        filter_mask = self.values['status'] == DrawdownStatus.Recovered
+        filter_mask = self.get_field_arr('status') == DrawdownStatus.Recovered
         return self.filter_by_mask(filter_mask)
 
     @cached_method
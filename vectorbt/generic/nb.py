@@ -24,9 +24,13 @@ array([nan, 1.5, 2.5, 3.5])
     
     Rolling functions with `minp=None` have `min_periods` set to the window size.
     
-    All functions passed as argument should be Numba-compiled."""
+    All functions passed as argument should be Numba-compiled.
 
-from numba import njit
+    Functions with suffix `_parallel_nb` process columns in parallel threads. They produce the same
+    output as their serial counterparts, but are worth it only for arrays with many columns.
+    Functions passed to them as argument must be thread-safe."""
+
+from numba import njit, prange
 import numpy as np
 
 from vectorbt.generic.enums import DrawdownStatus, drawdown_dt
@@ -357,28 +361,74 @@ def nanstd_nb(a, ddof=0):
 
 
 @njit(cache=True)
-def rolling_min_1d_nb(a, window, minp=None):
-    """Return rolling min.
+def rolling_argmin_1d_nb(a, window, minp=None):
+    """Return rolling position of minimum.
+
+    Position is counted from the start of `a`. If there are multiple minimums within the window,
+    returns the first one. Positions are returned as floats, with NaN where
+    there are less than `minp` non-NaN values.
 
-    Numba equivalent to `pd.Series(a).rolling(window, min_periods=minp).min()`."""
+    Keeps positions of candidates in a monotonic deque, thus runs in O(n) regardless of the window."""
     if minp is None:
         minp = window
     if minp > window:
         raise ValueError("minp must be <= window")
     out = np.empty_like(a, dtype=np.float_)
+    cap = max(min(window, a.shape[0]), 1)
+    deque = np.empty(cap, dtype=np.int_)
+    head = 0
+    size = 0
+    cnt = 0
     for i in range(a.shape[0]):
-        minv = a[i]
-        cnt = 0
-        for j in range(max(i - window + 1, 0), i + 1):
-            if np.isnan(a[j]):
-                continue
-            if np.isnan(minv) or a[j] < minv:
-                minv = a[j]
+        while size > 0 and deque[head] <= i - window:
+            head = (head + 1) % cap
+            size -= 1
+        if i >= window and not np.isnan(a[i - window]):
+            cnt -= 1
+        if not np.isnan(a[i]):
+            while size > 0 and a[deque[(head + size - 1) % cap]] > a[i]:
+                size -= 1
+            deque[(head + size) % cap] = i
+            size += 1
             cnt += 1
-        if cnt < minp:
+        if cnt == 0 or cnt < minp:
             out[i] = np.nan
         else:
-            out[i] = minv
+            out[i] = deque[head]
+    return out
+
+
+@njit(cache=True)
+def rolling_argmin_nb(a, window, minp=None):
+    """2-dim version of `rolling_argmin_1d_nb`."""
+    out = np.empty_like(a, dtype=np.float_)
+    for col in range(a.shape[1]):
+        out[:, col] = rolling_argmin_1d_nb(a[:, col], window, minp=minp)
+    return out
+
+
+@njit(cache=True, parallel=True)
+def rolling_argmin_parallel_nb(a, window, minp=None):
+    """Parallel version of `rolling_argmin_nb`."""
+    if minp is not None and minp > window:
+        raise ValueError("minp must be <= window")
+    out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = rolling_argmin_1d_nb(a[:, col], window, minp=minp)
+    return out
+
+
+@njit(cache=True)
+def rolling_min_1d_nb(a, window, minp=None):
+    """Return rolling min.
+
+    Numba equivalent to `pd.Series(a).rolling(window, min_periods=minp).min()`.
+
+    Built upon `rolling_argmin_1d_nb`."""
+    out = rolling_argmin_1d_nb(a, window, minp=minp)
+    for i in range(a.shape[0]):
+        if not np.isnan(out[i]):
+            out[i] = a[int(out[i])]
     return out
 
 
@@ -391,29 +441,86 @@ def rolling_min_nb(a, window, minp=None):
     return out
 
 
+@njit(cache=True, parallel=True)
+def rolling_min_parallel_nb(a, window, minp=None):
+    """Parallel version of `rolling_min_nb`."""
+    if minp is not None and minp > window:
+        raise ValueError("minp must be <= window")
+    out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = rolling_min_1d_nb(a[:, col], window, minp=minp)
+    return out
+
+
 @njit(cache=True)
-def rolling_max_1d_nb(a, window, minp=None):
-    """Return rolling max.
+def rolling_argmax_1d_nb(a, window, minp=None):
+    """Return rolling position of maximum.
+
+    Position is counted from the start of `a`. If there are multiple maximums within the window,
+    returns the first one. Positions are returned as floats, with NaN where
+    there are less than `minp` non-NaN values.
 
-    Numba equivalent to `pd.Series(a).rolling(window, min_periods=minp).max()`."""
+    Keeps positions of candidates in a monotonic deque, thus runs in O(n) regardless of the window."""
     if minp is None:
         minp = window
     if minp > window:
         raise ValueError("minp must be <= window")
     out = np.empty_like(a, dtype=np.float_)
+    cap = max(min(window, a.shape[0]), 1)
+    deque = np.empty(cap, dtype=np.int_)
+    head = 0
+    size = 0
+    cnt = 0
     for i in range(a.shape[0]):
-        maxv = a[i]
-        cnt = 0
-        for j in range(max(i - window + 1, 0), i + 1):
-            if np.isnan(a[j]):
-                continue
-            if np.isnan(maxv) or a[j] > maxv:
-                maxv = a[j]
+        while size > 0 and deque[head] <= i - window:
+            head = (head + 1) % cap
+            size -= 1
+        if i >= window and not np.isnan(a[i - window]):
+            cnt -= 1
+        if not np.isnan(a[i]):
+            while size > 0 and a[deque[(head + size - 1) % cap]] < a[i]:
+                size -= 1
+            deque[(head + size) % cap] = i
+            size += 1
             cnt += 1
-        if cnt < minp:
+        if cnt == 0 or cnt < minp:
             out[i] = np.nan
         else:
-            out[i] = maxv
+            out[i] = deque[head]
+    return out
+
+
+@njit(cache=True)
+def rolling_argmax_nb(a, window, minp=None):
+    """2-dim version of `rolling_argmax_1d_nb`."""
+    out = np.empty_like(a, dtype=np.float_)
+    for col in range(a.shape[1]):
+        out[:, col] = rolling_argmax_1d_nb(a[:, col], window, minp=minp)
+    return out
+
+
+@njit(cache=True, parallel=True)
+def rolling_argmax_parallel_nb(a, window, minp=None):
+    """Parallel version of `rolling_argmax_nb`."""
+    if minp is not None and minp > window:
+        raise ValueError("minp must be <= window")
+    out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = rolling_argmax_1d_nb(a[:, col], window, minp=minp)
+    return out
+
+
+@njit(cache=True)
+def rolling_max_1d_nb(a, window, minp=None):
+    """Return rolling max.
+
+    Numba equivalent to `pd.Series(a).rolling(window, min_periods=minp).max()`.
+
+    Built upon `rolling_argmax_1d_nb`."""
+    out = rolling_argmax_1d_nb(a, window, minp=minp)
+    for i in range(a.shape[0]):
+        if not np.isnan(out[i]):
+            out[i] = a[int(out[i])]
     return out
 
 
@@ -426,6 +533,17 @@ def rolling_max_nb(a, window, minp=None):
     return out
 
 
+@njit(cache=True, parallel=True)
+def rolling_max_parallel_nb(a, window, minp=None):
+    """Parallel version of `rolling_max_nb`."""
+    if minp is not None and minp > window:
+        raise ValueError("minp must be <= window")
+    out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = rolling_max_1d_nb(a[:, col], window, minp=minp)
+    return out
+
+
 @njit(cache=True)
 def rolling_mean_1d_nb(a, window, minp=None):
     """Return rolling mean.
@@ -469,6 +587,17 @@ def rolling_mean_nb(a, window, minp=None):
     return out
 
 
+@njit(cache=True, parallel=True)
+def rolling_mean_parallel_nb(a, window, minp=None):
+    """Parallel version of `rolling_mean_nb`."""
+    if minp is not None and minp > window:
+        raise ValueError("minp must be <= window")
+    out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = rolling_mean_1d_nb(a[:, col], window, minp=minp)
+    return out
+
+
 @njit(cache=True)
 def rolling_std_1d_nb(a, window, minp=None, ddof=0):
     """Return rolling standard deviation.
@@ -520,6 +649,17 @@ def rolling_std_nb(a, window, minp=None, ddof=0):
     return out
 
 
+@njit(cache=True, parallel=True)
+def rolling_std_parallel_nb(a, window, minp=None, ddof=0):
+    """Parallel version of `rolling_std_nb`."""
+    if minp is not None and minp > window:
+        raise ValueError("minp must be <= window")
+    out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = rolling_std_1d_nb(a[:, col], window, minp=minp, ddof=ddof)
+    return out
+
+
 @njit(cache=True)
 def ewm_mean_1d_nb(a, span, minp=0, adjust=False):
     """Return exponential weighted average.
@@ -574,6 +714,17 @@ def ewm_mean_nb(a, span, minp=0, adjust=False):
     return out
 
 
+@njit(cache=True, parallel=True)
+def ewm_mean_parallel_nb(a, span, minp=0, adjust=False):
+    """Parallel version of `ewm_mean_nb`."""
+    if minp is not None and minp > span:
+        raise ValueError("minp must be <= span")
+    out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = ewm_mean_1d_nb(a[:, col], span, minp=minp, adjust=adjust)
+    return out
+
+
 @njit(cache=True)
 def ewm_std_1d_nb(a, span, minp=0, adjust=False, ddof=0):
     """Return exponential weighted standard deviation.
@@ -664,6 +815,129 @@ def ewm_std_nb(a, span, minp=0, adjust=False, ddof=0):
     return out
 
 
+@njit(cache=True, parallel=True)
+def ewm_std_parallel_nb(a, span, minp=0, adjust=False, ddof=0):
+    """Parallel version of `ewm_std_nb`."""
+    if minp is not None and minp > span:
+        raise ValueError("minp must be <= span")
+    out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = ewm_std_1d_nb(a[:, col], span, minp=minp, adjust=adjust, ddof=ddof)
+    return out
+
+
+@njit(cache=True)
+def rolling_quantile_1d_nb(a, window, q, minp=None):
+    """Return rolling quantile.
+
+    Numba equivalent to `pd.Series(a).rolling(window, min_periods=minp).quantile(q)`
+    with linear interpolation between the closest ranks.
+
+    Ranks all values of `a` upfront and keeps the number of values in the window per rank
+    in a Fenwick tree. Adding or removing a value and finding the k-th smallest value in the window
+    both take O(log n), thus the function runs in O(n log n) regardless of the window."""
+    if minp is None:
+        minp = window
+    if minp > window:
+        raise ValueError("minp must be <= window")
+    if q < 0 or q > 1:
+        raise ValueError("q must be within [0, 1]")
+    n = a.shape[0]
+    out = np.empty_like(a, dtype=np.float_)
+    sort_idxs = np.argsort(a)
+    sorted_a = np.empty(n, dtype=np.float_)
+    ranks = np.empty(n, dtype=np.int_)
+    for j in range(n):
+        sorted_a[j] = a[sort_idxs[j]]
+        ranks[sort_idxs[j]] = j
+    tree = np.zeros(n + 1, dtype=np.int_)
+    top_bit = 1
+    while top_bit * 2 <= n:
+        top_bit *= 2
+    cnt = 0
+    for i in range(n):
+        if not np.isnan(a[i]):
+            r = ranks[i] + 1
+            while r <= n:
+                tree[r] += 1
+                r += r & -r
+            cnt += 1
+        if i >= window and not np.isnan(a[i - window]):
+            r = ranks[i - window] + 1
+            while r <= n:
+                tree[r] -= 1
+                r += r & -r
+            cnt -= 1
+        if cnt == 0 or cnt < minp:
+            out[i] = np.nan
+            continue
+        pos = (cnt - 1) * q
+        lower_k = int(np.floor(pos))
+        frac = pos - lower_k
+        upper_k = lower_k + 1 if frac > 0 else lower_k
+        lower_value = np.nan
+        for k in range(lower_k, upper_k + 1):
+            # find the (k+1)-th smallest value in the window
+            r = 0
+            remaining = k + 1
+            bit = top_bit
+            while bit > 0:
+                if r + bit <= n and tree[r + bit] < remaining:
+                    r += bit
+                    remaining -= tree[r]
+                bit //= 2
+            if k == lower_k:
+                lower_value = sorted_a[r]
+            else:
+                lower_value = lower_value + (sorted_a[r] - lower_value) * frac
+        out[i] = lower_value
+    return out
+
+
+@njit(cache=True)
+def rolling_quantile_nb(a, window, q, minp=None):
+    """2-dim version of `rolling_quantile_1d_nb`."""
+    out = np.empty_like(a, dtype=np.float_)
+    for col in range(a.shape[1]):
+        out[:, col] = rolling_quantile_1d_nb(a[:, col], window, q, minp=minp)
+    return out
+
+
+@njit(cache=True, parallel=True)
+def rolling_quantile_parallel_nb(a, window, q, minp=None):
+    """Parallel version of `rolling_quantile_nb`."""
+    if minp is not None and minp > window:
+        raise ValueError("minp must be <= window")
+    if q < 0 or q > 1:
+        raise ValueError("q must be within [0, 1]")
+    out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = rolling_quantile_1d_nb(a[:, col], window, q, minp=minp)
+    return out
+
+
+@njit(cache=True)
+def rolling_median_1d_nb(a, window, minp=None):
+    """Return rolling median.
+
+    Numba equivalent to `pd.Series(a).rolling(window, min_periods=minp).median()`.
+
+    See `rolling_quantile_1d_nb`."""
+    return rolling_quantile_1d_nb(a, window, 0.5, minp=minp)
+
+
+@njit(cache=True)
+def rolling_median_nb(a, window, minp=None):
+    """2-dim version of `rolling_median_1d_nb`."""
+    return rolling_quantile_nb(a, window, 0.5, minp=minp)
+
+
+@njit(cache=True)
+def rolling_median_parallel_nb(a, window, minp=None):
+    """Parallel version of `rolling_median_nb`."""
+    return rolling_quantile_parallel_nb(a, window, 0.5, minp=minp)
+
+
 # ############# Expanding functions ############# #
 
 
@@ -696,6 +970,15 @@ def expanding_min_nb(a, minp=1):
     return out
 
 
+@njit(cache=True, parallel=True)
+def expanding_min_parallel_nb(a, minp=1):
+    """Parallel version of `expanding_min_nb`."""
+    out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = expanding_min_1d_nb(a[:, col], minp=minp)
+    return out
+
+
 @njit(cache=True)
 def expanding_max_1d_nb(a, minp=1):
     """Return expanding max.
@@ -725,6 +1008,15 @@ def expanding_max_nb(a, minp=1):
     return out
 
 
+@njit(cache=True, parallel=True)
+def expanding_max_parallel_nb(a, minp=1):
+    """Parallel version of `expanding_max_nb`."""
+    out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = expanding_max_1d_nb(a[:, col], minp=minp)
+    return out
+
+
 @njit(cache=True)
 def expanding_mean_1d_nb(a, minp=1):
     """Return expanding mean.
@@ -739,6 +1031,12 @@ def expanding_mean_nb(a, minp=1):
     return rolling_mean_nb(a, a.shape[0], minp=minp)
 
 
+@njit(cache=True)
+def expanding_mean_parallel_nb(a, minp=1):
+    """Parallel version of `expanding_mean_nb`."""
+    return rolling_mean_parallel_nb(a, a.shape[0], minp=minp)
+
+
 @njit(cache=True)
 def expanding_std_1d_nb(a, minp=1, ddof=0):
     """Return expanding standard deviation.
@@ -753,6 +1051,12 @@ def expanding_std_nb(a, minp=1, ddof=0):
     return rolling_std_nb(a, a.shape[0], minp=minp, ddof=ddof)
 
 
+@njit(cache=True)
+def expanding_std_parallel_nb(a, minp=1, ddof=0):
+    """Parallel version of `expanding_std_nb`."""
+    return rolling_std_parallel_nb(a, a.shape[0], minp=minp, ddof=ddof)
+
+
 # ############# Apply functions ############# #
 
 
@@ -806,6 +1110,31 @@ def rolling_apply_nb(a, window, minp, apply_func_nb, *args):
     return out
 
 
+@njit(parallel=True)
+def rolling_apply_parallel_nb(a, window, minp, apply_func_nb, *args):
+    """Parallel version of `rolling_apply_nb`."""
+    if minp is None:
+        minp = window
+    out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        nancnt_arr = np.empty((a.shape[0],), dtype=np.int_)
+        nancnt = 0
+        for i in range(a.shape[0]):
+            if np.isnan(a[i, col]):
+                nancnt = nancnt + 1
+            nancnt_arr[i] = nancnt
+            if i < window:
+                valid_cnt = i + 1 - nancnt
+            else:
+                valid_cnt = window - (nancnt - nancnt_arr[i - window])
+            if valid_cnt < minp:
+                out[i, col] = np.nan
+            else:
+                window_a = a[max(0, i + 1 - window):i + 1, col]
+                out[i, col] = apply_func_nb(i, col, window_a, *args)
+    return out
+
+
 @njit
 def rolling_matrix_apply_nb(a, window, minp, apply_func_nb, *args):
     """`rolling_apply_nb` with `apply_func_nb` being applied on all columns at once.
@@ -840,6 +1169,12 @@ def expanding_apply_nb(a, minp, apply_func_nb, *args):
     return rolling_apply_nb(a, a.shape[0], minp, apply_func_nb, *args)
 
 
+@njit
+def expanding_apply_parallel_nb(a, minp, apply_func_nb, *args):
+    """Parallel version of `expanding_apply_nb`."""
+    return rolling_apply_parallel_nb(a, a.shape[0], minp, apply_func_nb, *args)
+
+
 @njit
 def expanding_matrix_apply_nb(a, minp, apply_func_nb, *args):
     """Expanding version of `rolling_matrix_apply_nb`."""
@@ -863,6 +1198,16 @@ def groupby_apply_nb(a, groups, apply_func_nb, *args):
     return out
 
 
+@njit(parallel=True)
+def groupby_apply_parallel_nb(a, groups, apply_func_nb, *args):
+    """Parallel version of `groupby_apply_nb`."""
+    out = np.empty((len(groups), a.shape[1]), dtype=np.float_)
+    for col in prange(a.shape[1]):
+        for i, idxs in groups.items():
+            out[i, col] = apply_func_nb(idxs, col, a[idxs, col], *args)
+    return out
+
+
 @njit
 def groupby_apply_matrix_nb(a, groups, apply_func_nb, *args):
     """`groupby_apply_nb` with `apply_func_nb` being applied on all columns at once.
@@ -1167,6 +1512,116 @@ def describe_reduce_nb(col, a, perc, ddof):
     return out
 
 
+@njit(cache=True)
+def p2_update_nb(x, cnt, p, q, n, j):
+    """Update the markers of the P² algorithm in row `j` with the `cnt`-th observation `x`.
+
+    `p` is the quantile, `q` are heights and `n` are positions of the five markers.
+    Each row corresponds to one quantile. Arrays are modified in-place."""
+    # Find the cell of x and update extreme markers
+    if x < q[j, 0]:
+        q[j, 0] = x
+        k = 0
+    elif x >= q[j, 4]:
+        q[j, 4] = x
+        k = 3
+    else:
+        k = 0
+        while x >= q[j, k + 1]:
+            k += 1
+    for i in range(k + 1, 5):
+        n[j, i] += 1
+
+    # Adjust heights of middle markers towards their desired positions
+    for i in range(1, 4):
+        if i == 1:
+            d = 1 + (cnt - 1) * p / 2 - n[j, i]
+        elif i == 2:
+            d = 1 + (cnt - 1) * p - n[j, i]
+        else:
+            d = 1 + (cnt - 1) * (1 + p) / 2 - n[j, i]
+        if (d >= 1 and n[j, i + 1] - n[j, i] > 1) or (d <= -1 and n[j, i - 1] - n[j, i] < -1):
+            d = 1 if d > 0 else -1
+            # Piecewise-parabolic prediction
+            q_new = q[j, i] + d / (n[j, i + 1] - n[j, i - 1]) * (
+                (n[j, i] - n[j, i - 1] + d) * (q[j, i + 1] - q[j, i]) / (n[j, i + 1] - n[j, i])
+                + (n[j, i + 1] - n[j, i] - d) * (q[j, i] - q[j, i - 1]) / (n[j, i] - n[j, i - 1])
+            )
+            if q[j, i - 1] < q_new < q[j, i + 1]:
+                q[j, i] = q_new
+            else:
+                # Linear prediction
+                q[j, i] = q[j, i] + d * (q[j, i + d] - q[j, i]) / (n[j, i + d] - n[j, i])
+            n[j, i] += d
+
+
+@njit(cache=True)
+def describe_approx_reduce_nb(col, a, perc, ddof):
+    """Return approximate descriptive statistics (ignores NaNs).
+
+    Same output as `describe_reduce_nb`, but computed in a single pass without sorting
+    or copying `a`: mean and standard deviation using Welford's algorithm, and percentiles
+    using the P² algorithm, which keeps only five markers per percentile.
+
+    Percentiles are exact if there are at most five values."""
+    n_perc = len(perc)
+    out = np.empty(5 + n_perc, dtype=np.float_)
+    q = np.empty((n_perc, 5), dtype=np.float_)
+    n = np.empty((n_perc, 5), dtype=np.float_)
+    first = np.empty(5, dtype=np.float_)
+    cnt = 0
+    mean = 0.
+    m2 = 0.
+    _min = np.inf
+    _max = -np.inf
+
+    for i in range(a.shape[0]):
+        x = a[i]
+        if np.isnan(x):
+            continue
+        cnt += 1
+        delta = x - mean
+        mean += delta / cnt
+        m2 += delta * (x - mean)
+        if x < _min:
+            _min = x
+        if x > _max:
+            _max = x
+        if cnt <= 5:
+            first[cnt - 1] = x
+            if cnt == 5:
+                # Initialize markers
+                first.sort()
+                for j in range(n_perc):
+                    for k in range(5):
+                        q[j, k] = first[k]
+                        n[j, k] = k + 1
+        else:
+            for j in range(n_perc):
+                if 0 < perc[j] < 1:
+                    p2_update_nb(x, cnt, perc[j], q, n, j)
+
+    out[0] = cnt
+    if cnt == 0:
+        out[1:] = np.nan
+        return out
+    out[1] = mean
+    out[2] = np.sqrt(m2 / (cnt - ddof)) if cnt - ddof > 0 else np.nan
+    out[3] = _min
+    if cnt <= 5:
+        out[4:-1] = np.percentile(first[:cnt], perc * 100)
+    else:
+        for j in range(n_perc):
+            if perc[j] == 0:
+                out[4 + j] = _min
+            elif perc[j] == 1:
+                out[4 + j] = _max
+            else:
+                out[4 + j] = q[j, 2]
+    out[4 + n_perc] = _max
+    return out
+
+
 # ############# Drawdowns ############# #
 
 @njit(cache=True)
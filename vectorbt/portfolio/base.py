@@ -323,6 +323,28 @@ LTC-USD    1.040494
 Name: sharpe_ratio, dtype: float64
 ```
 
+Large portfolios can instead be saved to a directory of columnar files by passing `format`
+(`npy` or `parquet`, see `vectorbt.utils.store`). Pass `mmap=True` when loading to memory-map
+the files, such that only the data that is actually accessed is read from the disk:
+
+```python-repl
+>>> portfolio.save('portfolio_dir', format='npy')
+>>> portfolio = vbt.Portfolio.load('portfolio_dir', mmap=True)
+>>> portfolio.sharpe_ratio()
+symbol
+BTC-USD    1.743437
+ETH-USD    2.800903
+XRP-USD    1.607904
+BNB-USD    1.805373
+BCH-USD    0.269392
+LTC-USD    1.040494
+Name: sharpe_ratio, dtype: float64
+```
+
+Records are then loaded in columnar format, see `vectorbt.records.columnar`. Since a column index
+is saved along with the records, selecting columns of such a portfolio (for example, `portfolio['BTC-USD']`)
+reads only the records of those columns.
+
 !!! note
     Save files won't include neither cached results nor global defaults. For example,
     passing `incl_unrealized` as None will also use None when the portfolio is loaded from disk.
@@ -333,20 +355,30 @@ import numpy as np
 import pandas as pd
 from inspect import signature
 from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import os
 import warnings
 
 from vectorbt.utils import checks
 from vectorbt.utils.decorators import cached_property, cached_method
 from vectorbt.utils.enum import convert_str_enum_value
 from vectorbt.utils.config import merge_dicts
-from vectorbt.utils.random import set_seed
+from vectorbt.utils.random import set_seed, set_seed_nb
 from vectorbt.utils.colors import adjust_opacity
 from vectorbt.utils.widgets import make_subplots
-from vectorbt.base.reshape_fns import to_1d, to_2d, broadcast, broadcast_to
+from vectorbt.utils.datetime import to_timedelta
+from vectorbt.utils.shm import shared_arrays, call_attached, get_mp_context
+from vectorbt.base.reshape_fns import to_1d, to_2d, broadcast, broadcast_to, flex_select_cols
 from vectorbt.base.array_wrapper import ArrayWrapper, Wrapping
+from vectorbt.base import index_fns
 from vectorbt.generic import nb as generic_nb
 from vectorbt.generic.drawdowns import Drawdowns
+from vectorbt.records.columnar import ColumnarArray
+from vectorbt.records.nb import col_map_nb
 from vectorbt.signals.generators import RAND, RPROB
+from vectorbt.signals.enums import SparseSignals
+from vectorbt.signals import nb as signals_nb
 from vectorbt.portfolio import nb
 from vectorbt.portfolio.orders import Orders
 from vectorbt.portfolio.trades import Trades, Positions
@@ -356,7 +388,9 @@ from vectorbt.portfolio.enums import (
     CallSeqType,
     SizeType,
     ConflictMode,
-    Direction
+    Direction,
+    SimulationState,
+    PortfolioState
 )
 
 
@@ -365,6 +399,334 @@ def _mean_agg_func(df):
     return df.mean(axis=0)
 
 
+def split_group_chunks(group_lens, n_chunks=None, chunk_len=None):
+    """Split groups into contiguous chunks.
+
+    If `chunk_len` is set, each chunk spans at most `chunk_len` columns, unless a single
+    group is wider. Otherwise, splits into at most `n_chunks` chunks of roughly the same number of columns.
+
+    Returns a list of tuples `(from_group, to_group, from_col, to_col)`.
+
+    Groups are never split, so each chunk can be simulated independently of the others."""
+    group_lens = np.asarray(group_lens)
+    n_cols = np.sum(group_lens)
+    if chunk_len is None:
+        if n_chunks is None:
+            n_chunks = 1
+        n_chunks = max(min(n_chunks, len(group_lens)), 1)
+        chunk_len = int(np.ceil(n_cols / n_chunks))
+    chunk_len = max(chunk_len, 1)
+    chunks = []
+    from_group = 0
+    from_col = 0
+    to_col = 0
+    for group in range(len(group_lens)):
+        next_col = to_col + group_lens[group]
+        if next_col - from_col > chunk_len and to_col > from_col:
+            chunks.append((from_group, group, from_col, to_col))
+            from_group = group
+            from_col = to_col
+        to_col = next_col
+    chunks.append((from_group, len(group_lens), from_col, to_col))
+    return chunks
+
+
+def merge_sim_records(order_records_list, log_records_list):
+    """Merge order and log records of chunks that were simulated independently.
+
+    Chunks must come in column order. Record ids are renumbered and each log record
+    is linked to the renumbered order it produced."""
+    if len(order_records_list) == 1:
+        return order_records_list[0], log_records_list[0]
+    order_records = np.concatenate(order_records_list)
+    order_records['id'] = np.arange(len(order_records))
+    log_records = np.concatenate(log_records_list)
+    log_records['id'] = np.arange(len(log_records))
+    order_offsets = np.cumsum([0] + [len(r) for r in order_records_list[:-1]])
+    order_offsets = np.repeat(order_offsets, [len(r) for r in log_records_list])
+    filled_mask = log_records['order_id'] != -1
+    log_records['order_id'][filled_mask] += order_offsets[filled_mask]
+    return order_records, log_records
+
+
+def merge_trade_records(trade_records_list):
+    """Merge trade records of chunks that were extracted independently.
+
+    Chunks must come in column order. Record ids are renumbered and position ids are shifted
+    to follow the positions of the previous chunks."""
+    if len(trade_records_list) == 1:
+        return trade_records_list[0]
+    n_positions = [r['position_id'][-1] + 1 if len(r) > 0 else 0 for r in trade_records_list]
+    position_offsets = np.cumsum([0] + n_positions[:-1])
+    trade_records = np.concatenate(trade_records_list)
+    trade_records['id'] = np.arange(len(trade_records))
+    trade_records['position_id'] += np.repeat(position_offsets, [len(r) for r in trade_records_list])
+    return trade_records
+
+
+def sort_sim_records_by_row(order_records, log_records):
+    """Stable-sort order and log records by row, renumbering ids and linked order ids.
+
+    Turns records of chunks that were simulated row by row (see `vectorbt.portfolio.nb.simulate_row_wise_nb`)
+    and merged in column order into the records of a single run."""
+    order_perm = np.argsort(order_records['idx'], kind='stable')
+    order_records = order_records[order_perm]
+    order_records['id'] = np.arange(len(order_records))
+    new_order_ids = np.empty_like(order_perm)
+    new_order_ids[order_perm] = np.arange(len(order_perm))
+    log_records = log_records[np.argsort(log_records['idx'], kind='stable')]
+    log_records['id'] = np.arange(len(log_records))
+    filled_mask = log_records['order_id'] != -1
+    log_records['order_id'][filled_mask] = new_order_ids[log_records['order_id'][filled_mask]]
+    return order_records, log_records
+
+
+def select_sparse_cols(sparse, col_slice):
+    """Select a contiguous slice of columns from `vectorbt.signals.enums.SparseSignals`."""
+    start = np.sum(sparse.col_lens[:col_slice.start])
+    col_lens = sparse.col_lens[col_slice]
+    return SparseSignals(
+        (sparse.shape[0], len(col_lens)),
+        sparse.idxs[start:start + np.sum(col_lens)],
+        col_lens
+    )
+
+
+def simulate_in_chunks(simulate_func_nb, target_shape, group_lens, init_cash, call_seq, auto_call_seq,
+                       flex_args, max_orders, max_logs, flex_2d, n_chunks=1, chunk_len=None, parallel=False,
+                       sim_state=None, sparse_signals=None, trades_close=None, seed=None):
+    """Simulate groups in chunks using `simulate_func_nb` and merge the results.
+
+    `simulate_func_nb` must have the signature of `vectorbt.portfolio.nb.simulate_from_orders_nb`
+    or `vectorbt.portfolio.nb.simulate_from_signals_nb`, with `flex_args` being all arguments
+    that utilize flexible broadcasting.
+
+    Each chunk receives a view of the inputs limited to its columns and writes into its own
+    order and log records, which are then shifted to the columns and groups of the chunk.
+    If `max_orders` or `max_logs` is None, defaults to the number of columns in the chunk.
+    See `split_group_chunks` for `n_chunks` and `chunk_len`.
+
+    If `parallel` is True, chunks are simulated concurrently using a thread pool, which works
+    since `simulate_func_nb` releases the GIL. If `chunk_len` is set, the pool is limited to
+    the number of CPUs, such that the memory held by running chunks stays bounded.
+
+    `call_seq` can be a read-only view, in which case each chunk works on a copy of its slice.
+
+    If `sim_state` is not None, each chunk resumes from and updates in-place its slice of `sim_state`.
+
+    If `sparse_signals` is not None, it should be a tuple of sparse entries and exits of type
+    `vectorbt.signals.enums.SparseSignals`, which are passed to each chunk after `sim_state`.
+
+    If `trades_close` is not None, trade records are extracted from the orders of each chunk
+    using `vectorbt.portfolio.nb.orders_to_trades_nb` as soon as the chunk is simulated, with
+    `trades_close` being the two-dimensional reference price. They are merged using `merge_trade_records`
+    and returned as the third element.
+
+    The merged records are identical to those produced by a single run over all columns.
+
+    If `seed` is not None and there are multiple chunks, each chunk seeds the random number
+    generator of numba with `seed` plus the index of the chunk, right before being simulated
+    in its thread. Numba keeps a separate generator state per thread, thus seeding only the
+    calling thread would leave chunks simulated in a pool unseeded.
+
+    !!! note
+        Chunks draw random numbers from different streams, thus results of a run with
+        `reject_prob` above zero depend on chunking, but not on `parallel`."""
+    chunks = split_group_chunks(group_lens, n_chunks=n_chunks, chunk_len=chunk_len)
+    seed_chunks = seed is not None and len(chunks) > 1
+
+    def _simulate_chunk(chunk_idx, chunk):
+        from_group, to_group, from_col, to_col = chunk
+        if seed_chunks:
+            set_seed_nb(seed + chunk_idx)
+        chunk_shape = (target_shape[0], to_col - from_col)
+        col_slice = slice(from_col, to_col)
+        order_records, log_records = simulate_func_nb(
+            chunk_shape,
+            group_lens[from_group:to_group],
+            init_cash[from_group:to_group],
+            np.require(call_seq[:, col_slice], dtype=np.int_, requirements=['W', 'F']),
+            auto_call_seq,
+            *[flex_select_cols(arg, col_slice, flex_2d) for arg in flex_args],
+            chunk_shape[1] if max_orders is None else max_orders,
+            chunk_shape[1] if max_logs is None else max_logs,
+            flex_2d,
+            None if sim_state is None else SimulationState(
+                sim_state.last_cash[from_group:to_group],
+                *[a[col_slice] for a in sim_state[1:]]
+            ),
+            *(() if sparse_signals is None else [select_sparse_cols(a, col_slice) for a in sparse_signals])
+        )
+        if trades_close is not None:
+            trade_records = nb.orders_to_trades_nb(
+                trades_close[:, col_slice],
+                order_records,
+                col_map_nb(order_records['col'], chunk_shape[1])
+            )
+        if from_col > 0:
+            order_records['col'] += from_col
+            log_records['col'] += from_col
+            log_records['group'] += from_group
+            if trades_close is not None:
+                trade_records['col'] += from_col
+        if trades_close is not None:
+            return order_records, log_records, trade_records
+        return order_records, log_records
+
+    if parallel and len(chunks) > 1:
+        max_workers = len(chunks)
+        if chunk_len is not None:
+            max_workers = min(max_workers, os.cpu_count())
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_simulate_chunk, range(len(chunks)), chunks))
+    else:
+        results = list(map(_simulate_chunk, range(len(chunks)), chunks))
+    order_records, log_records = merge_sim_records([r[0] for r in results], [r[1] for r in results])
+    if trades_close is not None:
+        return order_records, log_records, merge_trade_records([r[2] for r in results])
+    return order_records, log_records
+
+
+def sweep_order_func_shard(portfolio_cls, close, order_func_nb, order_args_grid, param_idxs, kwargs):
+    """Run `Portfolio.from_order_func` for each parameter combination in `param_idxs`.
+
+    Meant to be run in a worker process by `Portfolio.from_order_func_sweep`. Arrays in `close`,
+    `order_args_grid` and `kwargs` can be references of type `vectorbt.utils.shm.SharedArray`.
+
+    Returns order records, log records, call sequence and initial cash of each combination.
+    Blocks of shared memory are detached once the shard is done, see `vectorbt.utils.shm.call_attached`."""
+    def _run_shard(close, order_args_grid, kwargs):
+        results = []
+        for k in param_idxs:
+            portfolio = portfolio_cls.from_order_func(close, order_func_nb, *order_args_grid[k], **kwargs)
+            results.append((
+                portfolio.order_records,
+                portfolio.log_records,
+                portfolio.call_seq.values,
+                portfolio._init_cash
+            ))
+        return results
+
+    return call_attached(_run_shard, (close, order_args_grid, kwargs), {})
+
+
+def cast_to_dtype(arg, dtype):
+    """Cast an array-like object to `dtype`, keeping pandas objects as they are."""
+    if checks.is_pandas(arg):
+        return arg.astype(dtype, copy=False)
+    return np.asarray(arg, dtype=dtype)
+
+
+def concat_ragged(arg, lens, dtype=None):
+    """Concatenate an argument of each series in a ragged collection into a flat array.
+
+    `arg` can be a scalar, in which case an array with one element is returned, or a sequence with
+    one element per series, each being either a scalar or an array of the length of its series."""
+    if not isinstance(arg, (list, tuple, np.ndarray, pd.Series)) or (isinstance(arg, np.ndarray) and arg.ndim == 0):
+        return np.array([arg], dtype=dtype)
+    if len(arg) != len(lens):
+        raise ValueError(f"Expected one element per series ({len(lens)}), got {len(arg)}")
+    if isinstance(arg, (np.ndarray, pd.Series)) and np.ndim(arg) == 1:
+        return np.repeat(np.asarray(arg, dtype=dtype), lens)
+    return np.concatenate([
+        np.full(n, a, dtype=dtype) if np.ndim(a) == 0 else np.asarray(a, dtype=dtype).reshape(n)
+        for a, n in zip(arg, lens)
+    ])
+
+
+class PortfolioBatch(Sequence):
+    """Sequence of portfolios simulated by `Portfolio.from_signals_batch`.
+
+    Holds the records of all series back to back and builds the portfolio of a series
+    only once it's accessed, such that the cost of creating a portfolio isn't paid for series
+    that are never looked at."""
+
+    def __init__(self, portfolio_cls, close, offsets, flat_close, order_records, log_records,
+                 order_offsets, log_offsets, init_cash, sim_state, fill_state=False, freq=None, **kwargs):
+        self._portfolio_cls = portfolio_cls
+        self._close = close
+        self._offsets = offsets
+        self._flat_close = flat_close
+        self._order_records = order_records
+        self._log_records = log_records
+        self._order_offsets = order_offsets
+        self._log_offsets = log_offsets
+        self._init_cash = init_cash
+        self._sim_state = sim_state
+        self._fill_state = fill_state
+        self._freq = freq
+        self._kwargs = kwargs
+        self._portfolios = {}
+
+    @property
+    def offsets(self):
+        """Offsets of series in flat arrays, such that series `k` occupies `offsets[k]:offsets[k + 1]`."""
+        return self._offsets
+
+    @property
+    def order_records(self):
+        """Order records of all series, with column being zero."""
+        return self._order_records
+
+    @property
+    def order_offsets(self):
+        """Offsets of series in `PortfolioBatch.order_records`."""
+        return self._order_offsets
+
+    @property
+    def log_records(self):
+        """Log records of all series, with column being zero."""
+        return self._log_records
+
+    @property
+    def log_offsets(self):
+        """Offsets of series in `PortfolioBatch.log_records`."""
+        return self._log_offsets
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self[i] for i in range(*k.indices(len(self)))]
+        if k < 0:
+            k += len(self)
+        if k < 0 or k >= len(self):
+            raise IndexError("Series index out of range")
+        if k not in self._portfolios:
+            self._portfolios[k] = self._build(k)
+        return self._portfolios[k]
+
+    def _build(self, k):
+        """Build the portfolio of series `k`."""
+        start, end = self._offsets[k], self._offsets[k + 1]
+        if checks.is_series(self._close[k]):
+            index = self._close[k].index
+            name = self._close[k].name
+        else:
+            index = pd.RangeIndex(start=0, step=1, stop=end - start)
+            name = None
+        close = pd.Series(self._flat_close[start:end], index=index, name=name)
+        if isinstance(self._init_cash, int):
+            init_cash = self._init_cash
+        else:
+            init_cash = self._init_cash[k:k + 1]
+        portfolio = self._portfolio_cls(
+            ArrayWrapper.from_obj(close, freq=self._freq),
+            close,
+            self._order_records[self._order_offsets[k]:self._order_offsets[k + 1]],
+            self._log_records[self._log_offsets[k]:self._log_offsets[k + 1]],
+            init_cash,
+            False,
+            np.zeros((end - start, 1), dtype=np.int_),
+            sim_state=SimulationState(*[a[k:k + 1] for a in self._sim_state]),
+            **self._kwargs
+        )
+        if self._fill_state:
+            return portfolio.copy(state=portfolio.state)
+        return portfolio
+
+
 def add_returns_methods(func_names):
     """Class decorator to add `vectorbt.returns.accessors.ReturnsAccessor` methods to `Portfolio`."""
 
@@ -458,6 +820,16 @@ class Portfolio(Wrapping):
             Doesn't affect simulation and only used for total profit and market value.
 
             See `Portfolio.fill_close`.
+        sim_state (SimulationState): State at the end of the simulation.
+
+            Required by `Portfolio.append`.
+        state (PortfolioState): Pre-filled state of the portfolio.
+
+            Must correspond to `order_records`. See `Portfolio.state`.
+        trade_records (array_like): A structured NumPy array of trade records.
+
+            Must correspond to `order_records`. If None, trades are extracted from orders
+            once `Portfolio.trades` is accessed. See `emit_trades` in `Portfolio.from_signals`.
 
     !!! note
         Use class methods with `from_` prefix to build a portfolio.
@@ -467,7 +839,8 @@ class Portfolio(Wrapping):
         This class is meant to be immutable. To change any attribute, use `Portfolio.copy`."""
 
     def __init__(self, wrapper, close, order_records, log_records, init_cash,
-                 cash_sharing, call_seq, incl_unrealized=None, use_filled_close=None):
+                 cash_sharing, call_seq, incl_unrealized=None, use_filled_close=None, sim_state=None,
+                 state=None, float_dtype=None, trade_records=None):
         Wrapping.__init__(
             self,
             wrapper,
@@ -478,7 +851,11 @@ class Portfolio(Wrapping):
             cash_sharing=cash_sharing,
             call_seq=call_seq,
             incl_unrealized=incl_unrealized,
-            use_filled_close=use_filled_close
+            use_filled_close=use_filled_close,
+            sim_state=sim_state,
+            state=state,
+            float_dtype=float_dtype,
+            trade_records=trade_records
         )
         # Get defaults
         from vectorbt import settings
@@ -487,9 +864,11 @@ class Portfolio(Wrapping):
             incl_unrealized = settings.portfolio['incl_unrealized']
         if use_filled_close is None:
             use_filled_close = settings.portfolio['use_filled_close']
+        if float_dtype is None:
+            float_dtype = settings.portfolio['float_dtype']
 
         # Store passed arguments
-        self._close = broadcast_to(close, wrapper.dummy(group_by=False))
+        self._close = cast_to_dtype(broadcast_to(close, wrapper.dummy(group_by=False)), float_dtype)
         self._order_records = order_records
         self._log_records = log_records
         self._init_cash = init_cash
@@ -497,6 +876,10 @@ class Portfolio(Wrapping):
         self._call_seq = call_seq
         self._incl_unrealized = incl_unrealized
         self._use_filled_close = use_filled_close
+        self._sim_state = sim_state
+        self._state = state
+        self._float_dtype = np.dtype(float_dtype)
+        self._trade_records = trade_records
 
     def _indexing_func(self, pd_indexing_func, **kwargs):
         """Perform indexing on `Portfolio`."""
@@ -505,11 +888,26 @@ class Portfolio(Wrapping):
         new_close = new_wrapper.wrap(to_2d(self.close, raw=True)[:, col_idxs], group_by=False)
         new_order_records = self.orders._col_idxs_records(col_idxs)
         new_log_records = self.logs._col_idxs_records(col_idxs)
+        if self._trade_records is None:
+            new_trade_records = None
+        else:
+            new_trade_records = self.trades._col_idxs_records(col_idxs)
         if isinstance(self._init_cash, int):
             new_init_cash = self._init_cash
         else:
             new_init_cash = to_1d(self._init_cash, raw=True)[group_idxs if self.cash_sharing else col_idxs]
         new_call_seq = self.call_seq.values[:, col_idxs]
+        if self._sim_state is None:
+            new_sim_state = None
+        else:
+            new_sim_state = SimulationState(
+                self._sim_state.last_cash[group_idxs if self.cash_sharing else col_idxs],
+                *[a[col_idxs] for a in self._sim_state[1:]]
+            )
+        if self._state is None:
+            new_state = None
+        else:
+            new_state = PortfolioState(*[a[:, col_idxs] for a in self._state])
 
         return self.copy(
             wrapper=new_wrapper,
@@ -517,7 +915,10 @@ class Portfolio(Wrapping):
             order_records=new_order_records,
             log_records=new_log_records,
             init_cash=new_init_cash,
-            call_seq=new_call_seq
+            call_seq=new_call_seq,
+            sim_state=new_sim_state,
+            state=new_state,
+            trade_records=new_trade_records
         )
 
     # ############# Class methods ############# #
@@ -587,9 +988,12 @@ class Portfolio(Wrapping):
     def from_signals(cls, close, entries, exits, size=None, size_type=None, direction=None, price=None,
                      fees=None, fixed_fees=None, slippage=None, min_size=None, max_size=None,
                      reject_prob=None, allow_partial=None, raise_reject=None, accumulate=None, log=None,
-                     conflict_mode=None, close_first=None, val_price=None, init_cash=None, cash_sharing=None,
+                     conflict_mode=None, close_first=None, val_price=None, sl_stop=None, sl_trail=None,
+                     tp_stop=None, init_cash=None, cash_sharing=None,
                      call_seq=None, max_orders=None, max_logs=None, seed=None, group_by=None,
-                     broadcast_kwargs=None, wrapper_kwargs=None, freq=None, **kwargs):
+                     parallel=None, n_chunks=None, chunk_len=None, sim_state=None, fill_state=None,
+                     emit_trades=None, float_dtype=None, broadcast_kwargs=None, wrapper_kwargs=None,
+                     freq=None, **kwargs):
         """Simulate portfolio from entry and exit signals.
 
         Starting with initial cash `init_cash`, for each signal in `entries`, enters a long/short position
@@ -605,11 +1009,17 @@ class Portfolio(Wrapping):
                 Will broadcast.
 
                 Will be used for calculating unrealized P&L and portfolio value.
-            entries (array_like of bool): Boolean array of entry signals.
+            entries (array_like of bool or SparseSignals): Boolean array of entry signals.
                 Will broadcast.
 
                 Becomes a long signal if `direction` is `all` or `longonly`, otherwise short.
-            exits (array_like of bool): Boolean array of exit signals.
+
+                Can also be `vectorbt.signals.enums.SparseSignals` of the shape of the broadcast `close`,
+                such as from `vectorbt.signals.accessors.SignalsAccessor.to_sparse`. The simulator then
+                skips rows without signals instead of scanning dense masks, see
+                `vectorbt.portfolio.nb.simulate_from_signals_nb`. If only one of `entries` and `exits`
+                is sparse, the other one gets broadcast and converted.
+            exits (array_like of bool or SparseSignals): Boolean array of exit signals.
                 Will broadcast.
 
                 Becomes a short signal if `direction` is `all` or `longonly`, otherwise long.
@@ -680,6 +1090,19 @@ class Portfolio(Wrapping):
                 Defaults to `price` if set, otherwise to previous `close`.
 
                 See `val_price` in `Portfolio.from_orders`.
+            sl_stop (float or array_like): Stop loss as a fraction of the entry price.
+                Will broadcast.
+
+                Checked against `close` at each row. Once hit, closes the position at `price`.
+                Set to 0 to disable. See `vectorbt.portfolio.nb.simulate_from_signals_nb`.
+            sl_trail (bool or array_like): Whether `sl_stop` should trail the highest (long) or
+                lowest (short) `close` since entry.
+                Will broadcast.
+            tp_stop (float or array_like): Take profit as a fraction of the entry price.
+                Will broadcast.
+
+                Checked against `close` at each row. Once hit, closes the position at `price`.
+                Set to 0 to disable.
             init_cash (InitCashMode, float or array_like of float): Initial capital.
 
                 See `init_cash` in `Portfolio.from_order_func`.
@@ -689,17 +1112,44 @@ class Portfolio(Wrapping):
             call_seq (CallSeqType or array_like of int): Default sequence of calls per row and group.
 
                 See `call_seq` in `Portfolio.from_orders`.
-            max_orders (int): Size of the order records array.
-                Defaults to the number of elements in the broadcasted shape.
+            max_orders (int): Initial size of the order records array.
+                Defaults to the number of columns.
 
-                Set to a lower number if you run out of memory.
-            max_logs (int): Size of the log records array.
-                Defaults to the number of elements in the broadcasted shape if any of the `log` is True,
-                otherwise to 1.
+                The array grows automatically if more orders are filled, and is trimmed to the
+                number of filled orders at the end of the simulation.
+                Set to a higher number to avoid reallocations if the number of orders is known.
+            max_logs (int): Initial size of the log records array.
+                Defaults to the number of columns if any of the `log` is True, otherwise to 1.
 
-                Set to a lower number if you run out of memory.
+                Grows and gets trimmed in the same way as the order records array.
             seed (int): Seed to be set for both `call_seq` and at the beginning of the simulation.
+
+                If columns are split into multiple chunks, each chunk is seeded with `seed`
+                plus its index instead, see `simulate_in_chunks`.
             group_by (any): Group columns. See `vectorbt.base.column_grouper.ColumnGrouper`.
+            parallel (bool): Whether to simulate chunks of columns in parallel.
+
+                See `parallel` in `Portfolio.from_orders`.
+            n_chunks (int): Number of chunks to split columns into if `parallel` is True.
+
+                See `n_chunks` in `Portfolio.from_orders`.
+            chunk_len (int): Maximum number of columns to simulate at once.
+
+                See `chunk_len` in `Portfolio.from_orders`.
+            sim_state (SimulationState): Simulation state to resume from.
+
+                See `sim_state` in `Portfolio.from_orders`.
+            fill_state (bool): Whether to fill `Portfolio.state` right after simulation.
+
+                See `fill_state` in `Portfolio.from_orders`.
+            emit_trades (bool): Whether to extract trade records as part of the simulation.
+
+                Trades of each chunk of columns are extracted right after the chunk is simulated,
+                in the same thread, such that `Portfolio.trades` doesn't need to process all orders
+                once again. See `simulate_in_chunks`.
+            float_dtype (str or numpy.dtype): Float data type of `close`.
+
+                See `float_dtype` in `Portfolio.from_orders`.
             broadcast_kwargs (dict): Keyword arguments passed to `vectorbt.base.reshape_fns.broadcast`.
             wrapper_kwargs (dict): Keyword arguments passed to `vectorbt.base.array_wrapper.ArrayWrapper`.
             freq (any): Index frequency in case `close.index` is not datetime-like.
@@ -819,6 +1269,9 @@ class Portfolio(Wrapping):
         # Get defaults
         from vectorbt import settings
 
+        if float_dtype is None:
+            float_dtype = settings.portfolio['float_dtype']
+        close = cast_to_dtype(close, float_dtype)
         if size is None:
             size = settings.portfolio['size']
         if size_type is None:
@@ -854,6 +1307,12 @@ class Portfolio(Wrapping):
         conflict_mode = convert_str_enum_value(ConflictMode, conflict_mode)
         if close_first is None:
             close_first = settings.portfolio['close_first']
+        if sl_stop is None:
+            sl_stop = settings.portfolio['sl_stop']
+        if sl_trail is None:
+            sl_trail = settings.portfolio['sl_trail']
+        if tp_stop is None:
+            tp_stop = settings.portfolio['tp_stop']
         if val_price is None:
             if price is None:
                 if checks.is_pandas(close):
@@ -886,6 +1345,21 @@ class Portfolio(Wrapping):
             seed = settings.portfolio['seed']
         if seed is not None:
             set_seed(seed)
+        if parallel is None:
+            parallel = settings.portfolio['parallel']
+        if parallel:
+            if n_chunks is None:
+                n_chunks = settings.portfolio['n_chunks']
+            if n_chunks is None:
+                n_chunks = os.cpu_count()
+        else:
+            n_chunks = 1
+        if chunk_len is None:
+            chunk_len = settings.portfolio['chunk_len']
+        if fill_state is None:
+            fill_state = settings.portfolio['fill_state']
+        if emit_trades is None:
+            emit_trades = settings.portfolio['emit_trades']
         if freq is None:
             freq = settings.portfolio['freq']
         if broadcast_kwargs is None:
@@ -895,6 +1369,12 @@ class Portfolio(Wrapping):
         if not wrapper_kwargs.get('group_select', True) and cash_sharing:
             raise ValueError("group_select cannot be disabled if cash_sharing=True")
 
+        if isinstance(entries, SparseSignals) or isinstance(exits, SparseSignals):
+            sparse_signals = (entries, exits)
+            entries = exits = False
+        else:
+            sparse_signals = None
+
         # Broadcast inputs
         # Only close is broadcast, others can remain unchanged thanks to flexible indexing
         broadcastable_args = (
@@ -917,10 +1397,18 @@ class Portfolio(Wrapping):
             log,
             conflict_mode,
             close_first,
-            val_price
+            val_price,
+            sl_stop,
+            sl_trail,
+            tp_stop
         )
         keep_raw = [False] + [True] * (len(broadcastable_args) - 1)
-        broadcast_kwargs = merge_dicts(dict(require_kwargs=dict(requirements='W')), broadcast_kwargs)
+        if chunk_len is not None:
+            # Keep close as a broadcast view, it's not needed for simulation
+            require_kwargs = [dict()] + [dict(requirements='W')] * (len(broadcastable_args) - 1)
+        else:
+            require_kwargs = dict(requirements='W')
+        broadcast_kwargs = merge_dicts(dict(require_kwargs=require_kwargs), broadcast_kwargs)
         broadcasted_args = broadcast(*broadcastable_args, **broadcast_kwargs, keep_raw=keep_raw)
         close = broadcasted_args[0]
         if not checks.is_pandas(close):
@@ -933,29 +1421,54 @@ class Portfolio(Wrapping):
         if checks.is_any_array(call_seq):
             call_seq = nb.require_call_seq(broadcast(call_seq, to_shape=target_shape_2d, to_pd=False))
         else:
-            call_seq = nb.build_call_seq(target_shape_2d, group_lens, call_seq_type=call_seq)
-        if max_orders is None:
-            max_orders = target_shape_2d[0] * target_shape_2d[1]
-        if max_logs is None:
-            max_logs = target_shape_2d[0] * target_shape_2d[1]
+            call_seq = nb.build_call_seq(
+                target_shape_2d,
+                group_lens,
+                call_seq_type=call_seq,
+                lazy=chunk_len is not None and not auto_call_seq
+            )
         if not np.any(log):
             max_logs = 1
+        if sim_state is None:
+            sim_state = nb.init_sim_state_nb(target_shape_2d, init_cash)
+        if sparse_signals is not None:
+            new_sparse_signals = []
+            for sparse in sparse_signals:
+                if isinstance(sparse, SparseSignals):
+                    if tuple(sparse.shape) != target_shape_2d:
+                        raise ValueError(f"Sparse signals must have shape {target_shape_2d}, not {sparse.shape}")
+                    if len(sparse.idxs) != np.sum(sparse.col_lens):
+                        raise ValueError("Sparse signals must have as many indices as the sum of col_lens")
+                else:
+                    sparse = signals_nb.to_sparse_nb(broadcast(
+                        sparse, to_shape=target_shape_2d, to_pd=False, require_kwargs=dict(dtype=np.bool_)))
+                new_sparse_signals.append(sparse)
+            sparse_signals = tuple(new_sparse_signals)
 
         # Perform calculation
-        order_records, log_records = nb.simulate_from_signals_nb(
+        sim_out = simulate_in_chunks(
+            nb.simulate_from_signals_nb,
             target_shape_2d,
             cs_group_lens,  # group only if cash sharing is enabled to speed up
             init_cash,
             call_seq,
             auto_call_seq,
-            *broadcasted_args[1:],
+            broadcasted_args[1:] + (close.values,),
             max_orders,
             max_logs,
-            close.ndim == 2
+            close.ndim == 2,
+            n_chunks=n_chunks,
+            chunk_len=chunk_len,
+            parallel=parallel,
+            sim_state=sim_state,
+            sparse_signals=sparse_signals,
+            trades_close=to_2d(close.values, raw=True) if emit_trades else None,
+            seed=seed
         )
+        order_records, log_records = sim_out[:2]
 
         # Create an instance
-        return cls(
+        portfolio = cls(
             wrapper,
             close,
             order_records,
@@ -963,6 +1476,195 @@ class Portfolio(Wrapping):
             init_cash if init_cash_mode is None else init_cash_mode,
             cash_sharing,
             call_seq,
+            sim_state=sim_state,
+            float_dtype=float_dtype,
+            trade_records=sim_out[2] if emit_trades else None,
+            **kwargs
+        )
+        if fill_state:
+            return portfolio.copy(state=portfolio.state)
+        return portfolio
+
+    @classmethod
+    def from_signals_batch(cls, close, entries, exits, size=None, size_type=None, direction=None, price=None,
+                           fees=None, fixed_fees=None, slippage=None, min_size=None, max_size=None,
+                           reject_prob=None, allow_partial=None, raise_reject=None, accumulate=None, log=None,
+                           conflict_mode=None, close_first=None, val_price=None, sl_stop=None, sl_trail=None,
+                           tp_stop=None, init_cash=None, max_orders=None, max_logs=None, seed=None,
+                           fill_state=None, float_dtype=None, freq=None, **kwargs):
+        """Simulate one portfolio per series from entry and exit signals in a single Numba call.
+
+        Like `Portfolio.from_signals`, but takes a ragged collection of series that may differ
+        in length and index, such as prices of many symbols. Series are concatenated into flat arrays
+        and simulated one after another by `vectorbt.portfolio.nb.simulate_from_signals_ragged_nb`,
+        thus broadcasting and dispatching are paid once rather than per series.
+
+        Args:
+            close (sequence of array_like): One-dimensional reference price of each series.
+
+                If a series is a `pd.Series`, its index and name are used.
+            entries (sequence of array_like): Entry signals of each series.
+            exits (sequence of array_like): Exit signals of each series.
+            init_cash (InitCashMode, float or array_like of float): Initial capital.
+
+                Either one value for all series, or one value per series.
+            max_orders (int): Initial size of the order records array of each series.
+            max_logs (int): Initial size of the log records array of each series.
+
+        Any other argument of `Portfolio.from_signals` that is supported can be either one value for all
+        series or a sequence with one element per series, being either a scalar or an array of the
+        length of its series (see `concat_ragged`).
+
+        Returns `PortfolioBatch` with one portfolio per series, each being equal to that built by
+        `Portfolio.from_signals` on its series.
+
+        For defaults, see `vectorbt.settings.portfolio`.
+
+        ## Example
+
+        ```python-repl
+        >>> import pandas as pd
+        >>> import vectorbt as vbt
+
+        >>> close = [
+        ...     pd.Series([1., 2., 3.], name='a'),
+        ...     pd.Series([3., 2., 1., 2., 3.], name='b')
+        ... ]
+        >>> entries = [[True, False, False], [True, False, True, False, False]]
+        >>> exits = [[False, False, True], [False, True, False, False, True]]
+        >>> portfolios = vbt.Portfolio.from_signals_batch(close, entries, exits, init_cash=[100., 300.])
+        >>> [p.total_profit() for p in portfolios]
+        [200.0, 300.0]
+        ```"""
+        from vectorbt import settings
+
+        if float_dtype is None:
+            float_dtype = settings.portfolio['float_dtype']
+        if size is None:
+            size = settings.portfolio['size']
+        if size_type is None:
+            size_type = settings.portfolio['signal_size_type']
+        size_type = convert_str_enum_value(SizeType, size_type)
+        if direction is None:
+            direction = settings.portfolio['signal_direction']
+        direction = convert_str_enum_value(Direction, direction)
+        if fees is None:
+            fees = settings.portfolio['fees']
+        if fixed_fees is None:
+            fixed_fees = settings.portfolio['fixed_fees']
+        if slippage is None:
+            slippage = settings.portfolio['slippage']
+        if min_size is None:
+            min_size = settings.portfolio['min_size']
+        if max_size is None:
+            max_size = settings.portfolio['max_size']
+        if reject_prob is None:
+            reject_prob = settings.portfolio['reject_prob']
+        if allow_partial is None:
+            allow_partial = settings.portfolio['allow_partial']
+        if raise_reject is None:
+            raise_reject = settings.portfolio['raise_reject']
+        if log is None:
+            log = settings.portfolio['log']
+        if accumulate is None:
+            accumulate = settings.portfolio['accumulate']
+        if conflict_mode is None:
+            conflict_mode = settings.portfolio['conflict_mode']
+        conflict_mode = convert_str_enum_value(ConflictMode, conflict_mode)
+        if close_first is None:
+            close_first = settings.portfolio['close_first']
+        if sl_stop is None:
+            sl_stop = settings.portfolio['sl_stop']
+        if sl_trail is None:
+            sl_trail = settings.portfolio['sl_trail']
+        if tp_stop is None:
+            tp_stop = settings.portfolio['tp_stop']
+        if init_cash is None:
+            init_cash = settings.portfolio['init_cash']
+        init_cash = convert_str_enum_value(InitCashMode, init_cash)
+        if isinstance(init_cash, int) and init_cash in InitCashMode:
+            init_cash_mode = init_cash
+            init_cash = np.inf
+        else:
+            init_cash_mode = None
+        if max_orders is None:
+            max_orders = 1
+        if max_logs is None:
+            max_logs = 1
+        if seed is None:
+            seed = settings.portfolio['seed']
+        if seed is not None:
+            set_seed(seed)
+        if fill_state is None:
+            fill_state = settings.portfolio['fill_state']
+        if freq is None:
+            freq = settings.portfolio['freq']
+
+        # Concatenate inputs
+        lens = np.array([len(c) for c in close])
+        offsets = np.concatenate((np.array([0]), np.cumsum(lens)))
+        flat_close = concat_ragged(close, lens, dtype=float_dtype)
+        if price is None:
+            flat_price = flat_close
+        else:
+            flat_price = concat_ragged(price, lens, dtype=float_dtype)
+        if val_price is None:
+            flat_val_price = flat_price
+        else:
+            flat_val_price = concat_ragged(val_price, lens, dtype=float_dtype)
+        flat_args = (
+            concat_ragged(entries, lens, dtype=np.bool_),
+            concat_ragged(exits, lens, dtype=np.bool_),
+            concat_ragged(size, lens, dtype=np.float_),
+            concat_ragged(size_type, lens, dtype=np.int_),
+            concat_ragged(direction, lens, dtype=np.int_),
+            flat_price,
+            concat_ragged(fees, lens, dtype=np.float_),
+            concat_ragged(fixed_fees, lens, dtype=np.float_),
+            concat_ragged(slippage, lens, dtype=np.float_),
+            concat_ragged(min_size, lens, dtype=np.float_),
+            concat_ragged(max_size, lens, dtype=np.float_),
+            concat_ragged(reject_prob, lens, dtype=np.float_),
+            concat_ragged(allow_partial, lens, dtype=np.bool_),
+            concat_ragged(raise_reject, lens, dtype=np.bool_),
+            concat_ragged(accumulate, lens, dtype=np.bool_),
+            concat_ragged(log, lens, dtype=np.bool_),
+            concat_ragged(conflict_mode, lens, dtype=np.int_),
+            concat_ragged(close_first, lens, dtype=np.bool_),
+            flat_val_price,
+            concat_ragged(sl_stop, lens, dtype=np.float_),
+            concat_ragged(sl_trail, lens, dtype=np.bool_),
+            concat_ragged(tp_stop, lens, dtype=np.float_),
+            flat_close
+        )
+        init_cash = np.require(np.broadcast_to(init_cash, (len(lens),)), dtype=np.float_)
+        sim_state = nb.init_sim_state_nb((0, len(lens)), init_cash)
+
+        # Perform calculation
+        order_records, log_records, order_lens, log_lens = nb.simulate_from_signals_ragged_nb(
+            offsets,
+            init_cash,
+            *flat_args,
+            max_orders,
+            max_logs,
+            sim_state
+        )
+
+        # Create a lazy sequence of instances
+        return PortfolioBatch(
+            cls,
+            close,
+            offsets,
+            flat_close,
+            order_records,
+            log_records,
+            np.concatenate((np.array([0]), np.cumsum(order_lens))),
+            np.concatenate((np.array([0]), np.cumsum(log_lens))),
+            init_cash if init_cash_mode is None else init_cash_mode,
+            sim_state,
+            fill_state=fill_state,
+            freq=freq,
+            float_dtype=float_dtype,
             **kwargs
         )
 
@@ -971,7 +1673,9 @@ class Portfolio(Wrapping):
                     fixed_fees=None, slippage=None, min_size=None, max_size=None, reject_prob=None,
                     allow_partial=None, raise_reject=None, log=None, val_price=None, init_cash=None,
                     cash_sharing=None, call_seq=None, max_orders=None, max_logs=None, seed=None,
-                    group_by=None, broadcast_kwargs=None, wrapper_kwargs=None, freq=None, **kwargs):
+                    group_by=None, parallel=None, n_chunks=None, chunk_len=None, sim_state=None,
+                    fill_state=None, float_dtype=None, broadcast_kwargs=None, wrapper_kwargs=None,
+                    freq=None, **kwargs):
         """Simulate portfolio from orders.
 
         Starting with initial cash `init_cash`, orders the number of shares specified in `size`
@@ -1085,17 +1789,59 @@ class Portfolio(Wrapping):
                         leave them without required funds.
 
                     For more control, use `Portfolio.from_order_func`.
-            max_orders (int): Size of the order records array.
-                Defaults to the number of elements in the broadcasted shape.
+            max_orders (int): Initial size of the order records array.
+                Defaults to the number of columns.
 
-                Set to a lower number if you run out of memory.
-            max_logs (int): Size of the log records array.
-                Defaults to the number of elements in the broadcasted shape if any of the `log` is True,
-                otherwise to 1.
+                The array grows automatically if more orders are filled, and is trimmed to the
+                number of filled orders at the end of the simulation.
+                Set to a higher number to avoid reallocations if the number of orders is known.
+            max_logs (int): Initial size of the log records array.
+                Defaults to the number of columns if any of the `log` is True, otherwise to 1.
 
-                Set to a lower number if you run out of memory.
+                Grows and gets trimmed in the same way as the order records array.
             seed (int): Seed to be set for both `call_seq` and at the beginning of the simulation.
+
+                If columns are split into multiple chunks, each chunk is seeded with `seed`
+                plus its index instead, see `simulate_in_chunks`.
             group_by (any): Group columns. See `vectorbt.base.column_grouper.ColumnGrouper`.
+            parallel (bool): Whether to simulate chunks of columns in parallel.
+
+                Columns are split into chunks that are simulated concurrently on multiple threads,
+                each writing its own order and log records. The records are then merged in column order,
+                such that the result is identical to a serial run. See `simulate_in_chunks`.
+
+                If `max_orders` or `max_logs` is set, it applies to each chunk separately.
+
+                Chunks never split a group, thus groups with `cash_sharing` enabled are simulated
+                concurrently with each other, while columns within a group are still processed
+                sequentially in call sequence order.
+            n_chunks (int): Number of chunks to split columns into if `parallel` is True.
+                Defaults to the number of CPUs.
+            chunk_len (int): Maximum number of columns to simulate at once.
+
+                Splits columns into blocks of `chunk_len` columns (without splitting groups) and
+                simulates them one after another, or concurrently on at most as many threads as
+                there are CPUs if `parallel` is True. Only the records of each block are kept.
+
+                In this mode, neither `close` nor `call_seq` (unless random or auto) are materialized
+                as full arrays but kept as broadcast views, such that peak memory is proportional
+                to `chunk_len` rather than to the full shape. Overrides `n_chunks`.
+            sim_state (SimulationState): Simulation state to resume from.
+
+                Should be of type `vectorbt.portfolio.enums.SimulationState` and match the columns
+                (and groups if `cash_sharing` is True). It's modified in-place, and then stored
+                as `Portfolio.sim_state`. If None, a new state is created from `init_cash`.
+
+                See `Portfolio.append` to continue a simulation on new data.
+            fill_state (bool): Whether to fill `Portfolio.state` right after simulation.
+
+                The state is stored in the portfolio and carried over when indexing and regrouping,
+                such that share and cash series aren't re-computed from order records.
+            float_dtype (str or numpy.dtype): Float data type of `close`.
+
+                Also used by any share, cash, value and return series of the portfolio.
+                Set to `float32` to halve the memory of both simulation and analysis,
+                at the cost of precision. Records keep their data types.
             broadcast_kwargs (dict): Keyword arguments passed to `vectorbt.base.reshape_fns.broadcast`.
             wrapper_kwargs (dict): Keyword arguments passed to `vectorbt.base.array_wrapper.ArrayWrapper`.
             freq (any): Index frequency in case `close.index` is not datetime-like.
@@ -1195,6 +1941,9 @@ class Portfolio(Wrapping):
         # Get defaults
         from vectorbt import settings
 
+        if float_dtype is None:
+            float_dtype = settings.portfolio['float_dtype']
+        close = cast_to_dtype(close, float_dtype)
         if size is None:
             size = settings.portfolio['size']
         if size_type is None:
@@ -1247,6 +1996,19 @@ class Portfolio(Wrapping):
             seed = settings.portfolio['seed']
         if seed is not None:
             set_seed(seed)
+        if parallel is None:
+            parallel = settings.portfolio['parallel']
+        if parallel:
+            if n_chunks is None:
+                n_chunks = settings.portfolio['n_chunks']
+            if n_chunks is None:
+                n_chunks = os.cpu_count()
+        else:
+            n_chunks = 1
+        if chunk_len is None:
+            chunk_len = settings.portfolio['chunk_len']
+        if fill_state is None:
+            fill_state = settings.portfolio['fill_state']
         if freq is None:
             freq = settings.portfolio['freq']
         if broadcast_kwargs is None:
@@ -1276,7 +2038,12 @@ class Portfolio(Wrapping):
             val_price
         )
         keep_raw = [False] + [True] * (len(broadcastable_args) - 1)
-        broadcast_kwargs = merge_dicts(dict(require_kwargs=dict(requirements='W')), broadcast_kwargs)
+        if chunk_len is not None:
+            # Keep close as a broadcast view, it's not needed for simulation
+            require_kwargs = [dict()] + [dict(requirements='W')] * (len(broadcastable_args) - 1)
+        else:
+            require_kwargs = dict(requirements='W')
+        broadcast_kwargs = merge_dicts(dict(require_kwargs=require_kwargs), broadcast_kwargs)
         broadcasted_args = broadcast(*broadcastable_args, **broadcast_kwargs, keep_raw=keep_raw)
         close = broadcasted_args[0]
         if not checks.is_pandas(close):
@@ -1289,29 +2056,38 @@ class Portfolio(Wrapping):
         if checks.is_any_array(call_seq):
             call_seq = nb.require_call_seq(broadcast(call_seq, to_shape=target_shape_2d, to_pd=False))
         else:
-            call_seq = nb.build_call_seq(target_shape_2d, group_lens, call_seq_type=call_seq)
-        if max_orders is None:
-            max_orders = target_shape_2d[0] * target_shape_2d[1]
-        if max_logs is None:
-            max_logs = target_shape_2d[0] * target_shape_2d[1]
+            call_seq = nb.build_call_seq(
+                target_shape_2d,
+                group_lens,
+                call_seq_type=call_seq,
+                lazy=chunk_len is not None and not auto_call_seq
+            )
         if not np.any(log):
             max_logs = 1
+        if sim_state is None:
+            sim_state = nb.init_sim_state_nb(target_shape_2d, init_cash)
 
         # Perform calculation
-        order_records, log_records = nb.simulate_from_orders_nb(
+        order_records, log_records = simulate_in_chunks(
+            nb.simulate_from_orders_nb,
             target_shape_2d,
             cs_group_lens,  # group only if cash sharing is enabled to speed up
             init_cash,
             call_seq,
             auto_call_seq,
-            *broadcasted_args[1:],
+            broadcasted_args[1:],
             max_orders,
             max_logs,
-            close.ndim == 2
+            close.ndim == 2,
+            n_chunks=n_chunks,
+            chunk_len=chunk_len,
+            parallel=parallel,
+            sim_state=sim_state,
+            seed=seed
         )
 
         # Create an instance
-        return cls(
+        portfolio = cls(
             wrapper,
             close,
             order_records,
@@ -1319,8 +2095,13 @@ class Portfolio(Wrapping):
             init_cash if init_cash_mode is None else init_cash_mode,
             cash_sharing,
             call_seq,
+            sim_state=sim_state,
+            float_dtype=float_dtype,
             **kwargs
         )
+        if fill_state:
+            return portfolio.copy(state=portfolio.state)
+        return portfolio
 
     @classmethod
     def from_order_func(cls, close, order_func_nb, *order_args, target_shape=None, keys=None,
@@ -1328,7 +2109,9 @@ class Portfolio(Wrapping):
                         prep_func_nb=None, prep_args=None, group_prep_func_nb=None, group_prep_args=None,
                         row_prep_func_nb=None, row_prep_args=None, segment_prep_func_nb=None,
                         segment_prep_args=None, row_wise=None, max_orders=None, max_logs=None,
-                        seed=None, group_by=None, broadcast_kwargs=None, wrapper_kwargs=None, freq=None, **kwargs):
+                        seed=None, group_by=None, parallel=None, n_chunks=None, fill_state=None,
+                        use_sim_cache=None, sim_cache_dir=None, float_dtype=None, broadcast_kwargs=None,
+                        wrapper_kwargs=None, freq=None, **kwargs):
         """Build portfolio from a custom order function.
 
         For details, see `vectorbt.portfolio.nb.simulate_nb`.
@@ -1396,16 +2179,45 @@ class Portfolio(Wrapping):
             row_wise (bool): Whether to iterate over rows rather than columns/groups.
 
                 See `vectorbt.portfolio.nb.simulate_row_wise_nb`.
-            max_orders (int): Size of the order records array.
-                Defaults to the number of elements in the broadcasted shape.
+            max_orders (int): Initial size of the order records array.
+                Defaults to the number of columns.
 
-                Set to a lower number if you run out of memory.
-            max_logs (int): Size of the log records array.
-                Defaults to the number of elements in the broadcasted shape.
+                See `max_orders` in `Portfolio.from_orders`.
+            max_logs (int): Initial size of the log records array.
+                Defaults to the number of columns.
 
-                Set to a lower number if you run out of memory.
+                See `max_logs` in `Portfolio.from_orders`.
             seed (int): Seed to be set for both `call_seq` and at the beginning of the simulation.
+
+                If columns are split into multiple chunks, each chunk is seeded with `seed`
+                plus its index instead, see `simulate_in_chunks`.
             group_by (any): Group columns. See `vectorbt.base.column_grouper.ColumnGrouper`.
+            parallel (bool): Whether to simulate chunks of groups in parallel.
+
+                Groups are split into chunks that are simulated concurrently on multiple threads
+                by passing `from_group` and `to_group` to the simulator, such that columns and groups
+                keep their global indices in all contexts. Columns within a group are still processed
+                sequentially, thus it works with `cash_sharing` as well. The records are merged in
+                column order and are identical to those of a serial run.
+
+                Functions must not depend on the state of groups in other chunks: `prep_func_nb`
+                is called once per chunk and each chunk only sees its own order and log records.
+            n_chunks (int): Number of chunks to split groups into if `parallel` is True.
+                Defaults to the number of CPUs.
+            fill_state (bool): Whether to fill `Portfolio.state` right after simulation.
+
+                See `fill_state` in `Portfolio.from_orders`.
+            float_dtype (str or numpy.dtype): Float data type of `close`.
+
+                See `float_dtype` in `Portfolio.from_orders`.
+            use_sim_cache (bool): Whether to run a simulator specialized to the passed functions
+                and cached on disk.
+
+                Without it, the simulator is compiled anew for each new function object, even if
+                its code hasn't changed. See `vectorbt.portfolio.sim_cache`.
+            sim_cache_dir (str): Directory of the simulator cache.
+
+                See `vectorbt.portfolio.sim_cache.get_cache_dir`.
             broadcast_kwargs (dict): Keyword arguments passed to `vectorbt.base.reshape_fns.broadcast`.
             wrapper_kwargs (dict): Keyword arguments passed to `vectorbt.base.array_wrapper.ArrayWrapper`.
             freq (any): Index frequency in case `close.index` is not datetime-like.
@@ -1564,10 +2376,13 @@ class Portfolio(Wrapping):
         # Get defaults
         from vectorbt import settings
 
+        if float_dtype is None:
+            float_dtype = settings.portfolio['float_dtype']
         if not checks.is_pandas(close):
             if not checks.is_any_array(close):
                 close = np.asarray(close)
             close = pd.Series(close) if close.ndim == 1 else pd.DataFrame(close)
+        close = cast_to_dtype(close, float_dtype)
         if target_shape is None:
             target_shape = close.shape
         if init_cash is None:
@@ -1595,6 +2410,19 @@ class Portfolio(Wrapping):
             seed = settings.portfolio['seed']
         if seed is not None:
             set_seed(seed)
+        if fill_state is None:
+            fill_state = settings.portfolio['fill_state']
+        if use_sim_cache is None:
+            use_sim_cache = settings.portfolio['use_sim_cache']
+        if parallel is None:
+            parallel = settings.portfolio['parallel']
+        if parallel:
+            if n_chunks is None:
+                n_chunks = settings.portfolio['n_chunks']
+            if n_chunks is None:
+                n_chunks = os.cpu_count()
+        else:
+            n_chunks = 1
         if freq is None:
             freq = settings.portfolio['freq']
         if broadcast_kwargs is None:
@@ -1637,9 +2465,9 @@ class Portfolio(Wrapping):
         else:
             call_seq = nb.build_call_seq(target_shape_2d, group_lens, call_seq_type=call_seq)
         if max_orders is None:
-            max_orders = target_shape_2d[0] * target_shape_2d[1]
+            max_orders = target_shape_2d[1]
         if max_logs is None:
-            max_logs = target_shape_2d[0] * target_shape_2d[1]
+            max_logs = target_shape_2d[1]
 
         # Prepare arguments
         if prep_func_nb is None:
@@ -1661,48 +2489,86 @@ class Portfolio(Wrapping):
 
         # Perform calculation
         if row_wise:
-            order_records, log_records = nb.simulate_row_wise_nb(
-                target_shape_2d,
-                to_2d(close, raw=True),
-                group_lens,
-                init_cash,
-                cash_sharing,
-                call_seq,
-                active_mask,
-                prep_func_nb,
-                prep_args,
-                row_prep_func_nb,
-                row_prep_args,
-                segment_prep_func_nb,
-                segment_prep_args,
-                order_func_nb,
-                order_args,
-                max_orders,
-                max_logs
-            )
+            stage_prep_func_nb, stage_prep_args = row_prep_func_nb, row_prep_args
         else:
-            order_records, log_records = nb.simulate_nb(
-                target_shape_2d,
-                to_2d(close, raw=True),
-                group_lens,
-                init_cash,
-                cash_sharing,
-                call_seq,
-                active_mask,
+            stage_prep_func_nb, stage_prep_args = group_prep_func_nb, group_prep_args
+        if use_sim_cache:
+            from vectorbt.portfolio.sim_cache import get_specialized_nb
+
+            specialized_nb = get_specialized_nb(
+                row_wise,
                 prep_func_nb,
-                prep_args,
-                group_prep_func_nb,
-                group_prep_args,
+                stage_prep_func_nb,
                 segment_prep_func_nb,
-                segment_prep_args,
                 order_func_nb,
-                order_args,
-                max_orders,
-                max_logs
+                cache_dir=sim_cache_dir
             )
 
+            def _simulate_chunk(chunk):
+                return specialized_nb(
+                    target_shape_2d,
+                    to_2d(close, raw=True),
+                    group_lens,
+                    init_cash,
+                    cash_sharing,
+                    call_seq,
+                    active_mask,
+                    prep_args,
+                    stage_prep_args,
+                    segment_prep_args,
+                    order_args,
+                    max_orders,
+                    max_logs,
+                    None,
+                    chunk[0],
+                    chunk[1]
+                )
+        else:
+            simulate_func_nb = nb.simulate_row_wise_nb if row_wise else nb.simulate_nb
+
+            def _simulate_chunk(chunk):
+                return simulate_func_nb(
+                    target_shape_2d,
+                    to_2d(close, raw=True),
+                    group_lens,
+                    init_cash,
+                    cash_sharing,
+                    call_seq,
+                    active_mask,
+                    prep_func_nb,
+                    prep_args,
+                    stage_prep_func_nb,
+                    stage_prep_args,
+                    segment_prep_func_nb,
+                    segment_prep_args,
+                    order_func_nb,
+                    order_args,
+                    max_orders,
+                    max_logs,
+                    None,
+                    chunk[0],
+                    chunk[1]
+                )
+
+        chunks = split_group_chunks(group_lens, n_chunks=n_chunks)
+        if len(chunks) > 1:
+            def _simulate_seeded_chunk(chunk_idx, chunk):
+                # Numba's random state is per thread, seed it in the worker (see simulate_in_chunks)
+                if seed is not None:
+                    set_seed_nb(seed + chunk_idx)
+                return _simulate_chunk(chunk)
+
+            with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                results = list(executor.map(_simulate_seeded_chunk, range(len(chunks)), chunks))
+        else:
+            results = list(map(_simulate_chunk, chunks))
+        order_records, log_records = merge_sim_records([r[0] for r in results], [r[1] for r in results])
+        if row_wise and len(chunks) > 1:
+            # Restore the row-major order of a serial run
+            order_records, log_records = sort_sim_records_by_row(order_records, log_records)
+
         # Create an instance
-        return cls(
+        portfolio = cls(
             wrapper,
             close,
             order_records,
@@ -1710,9 +2576,330 @@ class Portfolio(Wrapping):
             init_cash if init_cash_mode is None else init_cash_mode,
             cash_sharing,
             call_seq,
+            float_dtype=float_dtype,
+            **kwargs
+        )
+        if fill_state:
+            return portfolio.copy(state=portfolio.state)
+        return portfolio
+
+    @classmethod
+    def warmup_order_func(cls, close, order_func_nb, *order_args, n_rows=2, target_shape=None,
+                          call_seq=None, active_mask=None, **kwargs):
+        """Compile the simulator specialized to the passed functions and store it on disk.
+
+        Runs `Portfolio.from_order_func` with `use_sim_cache=True` on the first `n_rows` of `close`,
+        such that other processes calling `Portfolio.from_order_func` with the same functions,
+        argument types and `use_sim_cache=True` load the compiled simulator instead of compiling it.
+
+        Arguments should be of the same types as in the actual run. Apart from `close`, `target_shape`,
+        `call_seq` and `active_mask`, they are passed as-is, thus any array indexed by row should have at least
+        `n_rows` rows. Returns the resulting (truncated) portfolio."""
+        if checks.is_pandas(close):
+            close = close.iloc[:n_rows]
+        else:
+            close = np.asarray(close)[:n_rows]
+        if target_shape is not None:
+            target_shape = (min(n_rows, target_shape[0]),) + tuple(target_shape[1:])
+        if checks.is_any_array(call_seq):
+            call_seq = np.asarray(call_seq)[:n_rows]
+        if checks.is_any_array(active_mask):
+            active_mask = np.asarray(active_mask)[:n_rows]
+        return cls.from_order_func(
+            close,
+            order_func_nb,
+            *order_args,
+            target_shape=target_shape,
+            call_seq=call_seq,
+            active_mask=active_mask,
+            use_sim_cache=True,
             **kwargs
         )
 
+    @classmethod
+    def from_order_func_sweep(cls, close, order_func_nb, order_args_grid, keys=None, group_by=None,
+                              cash_sharing=None, n_workers=None, n_shards=None, mp_context=None,
+                              shm_kwargs=None, fill_state=None, float_dtype=None, incl_unrealized=None, use_filled_close=None,
+                              wrapper_kwargs=None, freq=None, **kwargs):
+        """Run `Portfolio.from_order_func` for each parameter combination in a process pool
+        and merge the results into one portfolio.
+
+        Args:
+            close (array_like): Reference price, such as close.
+
+                Shared by all parameter combinations.
+            order_func_nb (callable): Order generation function.
+            order_args_grid (sequence): Parameter grid.
+
+                Each element is a tuple with `*order_args` of one parameter combination.
+                Other elements are packed into a tuple with one element.
+            keys (index_like): Index of parameter combinations.
+
+                Defaults to a range named `param_idx`.
+            group_by (any): Group columns of `close`.
+
+                Grouping is applied within each parameter combination. If None, each parameter
+                combination forms one group, which also defines the scope of `cash_sharing`.
+            cash_sharing (bool): Whether to share cash within the same group.
+            n_workers (int): Number of worker processes.
+
+                Defaults to the number of CPUs.
+            n_shards (int): Number of shards the parameter grid is split into.
+
+                Each shard is one task in the pool. Defaults to `n_workers`.
+            mp_context (str or multiprocessing context): Context passed to `concurrent.futures.ProcessPoolExecutor`.
+
+                See `vectorbt.utils.shm.get_mp_context`.
+            shm_kwargs (dict): Keyword arguments passed to `vectorbt.utils.shm.shared_arrays`.
+            fill_state (bool): See `Portfolio.from_order_func`.
+            float_dtype (str or numpy.dtype): See `Portfolio.from_order_func`.
+            incl_unrealized (bool): See `Portfolio.__init__`.
+            use_filled_close (bool): See `Portfolio.__init__`.
+            wrapper_kwargs (dict): Keyword arguments passed to `vectorbt.base.array_wrapper.ArrayWrapper`.
+            freq (any): Index frequency in case `close.index` is not datetime-like.
+            **kwargs: Keyword arguments passed to `Portfolio.from_order_func`.
+
+        `close` and all arrays in `order_args_grid` and `kwargs` are copied once into shared memory
+        (see `vectorbt.utils.shm`), thus workers access them without pickling. Each worker simulates
+        the combinations of its shard one after another and sends back order and log records only.
+
+        The returned portfolio has `close` tiled once per parameter combination, with `keys`
+        as the top-most column level.
+
+        !!! note
+            Functions are pickled and sent to the workers. Workers aren't forked by default,
+            thus the simulator is compiled in each worker. Use `use_sim_cache=True` or
+            `Portfolio.warmup_order_func` to compile it only once.
+
+            Unlike `Portfolio.from_order_func`, `close` is not broadcast to `target_shape`.
+
+        ## Example
+
+        ```python-repl
+        >>> import itertools
+        >>> import pandas as pd
+        >>> from numba import njit
+        >>> import vectorbt as vbt
+        >>> from vectorbt.portfolio.nb import create_order_nb
+
+        >>> @njit
+        ... def order_func_nb(oc, size, every):
+        ...     if oc.i % every == 0:
+        ...         return create_order_nb(size=size, price=oc.close[oc.i, oc.col])
+        ...     return create_order_nb(size=0., price=oc.close[oc.i, oc.col])
+
+        >>> close = pd.Series([1, 2, 3, 4, 5])
+        >>> grid = list(itertools.product([10., 20.], [1, 2]))
+        >>> portfolio = vbt.Portfolio.from_order_func_sweep(
+        ...     close, order_func_nb, grid,
+        ...     keys=pd.MultiIndex.from_tuples(grid, names=['size', 'every']))
+
+        >>> portfolio.shares().iloc[-1]
+        size  every
+        10.0  1        40.000000
+              2        30.000000
+        20.0  1        53.333333
+              2        44.000000
+        Name: 4, dtype: float64
+        ```
+        """
+        # Get defaults
+        from vectorbt import settings
+
+        if float_dtype is None:
+            float_dtype = settings.portfolio['float_dtype']
+        if not checks.is_pandas(close):
+            if not checks.is_any_array(close):
+                close = np.asarray(close)
+            close = pd.Series(close) if close.ndim == 1 else pd.DataFrame(close)
+        close = cast_to_dtype(close, float_dtype)
+        order_args_grid = [args if isinstance(args, tuple) else (args,) for args in order_args_grid]
+        n_params = len(order_args_grid)
+        if n_params == 0:
+            raise ValueError("order_args_grid cannot be empty")
+        if keys is None:
+            keys = pd.Index(np.arange(n_params), name='param_idx')
+        if not isinstance(keys, pd.Index):
+            keys = pd.Index(keys)
+        if len(keys) != n_params:
+            raise ValueError("keys and order_args_grid must have the same length")
+        if cash_sharing is None:
+            cash_sharing = settings.portfolio['cash_sharing']
+        if fill_state is None:
+            fill_state = settings.portfolio['fill_state']
+        if freq is None:
+            freq = settings.portfolio['freq']
+        if wrapper_kwargs is None:
+            wrapper_kwargs = {}
+        if n_workers is None:
+            n_workers = os.cpu_count()
+        if n_shards is None:
+            n_shards = n_workers
+        mp_context = get_mp_context(mp_context)
+        if shm_kwargs is None:
+            shm_kwargs = {}
+
+        # Group columns within each parameter combination
+        close_2d = to_2d(close, raw=True)
+        n_cols = close_2d.shape[1]
+        base_wrapper = ArrayWrapper.from_obj(close, group_by=True if group_by is None else group_by)
+        groups, group_columns = base_wrapper.grouper.get_groups_and_columns()
+        n_groups = len(group_columns)
+        param_index = index_fns.repeat_index(keys, n_cols, ignore_default=False)
+        if group_by is None:
+            new_group_by = param_index
+        else:
+            new_group_by = index_fns.stack_indexes([
+                param_index,
+                index_fns.tile_index(group_columns[groups], n_params, ignore_default=False)
+            ], drop_redundant=False)
+
+        # Run shards in a process pool
+        kwargs = merge_dicts(kwargs, dict(
+            group_by=groups,
+            cash_sharing=cash_sharing,
+            fill_state=False,
+            float_dtype=float_dtype
+        ))
+        shards = [shard for shard in np.array_split(np.arange(n_params), n_shards) if len(shard) > 0]
+        shared_obj = (close_2d, order_args_grid, kwargs)
+        with shared_arrays(shared_obj, **shm_kwargs) as (shared_close, shared_grid, shared_kwargs):
+            with ProcessPoolExecutor(max_workers=n_workers, mp_context=mp_context) as executor:
+                futures = [executor.submit(
+                    sweep_order_func_shard,
+                    cls,
+                    shared_close,
+                    order_func_nb,
+                    shared_grid,
+                    shard,
+                    shared_kwargs
+                ) for shard in shards]
+                results = [result for future in futures for result in future.result()]
+
+        # Merge results
+        order_records_list = []
+        log_records_list = []
+        for k, (order_records, log_records, _, _) in enumerate(results):
+            order_records['col'] += k * n_cols
+            log_records['col'] += k * n_cols
+            log_records['group'] += k * n_groups
+            order_records_list.append(order_records)
+            log_records_list.append(log_records)
+        order_records, log_records = merge_sim_records(order_records_list, log_records_list)
+        call_seq = np.column_stack([result[2] for result in results])
+        init_cash = results[0][3]
+        if checks.is_any_array(init_cash):
+            init_cash = np.concatenate([result[3] for result in results])
+
+        # Create an instance
+        close = close.vbt.tile(n_params, keys=keys)
+        wrapper = ArrayWrapper.from_obj(close, freq=freq, group_by=new_group_by, **wrapper_kwargs)
+        portfolio = cls(
+            wrapper,
+            close,
+            order_records,
+            log_records,
+            init_cash,
+            cash_sharing,
+            call_seq,
+            incl_unrealized=incl_unrealized,
+            use_filled_close=use_filled_close,
+            float_dtype=float_dtype
+        )
+        if fill_state:
+            return portfolio.copy(state=portfolio.state)
+        return portfolio
+
+    def append(self, close, entries, exits, **kwargs):
+        """Simulate new rows from entry and exit signals and append them to this portfolio.
+
+        Resumes the simulation from `Portfolio.sim_state` using `Portfolio.from_signals`, thus
+        only new rows are simulated. `close`, `entries` and `exits` should have the same columns
+        as this portfolio, while the index of `close` should continue the index of this portfolio.
+
+        Grouping, cash sharing, initial cash and frequency are taken from this portfolio.
+        Other keyword arguments such as `size` and `fees` are passed to `Portfolio.from_signals`
+        and should be the same as those used to build this portfolio.
+
+        The returned portfolio is the same as if the simulation was run on the whole data at once.
+
+        ## Example
+
+        ```python-repl
+        >>> import pandas as pd
+        >>> import vectorbt as vbt
+
+        >>> close = pd.Series([1, 2, 3, 4, 5])
+        >>> entries = pd.Series([True, False, False, True, False])
+        >>> exits = pd.Series([False, False, True, False, False])
+        >>> portfolio = vbt.Portfolio.from_signals(close[:3], entries[:3], exits[:3])
+        >>> portfolio = portfolio.append(close[3:], entries[3:], exits[3:])
+        >>> portfolio.shares()
+        0    100.0
+        1    100.0
+        2      0.0
+        3     75.0
+        4     75.0
+        dtype: float64
+        ```"""
+        if self.sim_state is None:
+            raise ValueError("Portfolio has no simulation state to resume from")
+        checks.assert_type(close, (pd.Series, pd.DataFrame))
+
+        new_portfolio = self.from_signals(
+            close,
+            entries,
+            exits,
+            **merge_dicts(dict(
+                init_cash=self._init_cash,
+                cash_sharing=self.cash_sharing,
+                group_by=self.wrapper.grouper.group_by,
+                freq=self.wrapper.freq,
+                sim_state=SimulationState(*[np.copy(a) for a in self.sim_state])
+            ), kwargs)
+        )
+        checks.assert_index_equal(new_portfolio.wrapper.columns, self.wrapper.columns)
+
+        # Shift new records to follow the old ones
+        n_rows = self.wrapper.shape[0]
+        new_order_records = new_portfolio.order_records.copy()
+        new_order_records['idx'] += n_rows
+        new_log_records = new_portfolio.log_records.copy()
+        new_log_records['idx'] += n_rows
+        filled_mask = new_log_records['order_id'] != -1
+        new_log_records['order_id'][filled_mask] += len(self.order_records)
+        order_records = np.concatenate((self.order_records, new_order_records))
+        log_records = np.concatenate((self.log_records, new_log_records))
+
+        # Records are simulated group by group, restore this order
+        cs_group_lens = self.wrapper.grouper.get_group_lens(group_by=None if self.cash_sharing else False)
+        col_to_group = np.repeat(np.arange(len(cs_group_lens)), cs_group_lens)
+        order_idxs = np.argsort(col_to_group[order_records['col']], kind='stable')
+        new_order_ids = np.empty(len(order_idxs), dtype=np.int_)
+        new_order_ids[order_idxs] = np.arange(len(order_idxs))
+        order_records = order_records[order_idxs]
+        order_records['id'] = np.arange(len(order_records))
+        log_records = log_records[np.argsort(col_to_group[log_records['col']], kind='stable')]
+        log_records['id'] = np.arange(len(log_records))
+        filled_mask = log_records['order_id'] != -1
+        log_records['order_id'][filled_mask] = new_order_ids[log_records['order_id'][filled_mask]]
+
+        new_wrapper = self.wrapper.copy(index=self.wrapper.index.append(new_portfolio.wrapper.index))
+        new_close = new_wrapper.wrap(np.concatenate((
+            to_2d(self.close, raw=True),
+            to_2d(new_portfolio.close, raw=True)
+        )), group_by=False)
+        return self.copy(
+            wrapper=new_wrapper,
+            close=new_close,
+            order_records=order_records,
+            log_records=log_records,
+            call_seq=np.concatenate((self._call_seq, new_portfolio._call_seq)),
+            sim_state=new_portfolio.sim_state,
+            state=None,
+            trade_records=None
+        )
+
     # ############# Properties ############# #
 
     @property
@@ -1755,6 +2942,20 @@ class Portfolio(Wrapping):
         """Whether to forward-backward fill NaN values in `Portfolio.close`."""
         return self._use_filled_close
 
+    @property
+    def sim_state(self):
+        """Simulation state of type `vectorbt.portfolio.enums.SimulationState` to resume from.
+
+        None if the portfolio wasn't simulated with `Portfolio.from_signals` or `Portfolio.from_orders`."""
+        return self._sim_state
+
+    @property
+    def float_dtype(self):
+        """Data type of `Portfolio.close` and of float series derived from it and from order records.
+
+        Records keep their data types."""
+        return self._float_dtype
+
     # ############# Reference price ############# #
 
     @property
@@ -1771,19 +2972,24 @@ class Portfolio(Wrapping):
             close = generic_nb.ffill_nb(close)
         if bfill and np.any(np.isnan(close[0, :])):
             close = generic_nb.ffill_nb(close[::-1, :])[::-1, :]
+        close = close.astype(self.float_dtype, copy=False)
         return self.wrapper.wrap(close, group_by=False, **merge_dicts({}, wrap_kwargs))
 
     # ############# Records ############# #
 
     @property
     def order_records(self):
-        """A structured NumPy array of order records."""
+        """A structured NumPy array of order records.
+
+        Converted lazily if stored in columnar format."""
+        if isinstance(self._order_records, ColumnarArray):
+            return self._order_records.to_structured()
         return self._order_records
 
     @cached_property
     def orders(self):
         """`Portfolio.get_orders` with default arguments."""
-        return Orders(self.wrapper, self.order_records, self.close)
+        return Orders(self.wrapper, self._order_records, self.close)
 
     def get_orders(self, group_by=None):
         """Get order records.
@@ -1793,13 +2999,17 @@ class Portfolio(Wrapping):
 
     @property
     def log_records(self):
-        """A structured NumPy array of log records."""
+        """A structured NumPy array of log records.
+
+        Converted lazily if stored in columnar format."""
+        if isinstance(self._log_records, ColumnarArray):
+            return self._log_records.to_structured()
         return self._log_records
 
     @cached_property
     def logs(self):
         """`Portfolio.get_logs` with default arguments."""
-        return Logs(self.wrapper, self.log_records)
+        return Logs(self.wrapper, self._log_records)
 
     def get_logs(self, group_by=None):
         """Get log records.
@@ -1809,7 +3019,11 @@ class Portfolio(Wrapping):
 
     @cached_property
     def trades(self):
-        """`Portfolio.get_trades` with default arguments."""
+        """`Portfolio.get_trades` with default arguments.
+
+        Uses trade records passed as `trade_records`, if any."""
+        if self._trade_records is not None:
+            return Trades(self.wrapper, self._trade_records, self.close)
         return Trades.from_orders(self.orders)
 
     def get_trades(self, group_by=None):
@@ -1843,26 +3057,49 @@ class Portfolio(Wrapping):
         `**kwargs` are passed to `Portfolio.value`."""
         return Drawdowns.from_ts(self.value(**kwargs), freq=self.wrapper.freq)
 
+    # ############# State ############# #
+
+    @cached_property
+    def state(self):
+        """State of type `vectorbt.portfolio.enums.PortfolioState`.
+
+        Share flow, shares and cash flow per column, filled by `vectorbt.portfolio.nb.fill_state_nb`
+        in a single pass over order records. Serves as a base for share, cash, value and return series.
+
+        If the portfolio was created with `fill_state=True`, the state is stored in the portfolio
+        and gets carried over when indexing and regrouping. Otherwise, it's filled on first access."""
+        if self._state is not None:
+            return self._state
+        return nb.fill_state_nb(
+            self.wrapper.shape_2d,
+            self.orders.values,
+            self.orders.col_mapper.col_map,
+            self.float_dtype.type
+        )
+
     # ############# Shares ############# #
 
     @cached_method
     def share_flow(self, direction='all', wrap_kwargs=None):
         """Get share flow series per column."""
         direction = convert_str_enum_value(Direction, direction)
-        share_flow = nb.share_flow_nb(
-            self.wrapper.shape_2d,
-            self.orders.values,
-            self.orders.col_mapper.col_map,
-            direction
-        )
+        if direction == Direction.All:
+            share_flow = self.state.share_flow
+        else:
+            share_flow = nb.share_flow_nb(
+                self.wrapper.shape_2d,
+                self.orders.values,
+                self.orders.col_mapper.col_map,
+                direction,
+                self.float_dtype.type
+            )
         return self.wrapper.wrap(share_flow, group_by=False, **merge_dicts({}, wrap_kwargs))
 
     @cached_method
     def shares(self, direction='all', wrap_kwargs=None):
         """Get share series per column."""
         direction = convert_str_enum_value(Direction, direction)
-        share_flow = to_2d(self.share_flow(direction='all'), raw=True)
-        shares = nb.shares_nb(share_flow)
+        shares = self.state.shares
         if direction == Direction.LongOnly:
             shares = np.where(shares > 0, shares, 0.)
         if direction == Direction.ShortOnly:
@@ -1908,12 +3145,15 @@ class Portfolio(Wrapping):
             cash_flow = to_2d(self.cash_flow(group_by=False), raw=True)
             group_lens = self.wrapper.grouper.get_group_lens(group_by=group_by)
             cash_flow = nb.cash_flow_grouped_nb(cash_flow, group_lens)
+        elif short_cash:
+            cash_flow = self.state.cash_flow
         else:
             cash_flow = nb.cash_flow_nb(
                 self.wrapper.shape_2d,
                 self.orders.values,
                 self.orders.col_mapper.col_map,
-                short_cash
+                short_cash,
+                self.float_dtype.type
             )
         return self.wrapper.wrap(cash_flow, group_by=group_by, **merge_dicts({}, wrap_kwargs))
 
@@ -2156,7 +3396,9 @@ class Portfolio(Wrapping):
 
         !!! note
             Use `column` only if caching is enabled, otherwise it may re-compute the same
-            objects multiple times."""
+            objects multiple times.
+
+            For many columns, consider `Portfolio.fused_stats`."""
         if self.wrapper.freq is None:
             raise ValueError("Couldn't parse the frequency of index. You must set `freq`.")
 
@@ -2219,6 +3461,48 @@ class Portfolio(Wrapping):
             return agg_stats_sr
         return stats_df
 
+    @cached_method
+    def fused_stats(self, group_by=None, incl_unrealized=None, year_freq=None, risk_free=0.,
+                    required_return=0., ddof=1, raw=False):
+        """Compute the main statistics per column/group using a single Numba kernel.
+
+        A fast alternative to `Portfolio.stats` with `agg_func=None` for large numbers of columns.
+        Only `Portfolio.value`, `Portfolio.total_profit` and trade records are computed, the rest
+        is done by `vectorbt.portfolio.nb.stats_nb`. Ratios are annualized using
+        `year_freq` (see `vectorbt.returns.accessors.ReturnsAccessor`).
+
+        Returns a DataFrame with one row per column/group and fields of
+        `vectorbt.portfolio.enums.stats_dt` as columns, or the structured array itself if `raw` is True.
+
+        !!! note
+            Drawdown, total return and win rate are returned as fractions rather than percentages."""
+        from vectorbt import settings
+
+        if self.wrapper.freq is None:
+            raise ValueError("Couldn't parse the frequency of index. You must set `freq`.")
+        if incl_unrealized is None:
+            incl_unrealized = self.incl_unrealized
+        if year_freq is None:
+            year_freq = settings.returns['year_freq']
+        ann_factor = to_timedelta(year_freq) / self.wrapper.freq
+
+        trades = self.get_trades(group_by=group_by)
+        stats_arr = nb.stats_nb(
+            to_2d(self.value(group_by=group_by), raw=True),
+            to_1d(self.get_init_cash(group_by=group_by), raw=True),
+            to_1d(self.total_profit(group_by=group_by), raw=True),
+            trades.values,
+            trades.col_mapper.get_col_map(),
+            incl_unrealized,
+            ann_factor,
+            risk_free,
+            required_return,
+            ddof
+        )
+        if raw:
+            return stats_arr
+        return pd.DataFrame(stats_arr, index=self.wrapper.grouper.get_columns(group_by=group_by))
+
     def returns_stats(self, column=None, group_by=None, active_returns=False, in_sim_order=False,
                       agg_func=_mean_agg_func, year_freq=None, **kwargs):
         """Compute various statistics on returns of this portfolio.
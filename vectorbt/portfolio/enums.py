@@ -12,6 +12,8 @@ __all__ = [
     'RowContext',
     'SegmentContext',
     'OrderContext',
+    'SimulationState',
+    'PortfolioState',
     'InitCashMode',
     'CallSeqType',
     'SizeType',
@@ -31,6 +33,7 @@ __all__ = [
     'trade_dt',
     'position_dt',
     'log_dt',
+    'stats_dt',
     'TradeType',
     'BenchmarkSize'
 ]
@@ -210,6 +213,46 @@ Scalar value. Per group if cash sharing is enabled, otherwise per column.
 Current value is calculated using `last_val_price`.
 """
 
+SimulationState = namedtuple('SimulationState', [
+    'last_cash',
+    'last_shares',
+    'last_val_price',
+    'stop_entry_price',
+    'stop_trail_price'
+])
+
+__pdoc__['SimulationState'] = """A named tuple representing the state of the simulation.
+
+Holds everything needed to resume a simulation at the next row. Passed to and updated in-place
+by the simulation functions in `vectorbt.portfolio.nb`.
+"""
+__pdoc__['SimulationState.last_cash'] = "See `SimulationContext.last_cash`."
+__pdoc__['SimulationState.last_shares'] = "See `SimulationContext.last_shares`."
+__pdoc__['SimulationState.last_val_price'] = "See `SimulationContext.last_val_price`."
+__pdoc__['SimulationState.stop_entry_price'] = """Entry price of the current position per column.
+
+Used by stop loss and take profit in `vectorbt.portfolio.nb.simulate_from_signals_nb`."""
+__pdoc__['SimulationState.stop_trail_price'] = """Highest (long) or lowest (short) price since entry per column.
+
+Used by trailing stop loss in `vectorbt.portfolio.nb.simulate_from_signals_nb`."""
+
+PortfolioState = namedtuple('PortfolioState', [
+    'share_flow',
+    'shares',
+    'cash_flow'
+])
+
+__pdoc__['PortfolioState'] = """A named tuple representing the state of the portfolio per column.
+
+Filled from order records in a single pass by `vectorbt.portfolio.nb.fill_state_nb`
+and reused by `vectorbt.portfolio.base.Portfolio` for deriving cash, value and returns.
+"""
+__pdoc__['PortfolioState.share_flow'] = "Share flow per row and column. See `vectorbt.portfolio.nb.share_flow_nb`."
+__pdoc__['PortfolioState.shares'] = "Shares per row and column. See `vectorbt.portfolio.nb.shares_nb`."
+__pdoc__['PortfolioState.cash_flow'] = """Cash flow per row and column, with shorting adding cash.
+
+See `vectorbt.portfolio.nb.cash_flow_nb`."""
+
 InitCashMode = namedtuple('InitCashMode', [
     'Auto',
     'AutoAlign'
@@ -594,6 +637,33 @@ __pdoc__['log_dt'] = f"""`np.dtype` of log records.
 ```
 """
 
+_stats_fields = [
+    ('total_return', np.float_),
+    ('max_drawdown', np.float_),
+    ('sharpe_ratio', np.float_),
+    ('sortino_ratio', np.float_),
+    ('calmar_ratio', np.float_),
+    ('total_trades', np.int_),
+    ('closed_trades', np.int_),
+    ('open_trades', np.int_),
+    ('win_rate', np.float_),
+    ('profit_factor', np.float_),
+    ('expectancy', np.float_)
+]
+
+stats_dt = np.dtype(_stats_fields, align=True)
+"""_"""
+
+__pdoc__['stats_dt'] = f"""`np.dtype` of portfolio statistics.
+
+```plaintext
+{json.dumps(dict(zip(
+    dict(stats_dt.fields).keys(),
+    list(map(lambda x: str(x[0]), dict(stats_dt.fields).values()))
+)), indent=2, default=str)}
+```
+"""
+
 TradeType = namedtuple('TradeType', [
     'Trade',
     'Position'
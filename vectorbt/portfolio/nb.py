@@ -45,7 +45,7 @@ other Numba-compatible types.
 """
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from vectorbt.utils.math import (
     is_close_nb,
@@ -56,12 +56,19 @@ from vectorbt.utils.math import (
 from vectorbt.utils.array import insert_argsort_nb
 from vectorbt.base.reshape_fns import flex_select_auto_nb
 from vectorbt.generic import nb as generic_nb
+from vectorbt.returns.nb import (
+    sharpe_ratio_1d_nb,
+    sortino_ratio_1d_nb,
+    calmar_ratio_1d_nb
+)
 from vectorbt.portfolio.enums import (
     SimulationContext,
     GroupContext,
     RowContext,
     SegmentContext,
     OrderContext,
+    SimulationState,
+    PortfolioState,
     CallSeqType,
     SizeType,
     ConflictMode,
@@ -78,7 +85,8 @@ from vectorbt.portfolio.enums import (
     TradeStatus,
     trade_dt,
     position_dt,
-    log_dt
+    log_dt,
+    stats_dt
 )
 
 
@@ -544,6 +552,25 @@ def order_nothing():
     return NoOrder
 
 
+@njit(cache=True)
+def grow_records_nb(records):
+    """Double the size of a records array.
+
+    Used to fill records whose number is not known in advance. Amortized over all records,
+    growing costs O(1) per record."""
+    new_records = np.empty(2 * len(records), dtype=records.dtype)
+    new_records[:len(records)] = records
+    return new_records
+
+
+@njit(cache=True)
+def trim_records_nb(records, n):
+    """Copy the first `n` records such that the memory of the unused ones can be released."""
+    if n == len(records):
+        return records
+    return records[:n].copy()
+
+
 @njit(cache=True)
 def check_group_lens(group_lens, n_cols):
     """Check `group_lens`."""
@@ -608,8 +635,11 @@ def require_call_seq(call_seq):
     return np.require(call_seq, dtype=np.int_, requirements=['A', 'O', 'W', 'F'])
 
 
-def build_call_seq(target_shape, group_lens, call_seq_type=CallSeqType.Default):
-    """Not compiled but faster version of `build_call_seq_nb`."""
+def build_call_seq(target_shape, group_lens, call_seq_type=CallSeqType.Default, lazy=False):
+    """Not compiled but faster version of `build_call_seq_nb`.
+
+    If `lazy` is True and `call_seq_type` is not `CallSeqType.Random`, returns a read-only
+    view that is broadcast along rows and thus occupies memory only for one row."""
     call_seq = np.full(target_shape[1], 1, dtype=np.int_)
     if call_seq_type == CallSeqType.Reversed:
         call_seq[np.cumsum(group_lens)[1:] - group_lens[1:] - 1] -= group_lens[1:]
@@ -618,12 +648,26 @@ def build_call_seq(target_shape, group_lens, call_seq_type=CallSeqType.Default):
         call_seq[np.cumsum(group_lens[:-1])] -= group_lens[:-1]
         call_seq = np.cumsum(call_seq) - 1
     call_seq = np.broadcast_to(call_seq, target_shape)
+    if lazy and call_seq_type != CallSeqType.Random:
+        return call_seq
     if call_seq_type == CallSeqType.Random:
         call_seq = require_call_seq(call_seq)
         shuffle_call_seq_nb(call_seq, group_lens)
     return require_call_seq(call_seq)
 
 
+@njit(cache=True)
+def init_sim_state_nb(target_shape, init_cash):
+    """Create a new simulation state of type `vectorbt.portfolio.enums.SimulationState`."""
+    return SimulationState(
+        init_cash.astype(np.float_),
+        np.full(target_shape[1], 0., dtype=np.float_),
+        np.full(target_shape[1], np.nan, dtype=np.float_),
+        np.full(target_shape[1], np.nan, dtype=np.float_),
+        np.full(target_shape[1], np.nan, dtype=np.float_)
+    )
+
+
 @njit(cache=True)
 def empty_prep_nb(context, *args):
     """Preparation function that forwards received arguments down the stack."""
@@ -725,10 +769,11 @@ def auto_call_seq_ctx_nb(sc, size, size_type, direction, temp_float_arr):
     insert_argsort_nb(temp_float_arr, sc.call_seq_now)
 
 
-@njit
+@njit(nogil=True)
 def simulate_nb(target_shape, close, group_lens, init_cash, cash_sharing, call_seq, active_mask,
                 prep_func_nb, prep_args, group_prep_func_nb, group_prep_args, segment_prep_func_nb,
-                segment_prep_args, order_func_nb, order_args, max_orders, max_logs):
+                segment_prep_args, order_func_nb, order_args, max_orders, max_logs, sim_state=None,
+                from_group=0, to_group=None):
     """Simulate a portfolio by generating and filling orders.
 
     Starting with initial cash `init_cash`, iterates over each group and column over shape `target_shape`,
@@ -808,8 +853,22 @@ def simulate_nb(target_shape, close, group_lens, init_cash, cash_sharing, call_s
             `*order_args`. Should either return `vectorbt.portfolio.enums.Order`, or
             `vectorbt.portfolio.enums.NoOrder` to do nothing.
         order_args (tuple): Arguments passed to `order_func_nb`.
-        max_orders (int): Size of the order records array.
-        max_logs (int): Size of the log records array.
+        max_orders (int): Initial size of the order records array.
+
+            Doubles each time it runs out of space, see `grow_records_nb`.
+        max_logs (int): Initial size of the log records array.
+
+            Doubles each time it runs out of space, see `grow_records_nb`.
+        sim_state (SimulationState): State to resume the simulation from.
+
+            Modified in-place. If None, creates a new state using `init_sim_state_nb`.
+            When resuming, set `last_val_price` to the last known close.
+        from_group (int): Index of the first group to simulate.
+        to_group (int): Index of the group to stop before. Defaults to the number of groups.
+
+            Other groups are skipped, while columns and groups keep their global indices.
+            Since groups are independent of each other, disjoint ranges of groups can be
+            simulated concurrently, each on its own thread (the function releases the GIL).
 
     !!! note
         Broadcasting isn't done automatically: you should either broadcast inputs before passing them
@@ -973,15 +1032,15 @@ def simulate_nb(target_shape, close, group_lens, init_cash, cash_sharing, call_s
     check_group_lens(group_lens, target_shape[1])
     check_group_init_cash(group_lens, target_shape[1], init_cash, cash_sharing)
 
-    order_records = np.empty(max_orders, dtype=order_dt)
+    order_records = np.empty(max(max_orders, 1), dtype=order_dt)
     ridx = 0
-    if max_logs == 0:
-        max_logs = 1
-    log_records = np.empty(max_logs, dtype=log_dt)
+    log_records = np.empty(max(max_logs, 1), dtype=log_dt)
     lidx = 0
-    last_cash = init_cash.astype(np.float_)
-    last_shares = np.full(target_shape[1], 0., dtype=np.float_)
-    last_val_price = np.full_like(last_shares, np.nan, dtype=np.float_)
+    if sim_state is None:
+        sim_state = init_sim_state_nb(target_shape, init_cash)
+    last_cash = sim_state.last_cash
+    last_shares = sim_state.last_shares
+    last_val_price = sim_state.last_val_price
 
     # Run a function to prepare the simulation
     simc = SimulationContext(
@@ -1000,11 +1059,15 @@ def simulate_nb(target_shape, close, group_lens, init_cash, cash_sharing, call_s
     )
     prep_out = prep_func_nb(simc, *prep_args)
 
+    if to_group is None:
+        to_group = len(group_lens)
     from_col = 0
-    for group in range(len(group_lens)):
+    for group in range(from_group):
+        from_col += group_lens[group]
+    for group in range(from_group, to_group):
+        to_col = from_col + group_lens[group]
         # Is this group active?
         if np.any(active_mask[:, group]):
-            to_col = from_col + group_lens[group]
             group_len = to_col - from_col
 
             # Run a function to preprocess this entire group
@@ -1111,7 +1174,7 @@ def simulate_nb(target_shape, close, group_lens, init_cash, cash_sharing, call_s
 
                         # Process the order
                         if lidx > len(log_records) - 1:
-                            raise IndexError("log_records index out of range")
+                            log_records = grow_records_nb(log_records)
                         cash_now, shares_now, order_result = process_order_nb(
                             cash_now, shares_now, val_price_now, value_now, order, log_records[lidx])
 
@@ -1130,7 +1193,7 @@ def simulate_nb(target_shape, close, group_lens, init_cash, cash_sharing, call_s
                         if order_result.status == OrderStatus.Filled:
                             # Add order metadata
                             if ridx > len(order_records) - 1:
-                                raise IndexError("order_records index out of range")
+                                order_records = grow_records_nb(order_records)
                             order_records[ridx]['id'] = ridx
                             order_records[ridx]['idx'] = i
                             order_records[ridx]['col'] = col
@@ -1147,16 +1210,16 @@ def simulate_nb(target_shape, close, group_lens, init_cash, cash_sharing, call_s
                             last_cash[col] = cash_now
                         last_shares[col] = shares_now
 
-            from_col = to_col
+        from_col = to_col
 
-    return order_records[:ridx], log_records[:lidx]
+    return trim_records_nb(order_records, ridx), trim_records_nb(log_records, lidx)
 
 
-@njit
+@njit(nogil=True)
 def simulate_row_wise_nb(target_shape, close, group_lens, init_cash, cash_sharing, call_seq,
                          active_mask, prep_func_nb, prep_args, row_prep_func_nb, row_prep_args,
                          segment_prep_func_nb, segment_prep_args, order_func_nb, order_args,
-                         max_orders, max_logs):
+                         max_orders, max_logs, sim_state=None, from_group=0, to_group=None):
     """Same as `simulate_nb`, but iterates using row-major order, with the rows
     changing fastest, and the columns/groups changing slowest.
 
@@ -1169,6 +1232,9 @@ def simulate_row_wise_nb(target_shape, close, group_lens, init_cash, cash_sharin
         segment is active. If the main task of `row_prep_func_nb` is to activate/deactivate segments,
         all segments should be activated by default to allow `row_prep_func_nb` to be called.
 
+    If `from_group` or `to_group` is set, `row_prep_func_nb` is only called for rows with at least
+    one active segment within the range of groups.
+
     !!! warning
         You can only safely access data points that are to the left of the current group and
         rows that are to the top of the current row.
@@ -1203,15 +1269,15 @@ def simulate_row_wise_nb(target_shape, close, group_lens, init_cash, cash_sharin
     check_group_lens(group_lens, target_shape[1])
     check_group_init_cash(group_lens, target_shape[1], init_cash, cash_sharing)
 
-    order_records = np.empty(max_orders, dtype=order_dt)
+    order_records = np.empty(max(max_orders, 1), dtype=order_dt)
     ridx = 0
-    if max_logs == 0:
-        max_logs = 1
-    log_records = np.empty(max_logs, dtype=log_dt)
+    log_records = np.empty(max(max_logs, 1), dtype=log_dt)
     lidx = 0
-    last_cash = init_cash.astype(np.float_)
-    last_shares = np.full(target_shape[1], 0., dtype=np.float_)
-    last_val_price = np.full_like(last_shares, np.nan, dtype=np.float_)
+    if sim_state is None:
+        sim_state = init_sim_state_nb(target_shape, init_cash)
+    last_cash = sim_state.last_cash
+    last_shares = sim_state.last_shares
+    last_val_price = sim_state.last_val_price
 
     # Run a function to prepare the simulation
     simc = SimulationContext(
@@ -1230,9 +1296,14 @@ def simulate_row_wise_nb(target_shape, close, group_lens, init_cash, cash_sharin
     )
     prep_out = prep_func_nb(simc, *prep_args)
 
+    if to_group is None:
+        to_group = len(group_lens)
+    start_col = 0
+    for group in range(from_group):
+        start_col += group_lens[group]
     for i in range(target_shape[0]):
         # Is this row active?
-        if np.any(active_mask[i, :]):
+        if np.any(active_mask[i, from_group:to_group]):
             # Update valuation price
             if i > 0:
                 for col in range(target_shape[1]):
@@ -1256,11 +1327,11 @@ def simulate_row_wise_nb(target_shape, close, group_lens, init_cash, cash_sharin
             )
             row_prep_out = row_prep_func_nb(rc, *prep_out, *row_prep_args)
 
-            from_col = 0
-            for group in range(len(group_lens)):
+            from_col = start_col
+            for group in range(from_group, to_group):
+                to_col = from_col + group_lens[group]
                 # Is this group segment active?
                 if active_mask[i, group]:
-                    to_col = from_col + group_lens[group]
                     group_len = to_col - from_col
 
                     # Run a function to preprocess this row within this group
@@ -1338,7 +1409,7 @@ def simulate_row_wise_nb(target_shape, close, group_lens, init_cash, cash_sharin
 
                         # Process the order
                         if lidx > len(log_records) - 1:
-                            raise IndexError("log_records index out of range")
+                            log_records = grow_records_nb(log_records)
                         cash_now, shares_now, order_result = process_order_nb(
                             cash_now, shares_now, val_price_now, value_now, order, log_records[lidx])
 
@@ -1357,7 +1428,7 @@ def simulate_row_wise_nb(target_shape, close, group_lens, init_cash, cash_sharin
                         if order_result.status == OrderStatus.Filled:
                             # Add order metadata
                             if ridx > len(order_records) - 1:
-                                raise IndexError("order_records index out of range")
+                                order_records = grow_records_nb(order_records)
                             order_records[ridx]['id'] = ridx
                             order_records[ridx]['idx'] = i
                             order_records[ridx]['col'] = col
@@ -1374,16 +1445,16 @@ def simulate_row_wise_nb(target_shape, close, group_lens, init_cash, cash_sharin
                             last_cash[col] = cash_now
                         last_shares[col] = shares_now
 
-                    from_col = to_col
+                from_col = to_col
 
-    return order_records[:ridx], log_records[:lidx]
+    return trim_records_nb(order_records, ridx), trim_records_nb(log_records, lidx)
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def simulate_from_orders_nb(target_shape, group_lens, init_cash, call_seq, auto_call_seq,
                             size, size_type, direction, price, fees, fixed_fees, slippage,
                             min_size, max_size, reject_prob, allow_partial, raise_reject,
-                            log, val_price, max_orders, max_logs, flex_2d):
+                            log, val_price, max_orders, max_logs, flex_2d, sim_state=None):
     """Adaptation of `simulate_nb` for simulation based on orders.
 
     Utilizes flexible broadcasting.
@@ -1391,19 +1462,23 @@ def simulate_from_orders_nb(target_shape, group_lens, init_cash, call_seq, auto_
     !!! note
         Should be only grouped if cash sharing is enabled.
 
-        If `auto_call_seq` is True, make sure that `call_seq` follows `CallSeqType.Default`."""
+        If `auto_call_seq` is True, make sure that `call_seq` follows `CallSeqType.Default`.
+
+    Pass `sim_state` of type `vectorbt.portfolio.enums.SimulationState` to resume a previous
+    simulation. It's modified in-place."""
     check_group_lens(group_lens, target_shape[1])
     cash_sharing = is_grouped_nb(group_lens)
     check_group_init_cash(group_lens, target_shape[1], init_cash, cash_sharing)
 
-    order_records = np.empty(max_orders, dtype=order_dt)
+    order_records = np.empty(max(max_orders, 1), dtype=order_dt)
     ridx = 0
-    if max_logs == 0:
-        max_logs = 1
-    log_records = np.empty(max_logs, dtype=log_dt)
+    log_records = np.empty(max(max_logs, 1), dtype=log_dt)
     lidx = 0
-    last_cash = init_cash.astype(np.float_)
-    last_shares = np.full(target_shape[1], 0., dtype=np.float_)
+    if sim_state is None:
+        sim_state = init_sim_state_nb(target_shape, init_cash)
+    last_cash = sim_state.last_cash
+    last_shares = sim_state.last_shares
+    last_val_price = sim_state.last_val_price
     temp_order_value = np.empty(target_shape[1], dtype=np.float_)
 
     from_col = 0
@@ -1455,6 +1530,7 @@ def simulate_from_orders_nb(target_shape, group_lens, init_cash, call_seq, auto_
                 # Get running values per column
                 shares_now = last_shares[col]
                 val_price_now = flex_select_auto_nb(i, col, val_price, flex_2d)
+                last_val_price[col] = val_price_now
                 if not cash_sharing:
                     cash_now = last_cash[col]
                     value_now = cash_now
@@ -1480,7 +1556,7 @@ def simulate_from_orders_nb(target_shape, group_lens, init_cash, call_seq, auto_
 
                 # Process the order
                 if lidx > len(log_records) - 1:
-                    raise IndexError("log_records index out of range")
+                    log_records = grow_records_nb(log_records)
                 cash_now, shares_now, order_result = process_order_nb(
                     cash_now, shares_now, val_price_now, value_now, order, log_records[lidx])
 
@@ -1499,7 +1575,7 @@ def simulate_from_orders_nb(target_shape, group_lens, init_cash, call_seq, auto_
                 if order_result.status == OrderStatus.Filled:
                     # Add order metadata
                     if ridx > len(order_records) - 1:
-                        raise IndexError("order_records index out of range")
+                        order_records = grow_records_nb(order_records)
                     order_records[ridx]['id'] = ridx
                     order_records[ridx]['idx'] = i
                     order_records[ridx]['col'] = col
@@ -1518,7 +1594,7 @@ def simulate_from_orders_nb(target_shape, group_lens, init_cash, call_seq, auto_
 
         from_col = to_col
 
-    return order_records[:ridx], log_records[:lidx]
+    return trim_records_nb(order_records, ridx), trim_records_nb(log_records, lidx)
 
 
 @njit(cache=True)
@@ -1625,29 +1701,113 @@ def signals_get_size_nb(shares_now, is_entry, is_exit, size, size_type, directio
 
 
 @njit(cache=True)
+def signals_stop_hit_nb(shares_now, close_now, entry_price, trail_price, sl_stop, sl_trail, tp_stop):
+    """Check whether the stop loss or take profit of the current position is hit at `close_now`.
+
+    Stop loss is placed at `sl_stop` below (long) or above (short) `entry_price`, or `trail_price`
+    if `sl_trail` is True. Take profit is placed at `tp_stop` above (long) or below (short) `entry_price`.
+    Stops of 0 are disabled."""
+    if shares_now == 0 or np.isnan(close_now) or np.isnan(entry_price):
+        return False
+    sl_stop = abs(sl_stop)
+    tp_stop = abs(tp_stop)
+    if sl_stop > 0:
+        sl_price = trail_price if sl_trail else entry_price
+        if shares_now > 0:
+            if close_now <= sl_price * (1 - sl_stop):
+                return True
+        else:
+            if close_now >= sl_price * (1 + sl_stop):
+                return True
+    if tp_stop > 0:
+        if shares_now > 0:
+            if close_now >= entry_price * (1 + tp_stop):
+                return True
+        else:
+            if close_now <= entry_price * (1 - tp_stop):
+                return True
+    return False
+
+
+@njit(cache=True)
+def sparse_pop_nb(i, col, idxs, ptrs, ends):
+    """Check whether column `col` of sparse signals has a signal at row `i` and move past it.
+
+    `ptrs` and `ends` hold the current and end position of each column in `idxs`."""
+    is_signal = False
+    while ptrs[col] < ends[col] and idxs[ptrs[col]] == i:
+        is_signal = True
+        ptrs[col] += 1
+    return is_signal
+
+
+@njit(cache=True)
+def sparse_next_row_nb(i, n_rows, from_col, to_col, entry_idxs, entry_ptrs, entry_ends,
+                       exit_idxs, exit_ptrs, exit_ends, stops_enabled, last_shares):
+    """Get the next row after `i` that has a signal in columns `from_col:to_col`.
+
+    If `stops_enabled` is True and any column holds a position, returns the row right after `i`.
+    Returns `n_rows` if there are no more signals."""
+    next_i = n_rows
+    for col in range(from_col, to_col):
+        if stops_enabled and last_shares[col] != 0:
+            return i + 1
+        if entry_ptrs[col] < entry_ends[col]:
+            next_i = min(next_i, entry_idxs[entry_ptrs[col]])
+        if exit_ptrs[col] < exit_ends[col]:
+            next_i = min(next_i, exit_idxs[exit_ptrs[col]])
+    return next_i
+
+
+@njit(cache=True, nogil=True)
 def simulate_from_signals_nb(target_shape, group_lens, init_cash, call_seq, auto_call_seq,
                              entries, exits, size, size_type, direction, price, fees, fixed_fees,
                              slippage, min_size, max_size, reject_prob, allow_partial, raise_reject,
-                             accumulate, log, conflict_mode, close_first, val_price, max_orders,
-                             max_logs, flex_2d):
+                             accumulate, log, conflict_mode, close_first, val_price, sl_stop, sl_trail,
+                             tp_stop, close, max_orders, max_logs, flex_2d, sim_state=None,
+                             sparse_entries=None, sparse_exits=None):
     """Adaptation of `simulate_nb` for simulation based on entry and exit signals.
 
     Utilizes flexible broadcasting.
 
+    Stop loss `sl_stop` (trailing if `sl_trail` is True) and take profit `tp_stop` are checked
+    against `close` at the beginning of each row, using the stop values of that row and the entry price
+    of the current position (see `signals_stop_hit_nb`). Once hit, the whole position is closed
+    at `price` of that row, and any signals at that row are ignored. The trailing price is updated
+    with `close` after the check.
+
     !!! note
-        Should be only grouped if cash sharing is enabled."""
+        Should be only grouped if cash sharing is enabled.
+
+    Pass `sim_state` of type `vectorbt.portfolio.enums.SimulationState` to resume a previous
+    simulation. It's modified in-place.
+
+    Pass both `sparse_entries` and `sparse_exits` of type `vectorbt.signals.enums.SparseSignals`
+    to use them instead of `entries` and `exits`. Rows are then visited only if they have a signal
+    in the group, or if stops are enabled (any non-zero `sl_stop` or `tp_stop`) and the group
+    has an open position, thus sparse signals produce the same records as dense ones at a fraction
+    of the cost. The trailing price of stops is only tracked on visited rows."""
     check_group_lens(group_lens, target_shape[1])
     cash_sharing = is_grouped_nb(group_lens)
     check_group_init_cash(group_lens, target_shape[1], init_cash, cash_sharing)
-
-    order_records = np.empty(max_orders, dtype=order_dt)
+    if sparse_entries is not None:
+        entry_ptrs = np.cumsum(sparse_entries.col_lens) - sparse_entries.col_lens
+        entry_ends = entry_ptrs + sparse_entries.col_lens
+        exit_ptrs = np.cumsum(sparse_exits.col_lens) - sparse_exits.col_lens
+        exit_ends = exit_ptrs + sparse_exits.col_lens
+        stops_enabled = np.any(sl_stop.ravel() != 0) or np.any(tp_stop.ravel() != 0)
+
+    order_records = np.empty(max(max_orders, 1), dtype=order_dt)
     ridx = 0
-    if max_logs == 0:
-        max_logs = 1
-    log_records = np.empty(max_logs, dtype=log_dt)
+    log_records = np.empty(max(max_logs, 1), dtype=log_dt)
     lidx = 0
-    last_cash = init_cash.astype(np.float_)
-    last_shares = np.full(target_shape[1], 0., dtype=np.float_)
+    if sim_state is None:
+        sim_state = init_sim_state_nb(target_shape, init_cash)
+    last_cash = sim_state.last_cash
+    last_shares = sim_state.last_shares
+    last_val_price = sim_state.last_val_price
+    stop_entry_price = sim_state.stop_entry_price
+    stop_trail_price = sim_state.stop_trail_price
     order_size = np.empty(target_shape[1], dtype=np.float_)
     order_size_type = np.empty(target_shape[1], dtype=np.float_)
     temp_order_value = np.empty(target_shape[1], dtype=np.float_)
@@ -1661,15 +1821,42 @@ def simulate_from_signals_nb(target_shape, group_lens, init_cash, call_seq, auto
         if cash_sharing:
             cash_now = last_cash[group]
 
-        for i in range(target_shape[0]):
+        i = -1
+        while True:
+            # Get the next row
+            if sparse_entries is None:
+                i += 1
+            else:
+                i = sparse_next_row_nb(
+                    i,
+                    target_shape[0],
+                    from_col,
+                    to_col,
+                    sparse_entries.idxs,
+                    entry_ptrs,
+                    entry_ends,
+                    sparse_exits.idxs,
+                    exit_ptrs,
+                    exit_ends,
+                    stops_enabled,
+                    last_shares
+                )
+            if i >= target_shape[0]:
+                break
 
             # Get size and value of each order
             for k in range(group_len):
                 col = from_col + k  # order doesn't matter
+                if sparse_entries is None:
+                    is_entry = flex_select_auto_nb(i, col, entries, flex_2d)
+                    is_exit = flex_select_auto_nb(i, col, exits, flex_2d)
+                else:
+                    is_entry = sparse_pop_nb(i, col, sparse_entries.idxs, entry_ptrs, entry_ends)
+                    is_exit = sparse_pop_nb(i, col, sparse_exits.idxs, exit_ptrs, exit_ends)
                 _order_size, _order_size_type = signals_get_size_nb(
                     last_shares[col],
-                    flex_select_auto_nb(i, col, entries, flex_2d),
-                    flex_select_auto_nb(i, col, exits, flex_2d),
+                    is_entry,
+                    is_exit,
                     flex_select_auto_nb(i, col, size, flex_2d),
                     flex_select_auto_nb(i, col, size_type, flex_2d),
                     flex_select_auto_nb(i, col, direction, flex_2d),
@@ -1677,6 +1864,25 @@ def simulate_from_signals_nb(target_shape, group_lens, init_cash, call_seq, auto
                     flex_select_auto_nb(i, col, conflict_mode, flex_2d),
                     flex_select_auto_nb(i, col, close_first, flex_2d)
                 )  # already takes into account direction
+                # Check stops of the current position
+                if last_shares[col] != 0:
+                    _close = flex_select_auto_nb(i, col, close, flex_2d)
+                    if signals_stop_hit_nb(
+                        last_shares[col],
+                        _close,
+                        stop_entry_price[col],
+                        stop_trail_price[col],
+                        flex_select_auto_nb(i, col, sl_stop, flex_2d),
+                        flex_select_auto_nb(i, col, sl_trail, flex_2d),
+                        flex_select_auto_nb(i, col, tp_stop, flex_2d)
+                    ):
+                        _order_size = -last_shares[col]
+                        _order_size_type = SizeType.Shares
+                    if not np.isnan(_close):
+                        if last_shares[col] > 0:
+                            stop_trail_price[col] = max(stop_trail_price[col], _close)
+                        else:
+                            stop_trail_price[col] = min(stop_trail_price[col], _close)
                 order_size[col] = _order_size
                 order_size_type[col] = _order_size_type
 
@@ -1719,6 +1925,7 @@ def simulate_from_signals_nb(target_shape, group_lens, init_cash, call_seq, auto
                 # Get running values per column
                 shares_now = last_shares[col]
                 val_price_now = flex_select_auto_nb(i, col, val_price, flex_2d)
+                last_val_price[col] = val_price_now
                 if not cash_sharing:
                     cash_now = last_cash[col]
                     value_now = cash_now
@@ -1755,7 +1962,7 @@ def simulate_from_signals_nb(target_shape, group_lens, init_cash, call_seq, auto
 
                     # Process the order
                     if lidx > len(log_records) - 1:
-                        raise IndexError("log_records index out of range")
+                        log_records = grow_records_nb(log_records)
                     cash_now, shares_now, order_result = process_order_nb(
                         cash_now, shares_now, val_price_now, value_now, order, log_records[lidx])
 
@@ -1772,9 +1979,17 @@ def simulate_from_signals_nb(target_shape, group_lens, init_cash, call_seq, auto
                         lidx += 1
 
                     if order_result.status == OrderStatus.Filled:
+                        # Update entry price used by stops
+                        if shares_now == 0:
+                            stop_entry_price[col] = np.nan
+                            stop_trail_price[col] = np.nan
+                        elif last_shares[col] == 0 or np.sign(shares_now) != np.sign(last_shares[col]):
+                            stop_entry_price[col] = order_result.price
+                            stop_trail_price[col] = order_result.price
+
                         # Add order metadata
                         if ridx > len(order_records) - 1:
-                            raise IndexError("order_records index out of range")
+                            order_records = grow_records_nb(order_records)
                         order_records[ridx]['id'] = ridx
                         order_records[ridx]['idx'] = i
                         order_records[ridx]['col'] = col
@@ -1791,9 +2006,106 @@ def simulate_from_signals_nb(target_shape, group_lens, init_cash, call_seq, auto
                     last_cash[col] = cash_now
                 last_shares[col] = shares_now
 
+        if sparse_entries is not None and target_shape[0] > 0:
+            # Skipped rows still set the valuation price
+            for col in range(from_col, to_col):
+                last_val_price[col] = flex_select_auto_nb(target_shape[0] - 1, col, val_price, flex_2d)
+
         from_col = to_col
 
-    return order_records[:ridx], log_records[:lidx]
+    return trim_records_nb(order_records, ridx), trim_records_nb(log_records, lidx)
+
+
+@njit(cache=True)
+def ragged_select_nb(a, start, end):
+    """Select elements `start:end` of a flat ragged array as a two-dimensional array with one column.
+
+    An array with one element is broadcast to all series."""
+    if a.shape[0] == 1:
+        return a.reshape((1, 1))
+    return a[start:end].reshape((end - start, 1))
+
+
+@njit(cache=True)
+def simulate_from_signals_ragged_nb(offsets, init_cash, entries, exits, size, size_type, direction, price,
+                                    fees, fixed_fees, slippage, min_size, max_size, reject_prob, allow_partial,
+                                    raise_reject, accumulate, log, conflict_mode, close_first, val_price,
+                                    sl_stop, sl_trail, tp_stop, close, max_orders, max_logs, sim_state):
+    """Run `simulate_from_signals_nb` on each series of a ragged collection.
+
+    Series are stored back to back in flat arrays, with series `k` occupying elements
+    `offsets[k]:offsets[k + 1]`. Each argument from `entries` to `close` is a flat array of
+    either all elements or of one element (see `ragged_select_nb`). `init_cash` and each array
+    in `sim_state` hold one value per series.
+
+    Each series is simulated as a single column. Returns order and log records of all series
+    concatenated, as well as the number of order and log records per series. Records of each
+    series are identical to those of a separate `simulate_from_signals_nb` run, that is, their
+    ids, row indices and log order ids start from zero, and their column is zero."""
+    n_series = len(offsets) - 1
+    order_records = np.empty(max(n_series, 1), dtype=order_dt)
+    log_records = np.empty(max(n_series, 1), dtype=log_dt)
+    order_lens = np.empty(n_series, dtype=np.int_)
+    log_lens = np.empty(n_series, dtype=np.int_)
+    ridx = 0
+    lidx = 0
+    group_lens = np.array([1])
+
+    for k in range(n_series):
+        start = offsets[k]
+        end = offsets[k + 1]
+        series_orders, series_logs = simulate_from_signals_nb(
+            (end - start, 1),
+            group_lens,
+            init_cash[k:k + 1],
+            np.zeros((end - start, 1), dtype=np.int_),
+            False,
+            ragged_select_nb(entries, start, end),
+            ragged_select_nb(exits, start, end),
+            ragged_select_nb(size, start, end),
+            ragged_select_nb(size_type, start, end),
+            ragged_select_nb(direction, start, end),
+            ragged_select_nb(price, start, end),
+            ragged_select_nb(fees, start, end),
+            ragged_select_nb(fixed_fees, start, end),
+            ragged_select_nb(slippage, start, end),
+            ragged_select_nb(min_size, start, end),
+            ragged_select_nb(max_size, start, end),
+            ragged_select_nb(reject_prob, start, end),
+            ragged_select_nb(allow_partial, start, end),
+            ragged_select_nb(raise_reject, start, end),
+            ragged_select_nb(accumulate, start, end),
+            ragged_select_nb(log, start, end),
+            ragged_select_nb(conflict_mode, start, end),
+            ragged_select_nb(close_first, start, end),
+            ragged_select_nb(val_price, start, end),
+            ragged_select_nb(sl_stop, start, end),
+            ragged_select_nb(sl_trail, start, end),
+            ragged_select_nb(tp_stop, start, end),
+            ragged_select_nb(close, start, end),
+            max_orders,
+            max_logs,
+            True,
+            SimulationState(
+                sim_state.last_cash[k:k + 1],
+                sim_state.last_shares[k:k + 1],
+                sim_state.last_val_price[k:k + 1],
+                sim_state.stop_entry_price[k:k + 1],
+                sim_state.stop_trail_price[k:k + 1]
+            )
+        )
+        while ridx + len(series_orders) > len(order_records):
+            order_records = grow_records_nb(order_records)
+        order_records[ridx:ridx + len(series_orders)] = series_orders
+        ridx += len(series_orders)
+        order_lens[k] = len(series_orders)
+        while lidx + len(series_logs) > len(log_records):
+            log_records = grow_records_nb(log_records)
+        log_records[lidx:lidx + len(series_logs)] = series_logs
+        lidx += len(series_logs)
+        log_lens[k] = len(series_logs)
+
+    return trim_records_nb(order_records, ridx), trim_records_nb(log_records, lidx), order_lens, log_lens
 
 
 # ############# Trades ############# #
@@ -1861,7 +2173,183 @@ def save_trade_nb(record, col,
     record['position_id'] = position_id
 
 
+id_order_err = "id must come in ascending order per column"
+
+
+@njit(cache=True)
+def raise_col_err_nb(err):
+    """Raise the error with code `err` returned by a column kernel such as `col_orders_to_trades_nb`.
+
+    Column kernels return error codes instead of raising, since they may run in parallel."""
+    if err == 1:
+        raise ValueError(id_order_err)
+    if err == 2:
+        raise ValueError(size_zero_neg_err)
+    if err == 3:
+        raise ValueError(price_zero_neg_err)
+
+
 @njit(cache=True)
+def col_orders_to_trades_nb(close, order_records, col_idxs, col_start, col_len, col, out):
+    """Find trades in the orders of the column `col` and store them to `out`.
+
+    The orders of the column are `order_records[col_idxs[col_start:col_start + col_len]]`.
+    `out` must fit `col_len` records, which is the maximum number of trades in a column.
+    Ids and position ids of trades are relative to the column.
+
+    Returns the number of trades, the number of positions, and the error code (0 if none,
+    see `raise_col_err_nb`)."""
+    tidx = 0
+    entry_size_sum = 0.
+    entry_gross_sum = 0.
+    entry_fees_sum = 0.
+    position_id = -1
+    entry_idx = -1
+    direction = -1
+    last_id = -1
+
+    for k in range(col_len):
+        record = order_records[col_idxs[col_start + k]]
+
+        if record['id'] < last_id:
+            return tidx, position_id + 1, 1
+        last_id = record['id']
+
+        i = record['idx']
+        order_size = record['size']
+        order_price = record['price']
+        order_fees = record['fees']
+        order_side = record['side']
+
+        if order_size <= 0.:
+            return tidx, position_id + 1, 2
+        if order_price <= 0.:
+            return tidx, position_id + 1, 3
+
+        if entry_idx == -1:
+            # Trade opened
+            entry_idx = i
+            if order_side == OrderSide.Buy:
+                direction = TradeDirection.Long
+            else:
+                direction = TradeDirection.Short
+            position_id += 1
+
+            # Reset running vars for a new position
+            entry_size_sum = 0.
+            entry_gross_sum = 0.
+            entry_fees_sum = 0.
+
+        if (direction == TradeDirection.Long and order_side == OrderSide.Buy) \
+                or (direction == TradeDirection.Short and order_side == OrderSide.Sell):
+            # Position increased
+            entry_size_sum += order_size
+            entry_gross_sum += order_size * order_price
+            entry_fees_sum += order_fees
+
+        elif (direction == TradeDirection.Long and order_side == OrderSide.Sell) \
+                or (direction == TradeDirection.Short and order_side == OrderSide.Buy):
+            if is_close_or_less_nb(order_size, entry_size_sum):
+                # Trade closed
+                if is_close_nb(order_size, entry_size_sum):
+                    exit_size = entry_size_sum
+                else:
+                    exit_size = order_size
+                exit_price = order_price
+                exit_fees = order_fees
+                exit_idx = i
+                save_trade_nb(
+                    out[tidx],
+                    col,
+                    entry_idx,
+                    entry_size_sum,
+                    entry_gross_sum,
+                    entry_fees_sum,
+                    exit_idx,
+                    exit_size,
+                    exit_price,
+                    exit_fees,
+                    direction,
+                    TradeStatus.Closed,
+                    position_id
+                )
+                out[tidx]['id'] = tidx
+                tidx += 1
+
+                if is_close_nb(order_size, entry_size_sum):
+                    # Position closed
+                    entry_idx = -1
+                    direction = -1
+                else:
+                    # Position decreased, previous orders have now less impact
+                    size_fraction = (entry_size_sum - order_size) / entry_size_sum
+                    entry_size_sum *= size_fraction
+                    entry_gross_sum *= size_fraction
+                    entry_fees_sum *= size_fraction
+            else:
+                # Trade reversed
+                # Close current trade
+                cl_exit_size = entry_size_sum
+                cl_exit_price = order_price
+                cl_exit_fees = cl_exit_size / order_size * order_fees
+                cl_exit_idx = i
+                save_trade_nb(
+                    out[tidx],
+                    col,
+                    entry_idx,
+                    entry_size_sum,
+                    entry_gross_sum,
+                    entry_fees_sum,
+                    cl_exit_idx,
+                    cl_exit_size,
+                    cl_exit_price,
+                    cl_exit_fees,
+                    direction,
+                    TradeStatus.Closed,
+                    position_id
+                )
+                out[tidx]['id'] = tidx
+                tidx += 1
+
+                # Open a new trade
+                entry_size_sum = order_size - cl_exit_size
+                entry_gross_sum = entry_size_sum * order_price
+                entry_fees_sum = order_fees - cl_exit_fees
+                entry_idx = i
+                if direction == TradeDirection.Long:
+                    direction = TradeDirection.Short
+                else:
+                    direction = TradeDirection.Long
+                position_id += 1
+
+    if entry_idx != -1 and is_less_nb(-entry_size_sum, 0):
+        # Trade hasn't been closed
+        exit_size = entry_size_sum
+        exit_price = close[close.shape[0] - 1, col]
+        exit_fees = 0.
+        exit_idx = close.shape[0] - 1
+        save_trade_nb(
+            out[tidx],
+            col,
+            entry_idx,
+            entry_size_sum,
+            entry_gross_sum,
+            entry_fees_sum,
+            exit_idx,
+            exit_size,
+            exit_price,
+            exit_fees,
+            direction,
+            TradeStatus.Open,
+            position_id
+        )
+        out[tidx]['id'] = tidx
+        tidx += 1
+
+    return tidx, position_id + 1, 0
+
+
+@njit(cache=True, nogil=True)
 def orders_to_trades_nb(close, order_records, col_map):
     """Find trades and store their information as records to an array.
 
@@ -1949,159 +2437,57 @@ def orders_to_trades_nb(close, order_records, col_map):
     col_start_idxs = np.cumsum(col_lens) - col_lens
     records = np.empty(len(order_records), dtype=trade_dt)
     ridx = 0
-    entry_size_sum = 0.
-    entry_gross_sum = 0.
-    entry_fees_sum = 0.
-    position_id = -1
+    pidx = 0
 
     for col in range(col_lens.shape[0]):
         col_len = col_lens[col]
         if col_len == 0:
             continue
-        entry_idx = -1
-        direction = -1
-        last_id = -1
-
-        for i in range(col_len):
-            r = col_idxs[col_start_idxs[col] + i]
-            record = order_records[r]
+        n_trades, n_positions, err = col_orders_to_trades_nb(
+            close, order_records, col_idxs, col_start_idxs[col], col_len, col, records[ridx:])
+        raise_col_err_nb(err)
+        for r in range(ridx, ridx + n_trades):
+            records[r]['id'] += ridx
+            records[r]['position_id'] += pidx
+        ridx += n_trades
+        pidx += n_positions
 
-            if record['id'] < last_id:
-                raise ValueError("id must come in ascending order per column")
-            last_id = record['id']
+    return records[:ridx]
 
-            i = record['idx']
-            order_size = record['size']
-            order_price = record['price']
-            order_fees = record['fees']
-            order_side = record['side']
-
-            if order_size <= 0.:
-                raise ValueError(size_zero_neg_err)
-            if order_price <= 0.:
-                raise ValueError(price_zero_neg_err)
-
-            if entry_idx == -1:
-                # Trade opened
-                entry_idx = i
-                if order_side == OrderSide.Buy:
-                    direction = TradeDirection.Long
-                else:
-                    direction = TradeDirection.Short
-                position_id += 1
 
-                # Reset running vars for a new position
-                entry_size_sum = 0.
-                entry_gross_sum = 0.
-                entry_fees_sum = 0.
-
-            if (direction == TradeDirection.Long and order_side == OrderSide.Buy) \
-                    or (direction == TradeDirection.Short and order_side == OrderSide.Sell):
-                # Position increased
-                entry_size_sum += order_size
-                entry_gross_sum += order_size * order_price
-                entry_fees_sum += order_fees
-
-            elif (direction == TradeDirection.Long and order_side == OrderSide.Sell) \
-                    or (direction == TradeDirection.Short and order_side == OrderSide.Buy):
-                if is_close_or_less_nb(order_size, entry_size_sum):
-                    # Trade closed
-                    if is_close_nb(order_size, entry_size_sum):
-                        exit_size = entry_size_sum
-                    else:
-                        exit_size = order_size
-                    exit_price = order_price
-                    exit_fees = order_fees
-                    exit_idx = i
-                    save_trade_nb(
-                        records[ridx],
-                        col,
-                        entry_idx,
-                        entry_size_sum,
-                        entry_gross_sum,
-                        entry_fees_sum,
-                        exit_idx,
-                        exit_size,
-                        exit_price,
-                        exit_fees,
-                        direction,
-                        TradeStatus.Closed,
-                        position_id
-                    )
-                    records[ridx]['id'] = ridx
-                    ridx += 1
+@njit(cache=True, parallel=True)
+def orders_to_trades_parallel_nb(close, order_records, col_map):
+    """Parallel version of `orders_to_trades_nb`.
 
-                    if is_close_nb(order_size, entry_size_sum):
-                        # Position closed
-                        entry_idx = -1
-                        direction = -1
-                    else:
-                        # Position decreased, previous orders have now less impact
-                        size_fraction = (entry_size_sum - order_size) / entry_size_sum
-                        entry_size_sum *= size_fraction
-                        entry_gross_sum *= size_fraction
-                        entry_fees_sum *= size_fraction
-                else:
-                    # Trade reversed
-                    # Close current trade
-                    cl_exit_size = entry_size_sum
-                    cl_exit_price = order_price
-                    cl_exit_fees = cl_exit_size / order_size * order_fees
-                    cl_exit_idx = i
-                    save_trade_nb(
-                        records[ridx],
-                        col,
-                        entry_idx,
-                        entry_size_sum,
-                        entry_gross_sum,
-                        entry_fees_sum,
-                        cl_exit_idx,
-                        cl_exit_size,
-                        cl_exit_price,
-                        cl_exit_fees,
-                        direction,
-                        TradeStatus.Closed,
-                        position_id
-                    )
-                    records[ridx]['id'] = ridx
-                    ridx += 1
+    Columns are processed in parallel using `col_orders_to_trades_nb`: each column writes into
+    its own segment of a buffer, and segments are then compacted in parallel.
+    Produces the same records as `orders_to_trades_nb`."""
+    col_idxs, col_lens = col_map
+    col_start_idxs = np.cumsum(col_lens) - col_lens
+    temp_records = np.empty(len(order_records), dtype=trade_dt)
+    n_trades = np.empty(col_lens.shape[0], dtype=np.int_)
+    n_positions = np.empty(col_lens.shape[0], dtype=np.int_)
+    errs = np.empty(col_lens.shape[0], dtype=np.int_)
 
-                    # Open a new trade
-                    entry_size_sum = order_size - cl_exit_size
-                    entry_gross_sum = entry_size_sum * order_price
-                    entry_fees_sum = order_fees - cl_exit_fees
-                    entry_idx = i
-                    if direction == TradeDirection.Long:
-                        direction = TradeDirection.Short
-                    else:
-                        direction = TradeDirection.Long
-                    position_id += 1
-
-        if entry_idx != -1 and is_less_nb(-entry_size_sum, 0):
-            # Trade in the previous column hasn't been closed
-            exit_size = entry_size_sum
-            exit_price = close[close.shape[0] - 1, col]
-            exit_fees = 0.
-            exit_idx = close.shape[0] - 1
-            save_trade_nb(
-                records[ridx],
-                col,
-                entry_idx,
-                entry_size_sum,
-                entry_gross_sum,
-                entry_fees_sum,
-                exit_idx,
-                exit_size,
-                exit_price,
-                exit_fees,
-                direction,
-                TradeStatus.Open,
-                position_id
-            )
-            records[ridx]['id'] = ridx
-            ridx += 1
+    for col in prange(col_lens.shape[0]):
+        col_start = col_start_idxs[col]
+        col_len = col_lens[col]
+        n_trades[col], n_positions[col], errs[col] = col_orders_to_trades_nb(
+            close, order_records, col_idxs, col_start, col_len, col,
+            temp_records[col_start:col_start + col_len])
+    for col in range(col_lens.shape[0]):
+        raise_col_err_nb(errs[col])
 
-    return records[:ridx]
+    trade_start_idxs = np.cumsum(n_trades) - n_trades
+    position_start_idxs = np.cumsum(n_positions) - n_positions
+    records = np.empty(np.sum(n_trades), dtype=trade_dt)
+    for col in prange(col_lens.shape[0]):
+        for k in range(n_trades[col]):
+            r = trade_start_idxs[col] + k
+            records[r] = temp_records[col_start_idxs[col] + k]
+            records[r]['id'] = r
+            records[r]['position_id'] += position_start_idxs[col]
+    return records
 
 
 # ############# Positions ############# #
@@ -2161,6 +2547,52 @@ def copy_trade_record_nb(position_record, trade_record):
     position_record['status'] = trade_record['status']
 
 
+@njit(cache=True)
+def col_trades_to_positions_nb(trade_records, col_idxs, col_start, col_len, out):
+    """Find positions in the trades of a column and store them to `out`.
+
+    The trades of the column are `trade_records[col_idxs[col_start:col_start + col_len]]`.
+    `out` must fit `col_len` records. Ids of positions are relative to the column.
+
+    Returns the number of positions and the error code (0 if none, see `raise_col_err_nb`)."""
+    pidx = 0
+    from_r = -1
+    last_id = -1
+    last_position_id = -1
+
+    for k in range(col_len):
+        r = col_idxs[col_start + k]
+        record = trade_records[r]
+
+        if record['id'] < last_id:
+            return pidx, 1
+        last_id = record['id']
+
+        position_id = record['position_id']
+
+        if position_id != last_position_id:
+            if last_position_id != -1:
+                if r - from_r > 1:
+                    save_position_nb(out[pidx], trade_records[from_r:r])
+                else:
+                    # Speed up
+                    copy_trade_record_nb(out[pidx], trade_records[from_r])
+                out[pidx]['id'] = pidx
+                pidx += 1
+            from_r = r
+            last_position_id = position_id
+
+    if r - from_r > 0:
+        save_position_nb(out[pidx], trade_records[from_r:r + 1])
+    else:
+        # Speed up
+        copy_trade_record_nb(out[pidx], trade_records[from_r])
+    out[pidx]['id'] = pidx
+    pidx += 1
+
+    return pidx, 0
+
+
 @njit(cache=True)
 def trades_to_positions_nb(trade_records, col_map):
     """Find positions and store their information as records to an array.
@@ -2195,46 +2627,50 @@ def trades_to_positions_nb(trade_records, col_map):
     col_start_idxs = np.cumsum(col_lens) - col_lens
     records = np.empty(len(trade_records), dtype=position_dt)
     ridx = 0
-    from_r = -1
 
     for col in range(col_lens.shape[0]):
         col_len = col_lens[col]
         if col_len == 0:
             continue
-        last_id = -1
-        last_position_id = -1
+        n_positions, err = col_trades_to_positions_nb(
+            trade_records, col_idxs, col_start_idxs[col], col_len, records[ridx:])
+        raise_col_err_nb(err)
+        for r in range(ridx, ridx + n_positions):
+            records[r]['id'] += ridx
+        ridx += n_positions
 
-        for i in range(col_len):
-            r = col_idxs[col_start_idxs[col] + i]
-            record = trade_records[r]
+    return records[:ridx]
 
-            if record['id'] < last_id:
-                raise ValueError("id must come in ascending order per column")
-            last_id = record['id']
 
-            position_id = record['position_id']
+@njit(cache=True, parallel=True)
+def trades_to_positions_parallel_nb(trade_records, col_map):
+    """Parallel version of `trades_to_positions_nb`.
 
-            if position_id != last_position_id:
-                if last_position_id != -1:
-                    if r - from_r > 1:
-                        save_position_nb(records[ridx], trade_records[from_r:r])
-                    else:
-                        # Speed up
-                        copy_trade_record_nb(records[ridx], trade_records[from_r])
-                    records[ridx]['id'] = ridx
-                    ridx += 1
-                from_r = r
-                last_position_id = position_id
+    See `orders_to_trades_parallel_nb`."""
+    col_idxs, col_lens = col_map
+    col_start_idxs = np.cumsum(col_lens) - col_lens
+    temp_records = np.empty(len(trade_records), dtype=position_dt)
+    n_positions = np.zeros(col_lens.shape[0], dtype=np.int_)
+    errs = np.zeros(col_lens.shape[0], dtype=np.int_)
 
-        if r - from_r > 0:
-            save_position_nb(records[ridx], trade_records[from_r:r + 1])
-        else:
-            # Speed up
-            copy_trade_record_nb(records[ridx], trade_records[from_r])
-        records[ridx]['id'] = ridx
-        ridx += 1
+    for col in prange(col_lens.shape[0]):
+        col_start = col_start_idxs[col]
+        col_len = col_lens[col]
+        if col_len > 0:
+            n_positions[col], errs[col] = col_trades_to_positions_nb(
+                trade_records, col_idxs, col_start, col_len,
+                temp_records[col_start:col_start + col_len])
+    for col in range(col_lens.shape[0]):
+        raise_col_err_nb(errs[col])
 
-    return records[:ridx]
+    position_start_idxs = np.cumsum(n_positions) - n_positions
+    records = np.empty(np.sum(n_positions), dtype=position_dt)
+    for col in prange(col_lens.shape[0]):
+        for k in range(n_positions[col]):
+            r = position_start_idxs[col] + k
+            records[r] = temp_records[col_start_idxs[col] + k]
+            records[r]['id'] = r
+    return records
 
 
 # ############# Shares ############# #
@@ -2265,11 +2701,11 @@ def get_short_size_nb(shares_now, new_shares_now):
 
 
 @njit(cache=True)
-def share_flow_nb(target_shape, order_records, col_map, direction):
-    """Get share flow series per column. Has opposite sign."""
+def share_flow_nb(target_shape, order_records, col_map, direction, dtype=np.float_):
+    """Get share flow series per column of type `dtype`. Has opposite sign."""
     col_idxs, col_lens = col_map
     col_start_idxs = np.cumsum(col_lens) - col_lens
-    out = np.full(target_shape, 0., dtype=np.float_)
+    out = np.full(target_shape, 0., dtype=dtype)
 
     for col in range(col_lens.shape[0]):
         col_len = col_lens[col]
@@ -2340,15 +2776,58 @@ def pos_coverage_grouped_nb(pos_mask, group_lens):
     return generic_nb.reduce_grouped_nb(pos_mask, group_lens, group_mean_reduce_nb)
 
 
+@njit(cache=True)
+def fill_state_nb(target_shape, order_records, col_map, dtype=np.float_):
+    """Fill share flow, shares and cash flow per column in a single pass over order records.
+
+    Returns `vectorbt.portfolio.enums.PortfolioState` with arrays of type `dtype`. Same as running
+    `share_flow_nb` with `Direction.All`, `shares_nb` and `cash_flow_nb` with `short_cash=True`."""
+    col_idxs, col_lens = col_map
+    col_start_idxs = np.cumsum(col_lens) - col_lens
+    share_flow = np.full(target_shape, 0., dtype=dtype)
+    shares = np.full(target_shape, 0., dtype=dtype)
+    cash_flow = np.full(target_shape, 0., dtype=dtype)
+
+    for col in range(col_lens.shape[0]):
+        col_len = col_lens[col]
+        if col_len == 0:
+            continue
+        last_id = -1
+
+        for i in range(col_len):
+            r = col_idxs[col_start_idxs[col] + i]
+            record = order_records[r]
+
+            if record['id'] < last_id:
+                raise ValueError("id must come in ascending order per column")
+            last_id = record['id']
+
+            idx = record['idx']
+            volume = record['size'] * record['price']
+            if record['side'] == OrderSide.Sell:
+                share_flow[idx, col] -= record['size']
+                cash_flow[idx, col] += volume
+            else:
+                share_flow[idx, col] += record['size']
+                cash_flow[idx, col] -= volume
+            cash_flow[idx, col] -= record['fees']
+
+        shares_now = 0.
+        for i in range(target_shape[0]):
+            shares_now = add_nb(shares_now, share_flow[i, col])
+            shares[i, col] = shares_now
+    return PortfolioState(share_flow, shares, cash_flow)
+
+
 # ############# Cash ############# #
 
 
 @njit(cache=True)
-def cash_flow_nb(target_shape, order_records, col_map, short_cash):
-    """Get cash flow series per column."""
+def cash_flow_nb(target_shape, order_records, col_map, short_cash, dtype=np.float_):
+    """Get cash flow series per column of type `dtype`."""
     col_idxs, col_lens = col_map
     col_start_idxs = np.cumsum(col_lens) - col_lens
-    out = np.full(target_shape, 0., dtype=np.float_)
+    out = np.full(target_shape, 0., dtype=dtype)
 
     for col in range(col_lens.shape[0]):
         col_len = col_lens[col]
@@ -2406,7 +2885,7 @@ def cash_flow_grouped_nb(cash_flow, group_lens):
     """Get cash flow series per group."""
     check_group_lens(group_lens, cash_flow.shape[1])
 
-    out = np.empty((cash_flow.shape[0], len(group_lens)), dtype=np.float_)
+    out = np.empty((cash_flow.shape[0], len(group_lens)), dtype=cash_flow.dtype)
     from_col = 0
     for group in range(len(group_lens)):
         to_col = from_col + group_lens[group]
@@ -2513,7 +2992,7 @@ def holding_value_grouped_nb(holding_value, group_lens):
     """Get holding value series per group."""
     check_group_lens(group_lens, holding_value.shape[1])
 
-    out = np.empty((holding_value.shape[0], len(group_lens)), dtype=np.float_)
+    out = np.empty((holding_value.shape[0], len(group_lens)), dtype=holding_value.dtype)
     from_col = 0
     for group in range(len(group_lens)):
         to_col = from_col + group_lens[group]
@@ -2653,7 +3132,7 @@ def get_return_nb(input_value, output_value):
 @njit(cache=True)
 def returns_nb(value, init_cash):
     """Get portfolio return series per column/group."""
-    out = np.empty(value.shape, dtype=np.float_)
+    out = np.empty_like(value)
     for col in range(out.shape[1]):
         input_value = init_cash[col]
         for i in range(out.shape[0]):
@@ -2699,7 +3178,7 @@ def active_returns_nb(cash_flow, holding_value):
 @njit(cache=True)
 def market_value_nb(close, init_cash):
     """Get market value per column."""
-    return close / close[0] * init_cash
+    return close / close[0] * init_cash.astype(close.dtype)
 
 
 @njit(cache=True)
@@ -2707,7 +3186,7 @@ def market_value_grouped_nb(close, group_lens, init_cash_grouped):
     """Get market value per group."""
     check_group_lens(group_lens, close.shape[1])
 
-    out = np.empty((close.shape[0], len(group_lens)), dtype=np.float_)
+    out = np.empty((close.shape[0], len(group_lens)), dtype=close.dtype)
     from_col = 0
     for group in range(len(group_lens)):
         to_col = from_col + group_lens[group]
@@ -2731,7 +3210,7 @@ def total_market_return_nb(market_value):
 @njit(cache=True)
 def gross_exposure_nb(holding_value, cash):
     """Get gross exposure per column/group."""
-    out = np.empty(holding_value.shape, dtype=np.float_)
+    out = np.empty_like(holding_value)
     for col in range(out.shape[1]):
         for i in range(out.shape[0]):
             denom = add_nb(holding_value[i, col], cash[i, col])
@@ -2740,3 +3219,89 @@ def gross_exposure_nb(holding_value, cash):
             else:
                 out[i, col] = holding_value[i, col] / denom
     return out
+
+
+@njit(cache=True)
+def stats_nb(value, init_cash, total_profit, trade_records, col_map, incl_unrealized,
+             ann_factor, risk_free=0., required_return=0., ddof=1):
+    """Compute the main statistics per column/group.
+
+    Goes through `value` once to derive returns and the maximum drawdown, and through
+    `trade_records` once to derive trade statistics. Sharpe, Sortino and Calmar ratios are
+    computed by `vectorbt.returns.nb` functions that each scan the returns again, and the Calmar ratio
+    also recomputes the drawdown from returns. Returns are stored in a buffer that is reused
+    across columns, thus no series other than `value` are materialized.
+
+    Returns a structured array of type `vectorbt.portfolio.enums.stats_dt`.
+
+    Trade statistics such as `win_rate` are based on closed trades only, unless `incl_unrealized` is True.
+    Same as the corresponding metrics in `vectorbt.portfolio.base.Portfolio.stats`."""
+    col_idxs, col_lens = col_map
+    col_start_idxs = np.cumsum(col_lens) - col_lens
+    out = np.empty(value.shape[1], dtype=stats_dt)
+    returns = np.empty(value.shape[0], dtype=np.float_)
+
+    for col in range(value.shape[1]):
+        # Go through value
+        input_value = init_cash[col]
+        peak_value = np.nan
+        max_drawdown = 0.
+        for i in range(value.shape[0]):
+            output_value = value[i, col]
+            returns[i] = get_return_nb(input_value, output_value)
+            input_value = output_value
+            if not np.isnan(output_value):
+                if np.isnan(peak_value) or output_value > peak_value:
+                    peak_value = output_value
+                elif output_value < peak_value:
+                    drawdown = (output_value - peak_value) / peak_value
+                    if drawdown < max_drawdown:
+                        max_drawdown = drawdown
+
+        out[col]['total_return'] = total_profit[col] / init_cash[col]
+        out[col]['max_drawdown'] = max_drawdown
+        out[col]['sharpe_ratio'] = sharpe_ratio_1d_nb(returns, ann_factor, risk_free, ddof)
+        out[col]['sortino_ratio'] = sortino_ratio_1d_nb(returns, ann_factor, required_return)
+        out[col]['calmar_ratio'] = calmar_ratio_1d_nb(returns, ann_factor)
+
+        # Go through trades
+        open_trades = 0
+        closed_trades = 0
+        win_count = 0
+        loss_count = 0
+        total_win = 0.
+        total_loss = 0.
+        for k in range(col_lens[col]):
+            trade = trade_records[col_idxs[col_start_idxs[col] + k]]
+            if trade['status'] == TradeStatus.Open:
+                open_trades += 1
+                if not incl_unrealized:
+                    continue
+            else:
+                closed_trades += 1
+            if trade['pnl'] > 0:
+                win_count += 1
+                total_win += trade['pnl']
+            elif trade['pnl'] < 0:
+                loss_count += 1
+                total_loss += trade['pnl']
+        trade_count = open_trades + closed_trades if incl_unrealized else closed_trades
+
+        out[col]['total_trades'] = open_trades + closed_trades
+        out[col]['closed_trades'] = closed_trades
+        out[col]['open_trades'] = open_trades
+        if trade_count == 0:
+            out[col]['win_rate'] = np.nan
+            out[col]['profit_factor'] = np.nan
+            out[col]['expectancy'] = np.nan
+        else:
+            win_rate = win_count / trade_count
+            out[col]['win_rate'] = win_rate
+            if total_loss == 0:
+                out[col]['profit_factor'] = np.nan if total_win == 0 else np.inf
+            else:
+                out[col]['profit_factor'] = total_win / np.abs(total_loss)
+            avg_win = total_win / win_count if win_count > 0 else 0.
+            avg_loss = total_loss / loss_count if loss_count > 0 else 0.
+            out[col]['expectancy'] = win_rate * avg_win - (1 - win_rate) * np.abs(avg_loss)
+    return out
@@ -62,7 +62,8 @@ class Orders(Records):
         return self.copy(
             wrapper=new_wrapper,
             records_arr=new_records_arr,
-            close=new_close
+            close=new_close,
+            col_mapper=self.col_mapper._col_idxs_mapper(col_idxs, new_wrapper, new_records_arr['col'])
         ), group_idxs, col_idxs
 
     def _indexing_func(self, pd_indexing_func, **kwargs):
@@ -115,7 +116,7 @@ class Orders(Records):
     @cached_property
     def buy(self):
         """Buy operations."""
-        filter_mask = self.values['side'] == OrderSide.Buy
+        filter_mask = self.get_field_arr('side') == OrderSide.Buy
         return self.filter_by_mask(filter_mask)
 
     @cached_method
@@ -129,7 +130,7 @@ class Orders(Records):
     @cached_property
     def sell(self):
         """Sell operations."""
-        filter_mask = self.values['side'] == OrderSide.Sell
+        filter_mask = self.get_field_arr('side') == OrderSide.Sell
         return self.filter_by_mask(filter_mask)
 
     @cached_method
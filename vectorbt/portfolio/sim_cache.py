@@ -0,0 +1,238 @@
+"""On-disk cache of simulators specialized to user callbacks.
+
+`vectorbt.portfolio.nb.simulate_nb` and `vectorbt.portfolio.nb.simulate_row_wise_nb` take
+callbacks as first-class functions. Numba keys the type of a first-class function by the identity
+of its dispatcher, thus the simulator is recompiled for every new callback object and its on-disk
+cache (`cache=True`) never hits, even if the callback's code hasn't changed between processes.
+
+This module works around it by generating, for each unique set of callbacks, a Python module
+with a copy of the simulator that calls the callbacks as module globals instead of arguments.
+The module is named after a fingerprint of the callbacks, which covers their bytecode, constants,
+closure variables and referenced globals (recursively for other Numba functions), as well as the
+versions of Numba and of `vectorbt.portfolio.nb`. Since the callbacks aren't arguments anymore,
+the generated function can be cached by Numba and loaded by any other process that builds the
+same callbacks, without compiling the simulator again.
+
+Generated modules are executed when loaded, thus the cache directory must be private: it's created
+with mode 0700, and both the directory and each module must be owned by the current user and
+not writable by anyone else, otherwise `PermissionError` is raised.
+
+!!! note
+    The fingerprint is computed from the Python code of the callbacks, not from their compiled code.
+    Callbacks that depend on external state not visible in their code (such as attributes of
+    arbitrary objects) should not be cached."""
+
+import os
+import sys
+import hashlib
+import tempfile
+import importlib.util
+import io
+import stat
+import inspect
+import textwrap
+import tokenize
+import types
+import numpy as np
+import numba
+from numba.core.registry import CPUDispatcher
+
+_sim_modules = {}
+"""Loaded specialization modules keyed by fingerprint."""
+
+_nb_source_hash = None
+
+_cb_arg_names = {
+    False: ('prep_func_nb', 'group_prep_func_nb', 'segment_prep_func_nb', 'order_func_nb'),
+    True: ('prep_func_nb', 'row_prep_func_nb', 'segment_prep_func_nb', 'order_func_nb')
+}
+"""Names of the callback arguments of both simulators."""
+
+
+def get_specialized_source(row_wise, key):
+    """Generate source of a module with the simulator specialized to callbacks.
+
+    The simulator's code is copied from `vectorbt.portfolio.nb` and its callback arguments are
+    turned into module globals. This way, Numba links the callbacks statically rather than passing
+    them as first-class functions, which makes the simulator cacheable."""
+    from vectorbt.portfolio import nb
+
+    sim_func = nb.simulate_row_wise_nb if row_wise else nb.simulate_nb
+    cb_arg_names = _cb_arg_names[row_wise]
+    source = textwrap.dedent(inspect.getsource(sim_func.py_func))
+
+    # Find where the signature ends: the colon after the closing parenthesis of `def`
+    tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+    depth = 0
+    in_def = False
+    for token in tokens:
+        if token.type == tokenize.NAME and token.string == 'def' and not in_def:
+            in_def = True
+        elif in_def and token.type == tokenize.OP:
+            if token.string == '(':
+                depth += 1
+            elif token.string == ')':
+                depth -= 1
+            elif token.string == ':' and depth == 0:
+                break
+    else:
+        raise ValueError("Couldn't parse the signature of the simulator")
+    body = ''.join(source.splitlines(keepends=True)[token.end[0]:])
+
+    sig = inspect.signature(sim_func.py_func)
+    sig = sig.replace(parameters=[p for p in sig.parameters.values() if p.name not in cb_arg_names])
+    return '\n'.join([
+        f'"""Simulator specialized to callbacks with fingerprint {key}. Generated by vectorbt."""',
+        '',
+        'from numba import njit',
+        'from vectorbt.portfolio import nb as _nb',
+        '',
+        "globals().update({k: v for k, v in vars(_nb).items() if not k.startswith('__')})",
+        '',
+        ' = '.join([', '.join(cb_arg_names), ', '.join(['None'] * len(cb_arg_names))]),
+        '',
+        '',
+        '@njit(cache=True, nogil=True)',
+        f'def specialized_nb{sig}:',
+        body
+    ])
+
+
+def get_nb_source_hash():
+    """Get hash of the source of `vectorbt.portfolio.nb`."""
+    global _nb_source_hash
+
+    if _nb_source_hash is None:
+        from vectorbt.portfolio import nb
+
+        with open(nb.__file__, 'rb') as f:
+            _nb_source_hash = hashlib.sha256(f.read()).hexdigest()
+    return _nb_source_hash
+
+
+def _update_hash(h, obj, seen):
+    """Feed a representation of `obj` into the hash object `h`."""
+    if isinstance(obj, CPUDispatcher):
+        h.update(b'dispatcher')
+        _update_hash(h, obj.py_func, seen)
+        h.update(repr(sorted(obj.targetoptions.items())).encode())
+    elif isinstance(obj, types.FunctionType):
+        h.update(f'function:{obj.__module__}.{obj.__qualname__}'.encode())
+        if id(obj) in seen:
+            return
+        seen.add(id(obj))
+        _update_hash(h, obj.__code__, seen)
+        _update_hash(h, obj.__defaults__, seen)
+        if obj.__closure__ is not None:
+            for cell in obj.__closure__:
+                _update_hash(h, cell.cell_contents, seen)
+        for name in _iter_global_names(obj.__code__):
+            if name in obj.__globals__:
+                h.update(f'global:{name}'.encode())
+                _update_hash(h, obj.__globals__[name], seen)
+    elif isinstance(obj, types.CodeType):
+        h.update(obj.co_code)
+        h.update(repr(obj.co_names).encode())
+        h.update(repr(obj.co_varnames).encode())
+        for const in obj.co_consts:
+            _update_hash(h, const, seen)
+    elif isinstance(obj, types.ModuleType):
+        h.update(f'module:{obj.__name__}'.encode())
+    elif isinstance(obj, np.ndarray):
+        h.update(f'array:{obj.dtype.str}:{obj.shape}'.encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (tuple, list)):
+        h.update(f'{type(obj).__name__}:{len(obj)}'.encode())
+        for o in obj:
+            _update_hash(h, o, seen)
+    else:
+        h.update(f'{type(obj).__module__}.{type(obj).__qualname__}:{obj!r}'.encode())
+
+
+def _iter_global_names(code):
+    """Iterate over names referenced by `code` and its nested code objects."""
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _iter_global_names(const)
+
+
+def get_fingerprint(row_wise, prep_func_nb, stage_prep_func_nb, segment_prep_func_nb, order_func_nb):
+    """Get fingerprint of the callbacks passed to the simulator.
+
+    `stage_prep_func_nb` is `row_prep_func_nb` if `row_wise` is True, otherwise `group_prep_func_nb`."""
+    h = hashlib.sha256()
+    h.update(f'numba:{numba.__version__};nb:{get_nb_source_hash()};row_wise:{row_wise}'.encode())
+    for func in (prep_func_nb, stage_prep_func_nb, segment_prep_func_nb, order_func_nb):
+        if not isinstance(func, CPUDispatcher):
+            raise TypeError("Only Numba-compiled functions can be cached")
+        _update_hash(h, func, set())
+    return h.hexdigest()[:32]
+
+
+def get_cache_dir(cache_dir=None):
+    """Get the directory of generated modules.
+
+    Defaults to `sim_cache_dir` in `vectorbt.settings.portfolio`, or to `vectorbt_sim_cache_<uid>`
+    in the temporary directory if it's None, where `<uid>` is the id of the current user."""
+    from vectorbt import settings
+
+    if cache_dir is None:
+        cache_dir = settings.portfolio['sim_cache_dir']
+    if cache_dir is None:
+        dir_name = 'vectorbt_sim_cache'
+        if hasattr(os, 'getuid'):
+            dir_name += f'_{os.getuid()}'
+        cache_dir = os.path.join(tempfile.gettempdir(), dir_name)
+    return str(cache_dir)
+
+
+def assert_private(path):
+    """Raise `PermissionError` if `path` is a symlink, isn't owned by the current user,
+    or is writable by group or others.
+
+    Does nothing on platforms without user ids."""
+    if not hasattr(os, 'getuid'):  # pragma: no cover
+        return
+    st = os.lstat(path)
+    if stat.S_ISLNK(st.st_mode):
+        raise PermissionError(f"'{path}' must not be a symlink")
+    if st.st_uid != os.getuid():
+        raise PermissionError(f"'{path}' must be owned by the current user")
+    if st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"'{path}' must not be writable by group or others")
+
+
+def get_specialized_nb(row_wise, prep_func_nb, stage_prep_func_nb, segment_prep_func_nb,
+                       order_func_nb, cache_dir=None):
+    """Get simulator specialized to the callbacks.
+
+    Returns a Numba function that takes the same arguments as `vectorbt.portfolio.nb.simulate_nb`
+    (or `vectorbt.portfolio.nb.simulate_row_wise_nb` if `row_wise` is True) except the callbacks."""
+    key = get_fingerprint(row_wise, prep_func_nb, stage_prep_func_nb, segment_prep_func_nb, order_func_nb)
+    if key not in _sim_modules:
+        cache_dir = get_cache_dir(cache_dir)
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        assert_private(cache_dir)
+        module_name = 'vbt_sim_' + key
+        path = os.path.join(cache_dir, module_name + '.py')
+        if not os.path.exists(path):
+            source = get_specialized_source(row_wise, key)
+            # Write atomically since other processes may be generating the same module
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w') as f:
+                f.write(source)
+            os.replace(tmp_path, path)
+        assert_private(path)
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        _sim_modules[key] = module
+    module = _sim_modules[key]
+    # Bind callbacks before the first call (globals are frozen by Numba at compile time)
+    cb_funcs = (prep_func_nb, stage_prep_func_nb, segment_prep_func_nb, order_func_nb)
+    for name, func in zip(_cb_arg_names[row_wise], cb_funcs):
+        setattr(module, name, func)
+    return module.specialized_nb
@@ -159,7 +159,8 @@ class Trades(Records):
         return self.copy(
             wrapper=new_wrapper,
             records_arr=new_records_arr,
-            close=new_close
+            close=new_close,
+            col_mapper=self.col_mapper._col_idxs_mapper(col_idxs, new_wrapper, new_records_arr['col'])
         ), group_idxs, col_idxs
 
     def _indexing_func(self, pd_indexing_func, **kwargs):
@@ -177,9 +178,18 @@ class Trades(Records):
         return self._trade_type
 
     @classmethod
-    def from_orders(cls, orders, **kwargs):
-        """Build `Trades` from `vectorbt.portfolio.orders.Orders`."""
-        trade_records_arr = nb.orders_to_trades_nb(
+    def from_orders(cls, orders, parallel=None, **kwargs):
+        """Build `Trades` from `vectorbt.portfolio.orders.Orders`.
+
+        If `parallel` is True, processes columns in parallel using
+        `vectorbt.portfolio.nb.orders_to_trades_parallel_nb`. Defaults to `parallel`
+        in `vectorbt.settings.portfolio`."""
+        from vectorbt import settings
+
+        if parallel is None:
+            parallel = settings.portfolio['parallel']
+        func = nb.orders_to_trades_parallel_nb if parallel else nb.orders_to_trades_nb
+        trade_records_arr = func(
             orders.close.vbt.to_2d_array(),
             orders.values,
             orders.col_mapper.col_map
@@ -229,7 +239,7 @@ class Trades(Records):
     @cached_property
     def winning(self):
         """Winning trades."""
-        filter_mask = self.values['pnl'] > 0.
+        filter_mask = self.get_field_arr('pnl') > 0.
         return self.filter_by_mask(filter_mask)
 
     @cached_method
@@ -243,7 +253,7 @@ class Trades(Records):
     @cached_property
     def losing(self):
         """Losing trades."""
-        filter_mask = self.values['pnl'] < 0.
+        filter_mask = self.get_field_arr('pnl') < 0.
         return self.filter_by_mask(filter_mask)
 
     @cached_method
@@ -305,7 +315,7 @@ class Trades(Records):
     @cached_property
     def long(self):
         """Long trades."""
-        filter_mask = self.values['direction'] == TradeDirection.Long
+        filter_mask = self.get_field_arr('direction') == TradeDirection.Long
         return self.filter_by_mask(filter_mask)
 
     @cached_method
@@ -319,7 +329,7 @@ class Trades(Records):
     @cached_property
     def short(self):
         """Short trades."""
-        filter_mask = self.values['direction'] == TradeDirection.Short
+        filter_mask = self.get_field_arr('direction') == TradeDirection.Short
         return self.filter_by_mask(filter_mask)
 
     @cached_method
@@ -340,7 +350,7 @@ class Trades(Records):
     @cached_property
     def open(self):
         """Open trades."""
-        filter_mask = self.values['status'] == TradeStatus.Open
+        filter_mask = self.get_field_arr('status') == TradeStatus.Open
         return self.filter_by_mask(filter_mask)
 
     @cached_method
@@ -354,7 +364,7 @@ class Trades(Records):
     @cached_property
     def closed(self):
         """Closed trades."""
-        filter_mask = self.values['status'] == TradeStatus.Closed
+        filter_mask = self.get_field_arr('status') == TradeStatus.Closed
         return self.filter_by_mask(filter_mask)
 
     @cached_method
@@ -874,9 +884,18 @@ class Positions(Trades):
         raise NotImplementedError
 
     @classmethod
-    def from_trades(cls, trades, **kwargs):
-        """Build `Positions` from `Trades`."""
-        position_records_arr = nb.trades_to_positions_nb(trades.values, trades.col_mapper.col_map)
+    def from_trades(cls, trades, parallel=None, **kwargs):
+        """Build `Positions` from `Trades`.
+
+        If `parallel` is True, processes columns in parallel using
+        `vectorbt.portfolio.nb.trades_to_positions_parallel_nb`. Defaults to `parallel`
+        in `vectorbt.settings.portfolio`."""
+        from vectorbt import settings
+
+        if parallel is None:
+            parallel = settings.portfolio['parallel']
+        func = nb.trades_to_positions_parallel_nb if parallel else nb.trades_to_positions_nb
+        position_records_arr = func(trades.values, trades.col_mapper.col_map)
         return cls(trades.wrapper, position_records_arr, trades.close, **kwargs)
 
     @cached_method
@@ -234,6 +234,26 @@ respectively. Caching can be disabled globally via `vectorbt.settings`.
     Because of caching, class is meant to be immutable and all properties are read-only.
     To change any attribute, use the `copy` method and pass the attribute as keyword argument.
 
+## Columnar storage
+
+Records can also be stored as one contiguous array per field, see `vectorbt.records.columnar`.
+This makes `Records.get_field_arr` and `Records.map_field` zero-copy and filtering faster
+for records with many fields:
+
+```python-repl
+>>> columnar_records = records.to_columnar()
+>>> columnar_records.get_field_arr('some_field')
+array([10., 11., 12., 13., 14., 15., 16., 17., 18.])
+>>> columnar_records.filter_by_mask(mask).count()
+a    2
+b    1
+c    2
+dtype: int64
+```
+
+The structured array is built lazily once it's requested, for example, by `Records.values`
+or `Records.map`.
+
 ## Saving and loading
 
 Like any other class subclassing `vectorbt.utils.config.Pickleable`, we can save a `Records`
@@ -251,6 +271,7 @@ from vectorbt.base.array_wrapper import ArrayWrapper, Wrapping
 from vectorbt.records import nb
 from vectorbt.records.mapped_array import MappedArray
 from vectorbt.records.col_mapper import ColumnMapper
+from vectorbt.records.columnar import ColumnarArray
 
 
 class Records(Wrapping):
@@ -261,19 +282,24 @@ class Records(Wrapping):
         wrapper (ArrayWrapper): Array wrapper.
 
             See `vectorbt.base.array_wrapper.ArrayWrapper`.
-        records_arr (array_like): A structured NumPy array of records.
+        records_arr (array_like or ColumnarArray): A structured NumPy array of records.
 
             Must have the fields `id` (record index) and `col` (column index).
+            Can also be `vectorbt.records.columnar.ColumnarArray` for columnar storage.
         idx_field (str): The name of the field corresponding to the index. Optional.
 
             Searches for a field with name 'idx' if `idx_field` is 'auto'.
             Throws an error if the name was provided explicitly and the field cannot be found.
+        col_mapper (ColumnMapper): Column mapper to reuse. Optional.
+
+            Reused only if built for the same column array, see `vectorbt.records.col_mapper.ColumnMapper.rebind`.
+            Isn't part of the config, but passed by `Records.copy` automatically.
         **kwargs: Custom keyword arguments passed to the config.
 
             Useful if any subclass wants to extend the config.
     """
 
-    def __init__(self, wrapper, records_arr, idx_field='auto', **kwargs):
+    def __init__(self, wrapper, records_arr, idx_field='auto', col_mapper=None, **kwargs):
         Wrapping.__init__(
             self,
             wrapper,
@@ -281,7 +307,8 @@ class Records(Wrapping):
             idx_field=idx_field,
             **kwargs
         )
-        records_arr = np.asarray(records_arr)
+        if not isinstance(records_arr, ColumnarArray):
+            records_arr = np.asarray(records_arr)
         checks.assert_not_none(records_arr.dtype.fields)
         checks.assert_in('id', records_arr.dtype.names)
         checks.assert_in('col', records_arr.dtype.names)
@@ -293,12 +320,33 @@ class Records(Wrapping):
 
         self._records_arr = records_arr
         self._idx_field = idx_field
-        self._col_mapper = ColumnMapper(wrapper, records_arr['col'])
+        if col_mapper is not None:
+            self._col_mapper = col_mapper.rebind(wrapper, records_arr['col'])
+        elif isinstance(records_arr, ColumnarArray) and records_arr.col_lens is not None:
+            self._col_mapper = ColumnMapper.from_col_lens(
+                wrapper,
+                records_arr['col'],
+                records_arr.col_lens,
+                col_idxs=records_arr.col_idxs
+            )
+        else:
+            self._col_mapper = ColumnMapper(wrapper, records_arr['col'])
+
+    def copy(self, **new_config):
+        """Same as `vectorbt.utils.config.Configured.copy` but also passes the column mapper.
+
+        The column mapper is dropped by the new instance if the column array has changed."""
+        if 'col_mapper' not in new_config:
+            new_config['col_mapper'] = self.col_mapper
+        return Wrapping.copy(self, **new_config)
 
     def _col_idxs_records(self, col_idxs):
         """Get records corresponding to column indices.
 
         Returns new records array."""
+        if self.is_columnar:
+            new_indices, new_col_arr = self.col_mapper._col_idxs_meta(col_idxs)
+            return self._records_arr[new_indices].replace(col=new_col_arr)
         if self.col_mapper.is_sorted():
             new_records_arr = nb.record_col_range_select_nb(
                 self.values, self.col_mapper.col_range, to_1d(col_idxs))  # faster
@@ -316,21 +364,49 @@ class Records(Wrapping):
 
     def _indexing_func(self, pd_indexing_func, **kwargs):
         """Perform indexing on `Records`."""
-        new_wrapper, new_records_arr, _, _ = self._indexing_func_meta(pd_indexing_func, **kwargs)
+        new_wrapper, new_records_arr, _, col_idxs = self._indexing_func_meta(pd_indexing_func, **kwargs)
         return self.copy(
             wrapper=new_wrapper,
-            records_arr=new_records_arr
+            records_arr=new_records_arr,
+            col_mapper=self.col_mapper._col_idxs_mapper(col_idxs, new_wrapper, new_records_arr['col'])
         )
 
     @property
     def records_arr(self):
-        """Records array."""
+        """Records array.
+
+        Converted lazily to a structured array if stored in columnar format."""
+        if self.is_columnar:
+            return self._records_arr.to_structured()
         return self._records_arr
 
     values = records_arr
 
     def __len__(self):
-        return len(self.values)
+        return len(self._records_arr)
+
+    @property
+    def is_columnar(self):
+        """Whether records are stored in columnar format."""
+        return isinstance(self._records_arr, ColumnarArray)
+
+    def to_columnar(self, **kwargs):
+        """Return a new class instance with records stored in columnar format.
+
+        See `vectorbt.records.columnar.ColumnarArray`."""
+        if self.is_columnar:
+            return self.copy(**kwargs)
+        return self.copy(records_arr=ColumnarArray.from_structured(self._records_arr), **kwargs)
+
+    def to_structured(self, **kwargs):
+        """Return a new class instance with records stored as a structured array."""
+        return self.copy(records_arr=self.records_arr, **kwargs)
+
+    def get_field_arr(self, field):
+        """Get array of a field.
+
+        Zero-copy if records are stored in columnar format, otherwise a strided view."""
+        return self._records_arr[field]
 
     @property
     def idx_field(self):
@@ -340,6 +416,8 @@ class Records(Wrapping):
     @property
     def records(self):
         """Records."""
+        if self.is_columnar:
+            return pd.DataFrame(self._records_arr.fields)
         return pd.DataFrame.from_records(self.values)
 
     @property
@@ -357,8 +435,8 @@ class Records(Wrapping):
     def is_sorted(self, incl_id=False):
         """Check whether records are sorted."""
         if incl_id:
-            return nb.is_col_idx_sorted_nb(self.values['col'], self.values['id'])
-        return nb.is_col_sorted_nb(self.values['col'])
+            return nb.is_col_idx_sorted_nb(self.get_field_arr('col'), self.get_field_arr('id'))
+        return self.col_mapper.is_sorted()
 
     def sort(self, incl_id=False, group_by=None, **kwargs):
         """Sort records by columns (primary) and ids (secondary, optional).
@@ -368,14 +446,19 @@ class Records(Wrapping):
         if self.is_sorted(incl_id=incl_id):
             return self.copy(**kwargs).regroup(group_by)
         if incl_id:
-            ind = np.lexsort((self.values['id'], self.values['col']))  # expensive!
+            ind = np.lexsort((self.get_field_arr('id'), self.get_field_arr('col')))  # expensive!
         else:
-            ind = np.argsort(self.values['col'])
-        return self.copy(records_arr=self.values[ind], **kwargs).regroup(group_by)
+            ind = np.argsort(self.get_field_arr('col'))
+        return self.copy(records_arr=self._records_arr[ind], **kwargs).regroup(group_by)
 
     def filter_by_mask(self, mask, group_by=None, **kwargs):
-        """Return a new class instance, filtered by mask."""
-        return self.copy(records_arr=self.values[mask], **kwargs).regroup(group_by)
+        """Return a new class instance, filtered by mask.
+
+        The column index is remapped rather than rebuilt.
+        See `vectorbt.records.col_mapper.ColumnMapper.filter_by_mask`."""
+        new_records_arr = self._records_arr[mask]
+        col_mapper = self.col_mapper.filter_by_mask(mask, col_arr=new_records_arr['col'])
+        return self.copy(records_arr=new_records_arr, col_mapper=col_mapper, **kwargs).regroup(group_by)
 
     def map(self, map_func_nb, *args, idx_field=None, value_map=None, group_by=None, **kwargs):
         """Map each record to a scalar value. Returns mapped array.
@@ -386,16 +469,17 @@ class Records(Wrapping):
         if idx_field is None:
             idx_field = self.idx_field
         if idx_field is not None:
-            idx_arr = self.values[idx_field]
+            idx_arr = self.get_field_arr(idx_field)
         else:
             idx_arr = None
         return MappedArray(
             self.wrapper,
             mapped_arr,
-            self.values['col'],
-            id_arr=self.values['id'],
+            self.get_field_arr('col'),
+            id_arr=self.get_field_arr('id'),
             idx_arr=idx_arr,
             value_map=value_map,
+            col_mapper=self.col_mapper,
             **kwargs
         ).regroup(group_by)
 
@@ -404,16 +488,17 @@ class Records(Wrapping):
         if idx_field is None:
             idx_field = self.idx_field
         if idx_field is not None:
-            idx_arr = self.values[idx_field]
+            idx_arr = self.get_field_arr(idx_field)
         else:
             idx_arr = None
         return MappedArray(
             self.wrapper,
-            self.values[field],
-            self.values['col'],
-            id_arr=self.values['id'],
+            self.get_field_arr(field),
+            self.get_field_arr('col'),
+            id_arr=self.get_field_arr('id'),
             idx_arr=idx_arr,
             value_map=value_map,
+            col_mapper=self.col_mapper,
             **kwargs
         ).regroup(group_by)
 
@@ -423,20 +508,21 @@ class Records(Wrapping):
          The length of the array should match that of the records."""
         if not isinstance(a, np.ndarray):
             a = np.asarray(a)
-        checks.assert_shape_equal(a, self.values)
+        checks.assert_shape_equal(a, self.get_field_arr('id'))
         if idx_field is None:
             idx_field = self.idx_field
         if idx_field is not None:
-            idx_arr = self.values[idx_field]
+            idx_arr = self.get_field_arr(idx_field)
         else:
             idx_arr = None
         return MappedArray(
             self.wrapper,
             a,
-            self.values['col'],
-            id_arr=self.values['id'],
+            self.get_field_arr('col'),
+            id_arr=self.get_field_arr('id'),
             idx_arr=idx_arr,
             value_map=value_map,
+            col_mapper=self.col_mapper,
             **kwargs
         ).regroup(group_by)
 
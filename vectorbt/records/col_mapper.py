@@ -1,16 +1,60 @@
 """Class for mapping column arrays."""
 
-from vectorbt.utils.decorators import cached_property, cached_method
+import numpy as np
+
+from vectorbt.utils.decorators import cached_method
 from vectorbt.base.reshape_fns import to_1d
 from vectorbt.records import nb
 
 
+def is_same_array(a, b):
+    """Check whether both arrays point to the same memory with the same layout.
+
+    Unlike comparing the elements, this check doesn't depend on the size of the arrays."""
+    if a is b:
+        return True
+    if not isinstance(a, np.ndarray) or not isinstance(b, np.ndarray):
+        return False
+    return a.shape == b.shape \
+        and a.strides == b.strides \
+        and a.dtype == b.dtype \
+        and a.__array_interface__['data'][0] == b.__array_interface__['data'][0]
+
+
 class ColumnMapper:
     """Used by `vectorbt.records.base.Records` and `vectorbt.records.mapped_array.MappedArray`
-    classes to make use of column and group metadata."""
-    def __init__(self, wrapper, col_arr):
+    classes to make use of column and group metadata.
+
+    Column range, column map and sortedness are computed at most once per column array and
+    can be passed to the constructor if they are already known. Column arrays are never modified,
+    thus the same column mapper is shared by all objects that are built upon the same column array,
+    such as records and the mapped arrays produced by `vectorbt.records.base.Records.map_field`.
+    Views obtained by filtering or column selection derive their index from this one
+    rather than building it from scratch."""
+
+    def __init__(self, wrapper, col_arr, col_range=None, col_map=None, is_sorted=None):
         self._wrapper = wrapper
         self._col_arr = col_arr
+        self._col_range = col_range
+        self._col_map = col_map
+        self._is_sorted = is_sorted
+
+    @classmethod
+    def from_col_lens(cls, wrapper, col_arr, col_lens, col_idxs=None):
+        """Build column mapper from the number of elements in each column.
+
+        If `col_idxs` is None, elements must be sorted by column, and the column range is derived
+        from `col_lens` without scanning `col_arr`. Otherwise, `col_idxs` and `col_lens` form the column map.
+        Columns that are missing at the end of `col_lens` have no elements."""
+        n_cols = len(wrapper.columns)
+        col_lens = np.asarray(col_lens)
+        if len(col_lens) > n_cols:
+            return cls(wrapper, col_arr)
+        if len(col_lens) < n_cols:
+            col_lens = np.concatenate((col_lens, np.full(n_cols - len(col_lens), 0, dtype=np.int_)))
+        if col_idxs is None:
+            return cls(wrapper, col_arr, col_range=nb.col_lens_to_range_nb(col_lens), is_sorted=True)
+        return cls(wrapper, col_arr, col_map=(col_idxs, col_lens), is_sorted=False)
 
     def _col_idxs_meta(self, col_idxs):
         """Get metadata of column indices.
@@ -23,6 +67,69 @@ class ColumnMapper:
             new_indices, new_col_arr = nb.col_map_select_nb(self.col_map, to_1d(col_idxs))
         return new_indices, new_col_arr
 
+    def _col_idxs_mapper(self, col_idxs, new_wrapper, new_col_arr):
+        """Get column mapper of the elements selected by column indices.
+
+        Selected elements are ordered by their new column, thus the new index can be derived
+        from the number of elements in each column."""
+        col_lens = self.col_map[1][to_1d(col_idxs)]
+        return ColumnMapper(
+            new_wrapper,
+            new_col_arr,
+            col_range=nb.col_lens_to_range_nb(col_lens),
+            col_map=(np.arange(len(new_col_arr)), col_lens),
+            is_sorted=True
+        )
+
+    def rebind(self, wrapper, col_arr):
+        """Get column mapper for `wrapper` and `col_arr`.
+
+        Returns itself if nothing has changed. If `col_arr` is the same array but `wrapper`
+        has changed (for example, after regrouping), returns a new column mapper that shares
+        the index of this one. Otherwise, returns a new column mapper that builds its own index."""
+        if not is_same_array(col_arr, self.col_arr):
+            return ColumnMapper(wrapper, col_arr)
+        if wrapper is self.wrapper:
+            return self
+        if len(wrapper.columns) != len(self.wrapper.columns):
+            return ColumnMapper(wrapper, col_arr)
+        return ColumnMapper(
+            wrapper,
+            col_arr,
+            col_range=self._col_range,
+            col_map=self._col_map,
+            is_sorted=self._is_sorted
+        )
+
+    def filter_by_mask(self, mask, col_arr=None):
+        """Get column mapper of the elements filtered by mask.
+
+        `col_arr` defaults to the column array filtered by mask.
+
+        Filtering by a boolean mask, strictly increasing indices or a slice with a positive step
+        retains the order, thus a sorted column array stays sorted. Other indices can reorder elements,
+        in which case sortedness is checked again lazily. If `mask` is a boolean array and the column
+        range has already been computed, it's remapped in one pass. The column map of an unsorted
+        column array is built lazily: scanning the filtered column array is cheaper than gathering
+        the surviving indices from the old map."""
+        if col_arr is None:
+            col_arr = self.col_arr[mask]
+        if not self._is_sorted:
+            return ColumnMapper(self.wrapper, col_arr)
+        if isinstance(mask, slice):
+            if mask.step is not None and mask.step < 0:
+                return ColumnMapper(self.wrapper, col_arr)
+            return ColumnMapper(self.wrapper, col_arr, is_sorted=True)
+        mask = np.asarray(mask)
+        if mask.dtype != np.bool_:
+            idxs = np.where(mask < 0, mask + len(self.col_arr), mask)
+            if np.any(np.diff(idxs) <= 0):
+                return ColumnMapper(self.wrapper, col_arr)
+        col_range = None
+        if mask.dtype == np.bool_ and mask.shape == self.col_arr.shape and self._col_range is not None:
+            col_range = nb.col_range_filter_nb(self._col_range, mask)
+        return ColumnMapper(self.wrapper, col_arr, col_range=col_range, is_sorted=True)
+
     @property
     def wrapper(self):
         """Array wrapper."""
@@ -43,13 +150,15 @@ class ColumnMapper:
             col_arr = self.col_arr
         return col_arr
 
-    @cached_property
+    @property
     def col_range(self):
         """Column index.
 
         Faster than `ColumnMapper.col_map` but only compatible with sorted columns.
         More suited for records."""
-        return nb.col_range_nb(self.col_arr, len(self.wrapper.columns))
+        if self._col_range is None:
+            self._col_range = nb.col_range_nb(self.col_arr, len(self.wrapper.columns))
+        return self._col_range
 
     @cached_method
     def get_col_range(self, group_by=None):
@@ -60,13 +169,19 @@ class ColumnMapper:
         columns = self.wrapper.get_columns(group_by=group_by)
         return nb.col_range_nb(col_arr, len(columns))
 
-    @cached_property
+    @property
     def col_map(self):
         """Column map.
 
         More flexible than `ColumnMapper.col_range`.
         More suited for mapped arrays."""
-        return nb.col_map_nb(self.col_arr, len(self.wrapper.columns))
+        if self._col_map is None:
+            if self._is_sorted and self._col_range is not None:
+                col_lens = np.where(self._col_range[:, 0] == -1, 0, self._col_range[:, 1] - self._col_range[:, 0])
+                self._col_map = (np.arange(len(self.col_arr)), col_lens)
+            else:
+                self._col_map = nb.col_map_nb(self.col_arr, len(self.wrapper.columns))
+        return self._col_map
 
     @cached_method
     def get_col_map(self, group_by=None):
@@ -77,9 +192,8 @@ class ColumnMapper:
         columns = self.wrapper.get_columns(group_by=group_by)
         return nb.col_map_nb(col_arr, len(columns))
 
-    @cached_method
     def is_sorted(self):
         """Check whether column array is sorted."""
-        return nb.is_col_sorted_nb(self.col_arr)
-
-
+        if self._is_sorted is None:
+            self._is_sorted = nb.is_col_sorted_nb(self.col_arr)
+        return self._is_sorted
@@ -0,0 +1,161 @@
+"""Columnar storage of records.
+
+A structured NumPy array stores records row by row, thus reading one field of a record type
+with dozens of fields, such as `vectorbt.portfolio.enums.log_dt`, strides over the whole array.
+`ColumnarArray` stores the same data as one contiguous array per field, which makes reading
+and mapping a field zero-copy and filtering touch only contiguous memory.
+
+Pass it to `vectorbt.records.base.Records` in place of a structured array, or use
+`vectorbt.records.base.Records.to_columnar`:
+
+```python-repl
+>>> import numpy as np
+>>> from vectorbt.records.columnar import ColumnarArray
+
+>>> arr = ColumnarArray.from_structured(np.array(
+...     [(0, 0, 10.), (1, 1, 11.)],
+...     dtype=[('id', np.int_), ('col', np.int_), ('some_field', np.float_)]
+... ))
+>>> arr['some_field']
+array([10., 11.])
+>>> arr[arr['some_field'] > 10].to_structured()
+array([(1, 1, 11.)],
+      dtype=[('id', '<i8'), ('col', '<i8'), ('some_field', '<f8')])
+```"""
+
+import numpy as np
+
+from vectorbt.utils import checks
+
+
+class ColumnarArray:
+    """Struct-of-arrays alternative to a structured NumPy array.
+
+    Args:
+        fields (dict): Dict of one-dimensional arrays of the same length, keyed by field name.
+        dtype (np.dtype): Structured data type. Optional.
+
+            Used when converting to a structured array. Defaults to the data types of the fields.
+        col_lens (array_like): Number of records in each column. Optional.
+
+            Together with `col_idxs`, forms a column index that is saved along with the records
+            (see `vectorbt.utils.store`). `vectorbt.records.base.Records` uses it instead of
+            scanning the column field, see `vectorbt.records.col_mapper.ColumnMapper.from_col_lens`.
+        col_idxs (array_like): Indices of records segmented by column. Optional.
+
+            Must be None if records are sorted by column.
+
+    Indexing with a field name returns the field array as it is. Indexing with an integer
+    returns the record. Any other index (mask, indices or slice) is applied to each field
+    and returns a new `ColumnarArray` without column index.
+
+    The structured array is built lazily by `ColumnarArray.to_structured` and cached."""
+
+    def __init__(self, fields, dtype=None, col_lens=None, col_idxs=None):
+        fields = {k: np.asarray(v) for k, v in fields.items()}
+        if dtype is None:
+            dtype = np.dtype([(k, v.dtype) for k, v in fields.items()])
+        else:
+            dtype = np.dtype(dtype)
+            checks.assert_not_none(dtype.fields)
+            checks.assert_len_equal(dtype.names, fields.keys())
+            fields = {k: fields[k] for k in dtype.names}
+        length = None
+        for k, v in fields.items():
+            checks.assert_ndim(v, 1)
+            if length is None:
+                length = len(v)
+            elif len(v) != length:
+                raise ValueError(f"Field '{k}' must have length {length}")
+        self._fields = fields
+        self._dtype = dtype
+        self._len = length if length is not None else 0
+        self._col_lens = col_lens
+        self._col_idxs = col_idxs
+        self._structured = None
+
+    @classmethod
+    def from_structured(cls, records_arr):
+        """Build `ColumnarArray` from a structured array.
+
+        Copies each field into a contiguous array."""
+        records_arr = np.asarray(records_arr)
+        checks.assert_not_none(records_arr.dtype.fields)
+        return cls(
+            {k: np.ascontiguousarray(records_arr[k]) for k in records_arr.dtype.names},
+            dtype=records_arr.dtype
+        )
+
+    def to_structured(self):
+        """Convert to a structured array.
+
+        The result is cached, thus the conversion is only done once."""
+        if self._structured is None:
+            out = np.empty(self._len, dtype=self.dtype)
+            for k, v in self._fields.items():
+                out[k] = v
+            self._structured = out
+        return self._structured
+
+    @property
+    def fields(self):
+        """Dict of field arrays."""
+        return self._fields
+
+    @property
+    def col_lens(self):
+        """Number of records in each column, if known."""
+        return self._col_lens
+
+    @property
+    def col_idxs(self):
+        """Indices of records segmented by column, if known and records are not sorted by column."""
+        return self._col_idxs
+
+    @property
+    def dtype(self):
+        """Structured data type."""
+        return self._dtype
+
+    @property
+    def shape(self):
+        """Shape."""
+        return (self._len,)
+
+    @property
+    def ndim(self):
+        """Number of dimensions."""
+        return 1
+
+    @property
+    def nbytes(self):
+        """Total bytes consumed by the field arrays."""
+        return sum(v.nbytes for v in self._fields.values())
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._fields[key]
+        if isinstance(key, (int, np.integer)):
+            return self.to_structured()[key]
+        if isinstance(key, list):
+            key = np.asarray(key)
+        if isinstance(key, np.ndarray) and key.dtype == np.bool_:
+            key = np.flatnonzero(key)  # resolve the mask only once
+        return ColumnarArray({k: v[key] for k, v in self._fields.items()}, dtype=self.dtype)
+
+    def replace(self, **fields):
+        """Return a new `ColumnarArray` with some fields replaced.
+
+        Other fields are shared, not copied."""
+        return ColumnarArray({**self._fields, **fields}, dtype=self.dtype)
+
+    def __eq__(self, other):
+        if not isinstance(other, ColumnarArray):
+            return False
+        return self.dtype == other.dtype and checks.is_deep_equal(self.fields, other.fields)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(shape={self.shape}, dtype={self.dtype})"
@@ -103,6 +103,22 @@ z  12.0  15.0  18.0
 5   15.0     NaN
 ```
 
+Both methods accept `sparse=True` to return a `scipy.sparse.csc_matrix` that stores only
+the mapped values, which is way more memory-friendly if most matrix elements are missing.
+Use `MappedArray.from_sparse` to reduce a sparse matrix without converting it to a dense one:
+
+```python-repl
+>>> mat = ma.to_matrix(sparse=True)
+>>> mat.nnz
+9
+
+>>> vbt.MappedArray.from_sparse(wrapper, mat).mean()
+a    11.0
+b    14.0
+c    17.0
+Name: mean, dtype: float64
+```
+
 ## Filtering
 
 Use `MappedArray.filter_by_mask` to filter elements per column/group:
@@ -251,6 +267,7 @@ instance to the disk with `MappedArray.save` and load it with `MappedArray.load`
 
 import numpy as np
 import pandas as pd
+from scipy import sparse as sp
 
 from vectorbt.utils import checks
 from vectorbt.utils.decorators import cached_method
@@ -307,12 +324,17 @@ class MappedArray(Wrapping):
 
             Must be of the same size as `mapped_arr`.
         value_map (namedtuple, dict or callable): Value map.
+        col_mapper (ColumnMapper): Column mapper to reuse. Optional.
+
+            Reused only if built for the same column array, see `vectorbt.records.col_mapper.ColumnMapper.rebind`.
+            Isn't part of the config, but passed by `MappedArray.copy` automatically.
         **kwargs: Custom keyword arguments passed to the config.
 
             Useful if any subclass wants to extend the config.
     """
 
-    def __init__(self, wrapper, mapped_arr, col_arr, id_arr=None, idx_arr=None, value_map=None, **kwargs):
+    def __init__(self, wrapper, mapped_arr, col_arr, id_arr=None, idx_arr=None,
+                 value_map=None, col_mapper=None, **kwargs):
         Wrapping.__init__(
             self,
             wrapper,
@@ -340,7 +362,42 @@ class MappedArray(Wrapping):
         self._col_arr = col_arr
         self._idx_arr = idx_arr
         self._value_map = value_map
-        self._col_mapper = ColumnMapper(wrapper, col_arr)
+        if col_mapper is not None:
+            self._col_mapper = col_mapper.rebind(wrapper, col_arr)
+        else:
+            self._col_mapper = ColumnMapper(wrapper, col_arr)
+
+    @classmethod
+    def from_sparse(cls, wrapper, matrix, **kwargs):
+        """Build `MappedArray` from a sparse matrix, such as one returned by `MappedArray.to_matrix`
+        with `sparse=True`.
+
+        Stored elements (including explicit zeros) become mapped values and their rows become `idx_arr`.
+        The matrix must have one column per column in `wrapper`. A CSC matrix is used without copying
+        its values, and its index pointer is used as the column index without scanning the column array.
+
+        `**kwargs` are passed to `MappedArray`."""
+        matrix = sp.csc_matrix(matrix)
+        if matrix.shape != wrapper.shape_2d:
+            raise ValueError(f"Matrix must have shape {wrapper.shape_2d}, not {matrix.shape}")
+        col_lens = np.diff(matrix.indptr)
+        col_arr = np.repeat(np.arange(matrix.shape[1]), col_lens)
+        return cls(
+            wrapper,
+            matrix.data,
+            col_arr,
+            idx_arr=matrix.indices,
+            col_mapper=ColumnMapper.from_col_lens(wrapper, col_arr, col_lens),
+            **kwargs
+        )
+
+    def copy(self, **new_config):
+        """Same as `vectorbt.utils.config.Configured.copy` but also passes the column mapper.
+
+        The column mapper is dropped by the new instance if the column array has changed."""
+        if 'col_mapper' not in new_config:
+            new_config['col_mapper'] = self.col_mapper
+        return Wrapping.copy(self, **new_config)
 
     def _indexing_func_meta(self, pd_indexing_func, **kwargs):
         """Perform indexing on `MappedArray` and return metadata."""
@@ -357,14 +414,15 @@ class MappedArray(Wrapping):
 
     def _indexing_func(self, pd_indexing_func, **kwargs):
         """Perform indexing on `MappedArray`."""
-        new_wrapper, new_mapped_arr, new_col_arr, new_id_arr, new_idx_arr, _, _ = \
+        new_wrapper, new_mapped_arr, new_col_arr, new_id_arr, new_idx_arr, _, col_idxs = \
             self._indexing_func_meta(pd_indexing_func, **kwargs)
         return self.copy(
             wrapper=new_wrapper,
             mapped_arr=new_mapped_arr,
             col_arr=new_col_arr,
             id_arr=new_id_arr,
-            idx_arr=new_idx_arr
+            idx_arr=new_idx_arr,
+            col_mapper=self.col_mapper._col_idxs_mapper(col_idxs, new_wrapper, new_col_arr)
         )
 
     @property
@@ -409,7 +467,7 @@ class MappedArray(Wrapping):
         """Check whether mapped array is sorted."""
         if incl_id:
             return nb.is_col_idx_sorted_nb(self.col_arr, self.id_arr)
-        return nb.is_col_sorted_nb(self.col_arr)
+        return self.col_mapper.is_sorted()
 
     def sort(self, incl_id=False, idx_arr=None, group_by=None, **kwargs):
         """Sort mapped array by column array (primary) and id array (secondary, optional)."""
@@ -430,14 +488,19 @@ class MappedArray(Wrapping):
         ).regroup(group_by)
 
     def filter_by_mask(self, mask, idx_arr=None, group_by=None, **kwargs):
-        """Return a new class instance, filtered by mask."""
+        """Return a new class instance, filtered by mask.
+
+        The column index is remapped rather than rebuilt.
+        See `vectorbt.records.col_mapper.ColumnMapper.filter_by_mask`."""
         if idx_arr is None:
             idx_arr = self.idx_arr
+        new_col_arr = self.col_arr[mask]
         return self.copy(
             mapped_arr=self.values[mask],
-            col_arr=self.col_arr[mask],
+            col_arr=new_col_arr,
             id_arr=self.id_arr[mask],
             idx_arr=idx_arr[mask] if idx_arr is not None else None,
+            col_mapper=self.col_mapper.filter_by_mask(mask, col_arr=new_col_arr),
             **kwargs
         ).regroup(group_by)
 
@@ -449,24 +512,42 @@ class MappedArray(Wrapping):
         return nb.mapped_to_mask_nb(self.values, col_map, inout_map_func_nb, *args)
 
     @cached_method
-    def top_n_mask(self, n, **kwargs):
-        """Return mask of top N elements in each column."""
-        return self.map_to_mask(nb.top_n_inout_map_nb, n, **kwargs)
+    def top_n_mask(self, n, algorithm='sort', **kwargs):
+        """Return mask of top N elements in each column.
+
+        `algorithm` can be `sort` to sort each column, or `heap` to select elements
+        without sorting using `vectorbt.records.nb.top_n_heap_nb`, which is much faster
+        if `n` is small compared to the number of elements. The `heap` algorithm ignores NaNs."""
+        if algorithm == 'sort':
+            return self.map_to_mask(nb.top_n_inout_map_nb, n, **kwargs)
+        if algorithm == 'heap':
+            return self.map_to_mask(nb.top_n_heap_inout_map_nb, n, **kwargs)
+        raise ValueError(f"Algorithm '{algorithm}' is not supported")
 
     @cached_method
-    def bottom_n_mask(self, n, **kwargs):
-        """Return mask of bottom N elements in each column."""
-        return self.map_to_mask(nb.bottom_n_inout_map_nb, n, **kwargs)
+    def bottom_n_mask(self, n, algorithm='sort', **kwargs):
+        """Return mask of bottom N elements in each column.
+
+        See `MappedArray.top_n_mask` for `algorithm`."""
+        if algorithm == 'sort':
+            return self.map_to_mask(nb.bottom_n_inout_map_nb, n, **kwargs)
+        if algorithm == 'heap':
+            return self.map_to_mask(nb.bottom_n_heap_inout_map_nb, n, **kwargs)
+        raise ValueError(f"Algorithm '{algorithm}' is not supported")
 
     @cached_method
-    def top_n(self, n, **kwargs):
-        """Filter top N elements from each column."""
-        return self.filter_by_mask(self.top_n_mask(n), **kwargs)
+    def top_n(self, n, algorithm='sort', **kwargs):
+        """Filter top N elements from each column.
+
+        See `MappedArray.top_n_mask` for `algorithm`."""
+        return self.filter_by_mask(self.top_n_mask(n, algorithm=algorithm), **kwargs)
 
     @cached_method
-    def bottom_n(self, n, **kwargs):
-        """Filter bottom N elements from each column."""
-        return self.filter_by_mask(self.bottom_n_mask(n), **kwargs)
+    def bottom_n(self, n, algorithm='sort', **kwargs):
+        """Filter bottom N elements from each column.
+
+        See `MappedArray.top_n_mask` for `algorithm`."""
+        return self.filter_by_mask(self.bottom_n_mask(n, algorithm=algorithm), **kwargs)
 
     @cached_method
     def is_matrix_compatible(self, idx_arr=None, group_by=None):
@@ -479,11 +560,16 @@ class MappedArray(Wrapping):
         target_shape = self.wrapper.get_shape_2d(group_by=group_by)
         return nb.mapped_matrix_compatible_nb(col_arr, idx_arr, target_shape)
 
-    def to_matrix(self, idx_arr=None, default_val=np.nan, group_by=None, wrap_kwargs=None):
+    def to_matrix(self, idx_arr=None, default_val=np.nan, group_by=None, sparse=False, wrap_kwargs=None):
         """Convert mapped array to the matrix form.
 
         See `vectorbt.records.nb.mapped_to_matrix_nb`.
 
+        If `sparse` is True, returns a `scipy.sparse.csc_matrix` of the same shape that stores only
+        the mapped values (see `vectorbt.records.nb.mapped_to_csc_nb`). Missing elements are then
+        implicit zeros rather than `default_val`. Rows and columns follow the index and columns of
+        the wrapper. See `MappedArray.from_sparse` to reduce it.
+
         !!! note
             Will raise an error if there are multiple values pointing to the same matrix element.
 
@@ -496,13 +582,16 @@ class MappedArray(Wrapping):
             idx_arr = self.idx_arr
         if not self.is_matrix_compatible(idx_arr=idx_arr, group_by=group_by):
             raise ValueError("Multiple values are pointing to the same matrix element")
-        col_arr = self.col_mapper.get_col_arr(group_by=group_by)
         target_shape = self.wrapper.get_shape_2d(group_by=group_by)
+        if sparse:
+            col_map = self.col_mapper.get_col_map(group_by=group_by)
+            return sp.csc_matrix(nb.mapped_to_csc_nb(self.values, col_map, idx_arr), shape=target_shape)
+        col_arr = self.col_mapper.get_col_arr(group_by=group_by)
         out = nb.mapped_to_matrix_nb(self.values, col_arr, idx_arr, target_shape, default_val)
         return self.wrapper.wrap(out, group_by=group_by, **merge_dicts({}, wrap_kwargs))
 
     def reduce(self, reduce_func_nb, *args, idx_arr=None, to_array=False, to_idx=False,
-               idx_labeled=True, default_val=np.nan, group_by=None, wrap_kwargs=None):
+               idx_labeled=True, default_val=np.nan, group_by=None, parallel=None, wrap_kwargs=None):
         """Reduce mapped array by column.
 
         If `to_array` is False and `to_idx` is False, see `vectorbt.records.nb.reduce_mapped_nb`.
@@ -512,7 +601,16 @@ class MappedArray(Wrapping):
 
         If `to_idx` is True, must pass `idx_arr`. Set `idx_labeled` to False to return raw positions instead
         of labels. Use `default_val` to set the default value. Set `group_by` to False to disable grouping.
+
+        If `parallel` is True, reduces columns in parallel using the function with the `_parallel_nb` suffix,
+        such as `vectorbt.records.nb.reduce_mapped_parallel_nb`. Defaults to `parallel`
+        in `vectorbt.settings.mapped_array`.
         """
+        from vectorbt import settings
+
+        if parallel is None:
+            parallel = settings.mapped_array['parallel']
+
         # Perform checks
         checks.assert_numba_func(reduce_func_nb)
         if idx_arr is None:
@@ -525,7 +623,8 @@ class MappedArray(Wrapping):
         col_map = self.col_mapper.get_col_map(group_by=group_by)
         if not to_array:
             if not to_idx:
-                out = nb.reduce_mapped_nb(
+                func = nb.reduce_mapped_parallel_nb if parallel else nb.reduce_mapped_nb
+                out = func(
                     self.values,
                     col_map,
                     default_val,
@@ -533,7 +632,8 @@ class MappedArray(Wrapping):
                     *args
                 )
             else:
-                out = nb.reduce_mapped_to_idx_nb(
+                func = nb.reduce_mapped_to_idx_parallel_nb if parallel else nb.reduce_mapped_to_idx_nb
+                out = func(
                     self.values,
                     col_map,
                     idx_arr,
@@ -543,7 +643,8 @@ class MappedArray(Wrapping):
                 )
         else:
             if not to_idx:
-                out = nb.reduce_mapped_to_array_nb(
+                func = nb.reduce_mapped_to_array_parallel_nb if parallel else nb.reduce_mapped_to_array_nb
+                out = func(
                     self.values,
                     col_map,
                     default_val,
@@ -551,7 +652,8 @@ class MappedArray(Wrapping):
                     *args
                 )
             else:
-                out = nb.reduce_mapped_to_idx_array_nb(
+                func = nb.reduce_mapped_to_idx_array_parallel_nb if parallel else nb.reduce_mapped_to_idx_array_nb
+                out = func(
                     self.values,
                     col_map,
                     idx_arr,
@@ -633,8 +735,12 @@ class MappedArray(Wrapping):
         return self.reduce(generic_nb.argmax_reduce_nb, to_array=False, to_idx=True, **kwargs)
 
     @cached_method
-    def describe(self, percentiles=None, ddof=1, **kwargs):
-        """Return statistics by column."""
+    def describe(self, percentiles=None, ddof=1, approx=False, **kwargs):
+        """Return statistics by column.
+
+        If `approx` is True, computes statistics in a single pass over each column
+        using `vectorbt.generic.nb.describe_approx_reduce_nb`. Percentiles are then estimated
+        by the P² algorithm, which doesn't copy or sort values."""
         if percentiles is not None:
             percentiles = to_1d(percentiles, raw=True)
         else:
@@ -647,7 +753,7 @@ class MappedArray(Wrapping):
         index = pd.Index(['count', 'mean', 'std', 'min', *perc_formatted, 'max'])
         kwargs = merge_dicts(dict(wrap_kwargs=dict(name_or_index=index)), kwargs)
         out = self.reduce(
-            generic_nb.describe_reduce_nb,
+            generic_nb.describe_approx_reduce_nb if approx else generic_nb.describe_reduce_nb,
             percentiles,
             ddof,
             to_array=True,
@@ -670,11 +776,18 @@ class MappedArray(Wrapping):
             group_by=group_by, **wrap_kwargs)
 
     @cached_method
-    def value_counts(self, group_by=None, value_map=None, wrap_kwargs=None):
-        """Return a pandas object containing counts of unique values."""
+    def value_counts(self, group_by=None, value_map=None, parallel=None, wrap_kwargs=None):
+        """Return a pandas object containing counts of unique values.
+
+        See `MappedArray.reduce` for `parallel`."""
+        from vectorbt import settings
+
+        if parallel is None:
+            parallel = settings.mapped_array['parallel']
         mapped_codes, mapped_uniques = pd.factorize(self.values)
         col_map = self.col_mapper.get_col_map(group_by=group_by)
-        value_counts = nb.mapped_value_counts_nb(mapped_codes, col_map)
+        func = nb.mapped_value_counts_parallel_nb if parallel else nb.mapped_value_counts_nb
+        value_counts = func(mapped_codes, col_map)
         value_counts_df = self.wrapper.wrap(
             value_counts,
             index=mapped_uniques,
@@ -689,10 +802,20 @@ class MappedArray(Wrapping):
             value_counts_df.index = value_counts_df.index.map(value_map)
         return value_counts_df
 
-    def stack(self, group_by=None, default_val=np.nan, wrap_kwargs=None):
+    def stack(self, group_by=None, default_val=np.nan, sparse=False, wrap_kwargs=None):
         """Stack into a matrix.
 
-        Will lose index information and fill missing values with `default_val`."""
+        Will lose index information and fill missing values with `default_val`.
+
+        If `sparse` is True, returns a `scipy.sparse.csc_matrix` with one column per column
+        (or group), see `MappedArray.to_matrix`."""
+        if sparse:
+            col_map = self.col_mapper.get_col_map(group_by=group_by)
+            n_rows = np.max(col_map[1]) if len(col_map[1]) > 0 else 0
+            return sp.csc_matrix(
+                nb.mapped_to_csc_nb(self.values, col_map, None),
+                shape=(n_rows, len(col_map[1]))
+            )
         if self.wrapper.ndim == 1:
             return self.wrapper.wrap(
                 self.values,
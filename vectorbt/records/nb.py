@@ -13,7 +13,7 @@ These only accept NumPy arrays and other Numba-compatible types.
     Records should retain the order they were created in."""
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 
 # ############# Indexing ############# #
@@ -158,6 +158,47 @@ def record_col_map_select_nb(records, col_map, new_cols):
     return out
 
 
+@njit(cache=True)
+def col_range_filter_nb(col_range, mask):
+    """Filter column range `col_range` using boolean mask.
+
+    Returns column range of the filtered array. Since filtering retains the order,
+    the column range can be remapped in one pass instead of being rebuilt."""
+    col_range_out = np.full(col_range.shape, -1, dtype=np.int_)
+    j = 0
+
+    for col in range(col_range.shape[0]):
+        from_r = col_range[col, 0]
+        to_r = col_range[col, 1]
+        if from_r == -1 or to_r == -1:
+            continue
+        col_len = 0
+        for r in range(from_r, to_r):
+            if mask[r]:
+                col_len += 1
+        if col_len > 0:
+            col_range_out[col, 0] = j
+            col_range_out[col, 1] = j + col_len
+            j += col_len
+    return col_range_out
+
+
+@njit(cache=True)
+def col_lens_to_range_nb(col_lens):
+    """Build column range from the number of elements in each column.
+
+    Assumes that the elements are sorted by column."""
+    col_range_out = np.full((col_lens.shape[0], 2), -1, dtype=np.int_)
+    j = 0
+
+    for col in range(col_lens.shape[0]):
+        if col_lens[col] > 0:
+            col_range_out[col, 0] = j
+            col_range_out[col, 1] = j + col_lens[col]
+            j += col_lens[col]
+    return col_range_out
+
+
 # ############# Sorting ############# #
 
 
@@ -219,6 +260,70 @@ def bottom_n_inout_map_nb(inout, idxs, col, mapped_arr, n):
     inout[idxs[np.argsort(mapped_arr)[:n]]] = True
 
 
+@njit(cache=True)
+def top_n_heap_nb(a, n, largest=True):
+    """Return positions of the N largest (or smallest if `largest` is False) elements of `a`.
+
+    Keeps the best N elements seen so far in a binary heap with the worst of them at the root,
+    thus takes O(len(a) * log(n)) time and O(n) memory instead of sorting `a`.
+    NaNs are ignored. Among equal elements, those that come first are preferred.
+    Positions are returned in no particular order."""
+    sign = 1. if largest else -1.
+    n = min(n, a.shape[0])
+    heap_vals = np.empty(n, dtype=np.float_)
+    heap_pos = np.empty(n, dtype=np.int_)
+    size = 0
+    if n <= 0:
+        return heap_pos[:0]
+
+    for k in range(a.shape[0]):
+        v = sign * a[k]
+        if np.isnan(v):
+            continue
+        if size < n:
+            # Push and sift up
+            i = size
+            size += 1
+            while i > 0:
+                parent = (i - 1) // 2
+                if heap_vals[parent] <= v:
+                    break
+                heap_vals[i] = heap_vals[parent]
+                heap_pos[i] = heap_pos[parent]
+                i = parent
+            heap_vals[i] = v
+            heap_pos[i] = k
+        elif v > heap_vals[0]:
+            # Replace root and sift down
+            i = 0
+            while True:
+                child = 2 * i + 1
+                if child >= size:
+                    break
+                if child + 1 < size and heap_vals[child + 1] < heap_vals[child]:
+                    child += 1
+                if heap_vals[child] >= v:
+                    break
+                heap_vals[i] = heap_vals[child]
+                heap_pos[i] = heap_pos[child]
+                i = child
+            heap_vals[i] = v
+            heap_pos[i] = k
+    return heap_pos[:size]
+
+
+@njit(cache=True)
+def top_n_heap_inout_map_nb(inout, idxs, col, mapped_arr, n):
+    """`inout_map_func_nb` that returns indices of top N elements using `top_n_heap_nb`."""
+    inout[idxs[top_n_heap_nb(mapped_arr, n, largest=True)]] = True
+
+
+@njit(cache=True)
+def bottom_n_heap_inout_map_nb(inout, idxs, col, mapped_arr, n):
+    """`inout_map_func_nb` that returns indices of bottom N elements using `top_n_heap_nb`."""
+    inout[idxs[top_n_heap_nb(mapped_arr, n, largest=False)]] = True
+
+
 @njit
 def map_records_nb(records, map_func_nb, *args):
     """Map each record to a scalar value.
@@ -236,13 +341,22 @@ def map_records_nb(records, map_func_nb, *args):
 
 @njit(cache=True)
 def mapped_matrix_compatible_nb(col_arr, idx_arr, target_shape):
-    """Check whether mapped array can be converted to a matrix without positional conflicts."""
-    temp = np.zeros(target_shape)
-
+    """Check whether mapped array can be converted to a matrix without positional conflicts.
+
+    If the mapped array has much fewer elements than the matrix, sorts flat positions of the elements
+    instead of marking them in a matrix, such that sparse mapped arrays don't require dense memory."""
+    if len(col_arr) < target_shape[0] * target_shape[1] // 8:
+        flat_pos = np.sort(col_arr * target_shape[0] + idx_arr)
+        for i in range(1, len(flat_pos)):
+            if flat_pos[i] == flat_pos[i - 1]:
+                return False
+        return True
+
+    temp = np.full(target_shape, False, dtype=np.bool_)
     for i in range(len(col_arr)):
-        if temp[idx_arr[i], col_arr[i]] > 0:
+        if temp[idx_arr[i], col_arr[i]]:
             return False
-        temp[idx_arr[i], col_arr[i]] = 1
+        temp[idx_arr[i], col_arr[i]] = True
     return True
 
 
@@ -256,6 +370,32 @@ def mapped_to_matrix_nb(mapped_arr, col_arr, idx_arr, target_shape, default_val)
     return out
 
 
+@njit(cache=True)
+def mapped_to_csc_nb(mapped_arr, col_map, idx_arr):
+    """Convert mapped array to the compressed sparse column (CSC) format.
+
+    Returns values, their row indices, and the index pointer such that the elements of column `col`
+    are at positions `indptr[col]:indptr[col + 1]`. Only elements of the mapped array are stored.
+
+    If `idx_arr` is None, the row index of each element is its position in the column
+    (see `stack_mapped_nb`)."""
+    col_idxs, col_lens = col_map
+    indptr = np.empty(col_lens.shape[0] + 1, dtype=np.int_)
+    indptr[0] = 0
+    indptr[1:] = np.cumsum(col_lens)
+    data = np.empty(col_idxs.shape[0], dtype=np.float_)
+    indices = np.empty(col_idxs.shape[0], dtype=np.int_)
+
+    for col in range(col_lens.shape[0]):
+        for k in range(indptr[col], indptr[col + 1]):
+            data[k] = mapped_arr[col_idxs[k]]
+            if idx_arr is None:
+                indices[k] = k - indptr[col]
+            else:
+                indices[k] = idx_arr[col_idxs[k]]
+    return data, indices, indptr
+
+
 # ############# Reducing ############# #
 
 @njit
@@ -364,6 +504,106 @@ def reduce_mapped_to_idx_array_nb(mapped_arr, col_map, idx_arr, default_val, red
     return out
 
 
+@njit(parallel=True)
+def reduce_mapped_parallel_nb(mapped_arr, col_map, default_val, reduce_func_nb, *args):
+    """Parallel version of `reduce_mapped_nb`.
+
+    Columns are reduced in parallel, thus `reduce_func_nb` must not depend on the order of columns.
+
+    !!! note
+        Exceptions raised by `reduce_func_nb` aren't propagated with their original message."""
+    col_idxs, col_lens = col_map
+    col_start_idxs = np.cumsum(col_lens) - col_lens
+    out = np.full(col_lens.shape[0], default_val, dtype=np.float_)
+
+    for col in prange(col_lens.shape[0]):
+        col_len = col_lens[col]
+        if col_len == 0:
+            continue
+        start_idx = col_start_idxs[col]
+        idxs = col_idxs[start_idx:start_idx + col_len]
+        out[col] = reduce_func_nb(col, mapped_arr[idxs], *args)
+    return out
+
+
+@njit(parallel=True)
+def reduce_mapped_to_idx_parallel_nb(mapped_arr, col_map, idx_arr, default_val, reduce_func_nb, *args):
+    """Parallel version of `reduce_mapped_to_idx_nb`.
+
+    See `reduce_mapped_parallel_nb`."""
+    col_idxs, col_lens = col_map
+    col_start_idxs = np.cumsum(col_lens) - col_lens
+    out = np.full(col_lens.shape[0], default_val, dtype=np.float_)
+
+    for col in prange(col_lens.shape[0]):
+        col_len = col_lens[col]
+        if col_len == 0:
+            continue
+        start_idx = col_start_idxs[col]
+        idxs = col_idxs[start_idx:start_idx + col_len]
+        col_out = reduce_func_nb(col, mapped_arr[idxs], *args)
+        out[col] = idx_arr[idxs][col_out]
+    return out
+
+
+@njit(parallel=True)
+def reduce_mapped_to_array_parallel_nb(mapped_arr, col_map, default_val, reduce_func_nb, *args):
+    """Parallel version of `reduce_mapped_to_array_nb`.
+
+    The first non-empty column is reduced first to get the size of the output.
+    See `reduce_mapped_parallel_nb`."""
+    col_idxs, col_lens = col_map
+    col_start_idxs = np.cumsum(col_lens) - col_lens
+    for col in range(col_lens.shape[0]):
+        col_len = col_lens[col]
+        if col_len > 0:
+            start_idx = col_start_idxs[col]
+            col0, idxs0 = col, col_idxs[start_idx:start_idx + col_len]
+            break
+
+    col_out = reduce_func_nb(col0, mapped_arr[idxs0], *args)
+    out = np.full((col_out.shape[0], col_lens.shape[0]), default_val, dtype=np.float_)
+    out[:, col0] = col_out
+
+    for col in prange(col0 + 1, col_lens.shape[0]):
+        col_len = col_lens[col]
+        if col_len == 0:
+            continue
+        start_idx = col_start_idxs[col]
+        idxs = col_idxs[start_idx:start_idx + col_len]
+        out[:, col] = reduce_func_nb(col, mapped_arr[idxs], *args)
+    return out
+
+
+@njit(parallel=True)
+def reduce_mapped_to_idx_array_parallel_nb(mapped_arr, col_map, idx_arr, default_val, reduce_func_nb, *args):
+    """Parallel version of `reduce_mapped_to_idx_array_nb`.
+
+    See `reduce_mapped_to_array_parallel_nb`."""
+    col_idxs, col_lens = col_map
+    col_start_idxs = np.cumsum(col_lens) - col_lens
+    for col in range(col_lens.shape[0]):
+        col_len = col_lens[col]
+        if col_len > 0:
+            start_idx = col_start_idxs[col]
+            col0, idxs0 = col, col_idxs[start_idx:start_idx + col_len]
+            break
+
+    col_out = reduce_func_nb(col0, mapped_arr[idxs0], *args)
+    out = np.full((col_out.shape[0], col_lens.shape[0]), default_val, dtype=np.float_)
+    out[:, col0] = idx_arr[idxs0][col_out]
+
+    for col in prange(col0 + 1, col_lens.shape[0]):
+        col_len = col_lens[col]
+        if col_len == 0:
+            continue
+        start_idx = col_start_idxs[col]
+        idxs = col_idxs[start_idx:start_idx + col_len]
+        col_out = reduce_func_nb(col, mapped_arr[idxs], *args)
+        out[:, col] = idx_arr[idxs][col_out]
+    return out
+
+
 @njit(cache=True)
 def mapped_value_counts_nb(mapped_codes, col_map):
     """Get value counts of an already factorized mapped array."""
@@ -382,6 +622,24 @@ def mapped_value_counts_nb(mapped_codes, col_map):
     return out
 
 
+@njit(cache=True, parallel=True)
+def mapped_value_counts_parallel_nb(mapped_codes, col_map):
+    """Parallel version of `mapped_value_counts_nb`."""
+    col_idxs, col_lens = col_map
+    col_start_idxs = np.cumsum(col_lens) - col_lens
+    last_code = np.max(mapped_codes)
+    out = np.full((last_code + 1, col_lens.shape[0]), 0, dtype=np.int_)
+
+    for col in prange(col_lens.shape[0]):
+        col_len = col_lens[col]
+        if col_len == 0:
+            continue
+        start_idx = col_start_idxs[col]
+        for i in range(col_len):
+            out[mapped_codes[col_idxs[start_idx + i]], col] += 1
+    return out
+
+
 @njit(cache=True)
 def stack_mapped_nb(mapped_arr, col_map, default_val):
     """Stack mapped array."""
@@ -485,15 +485,21 @@ def tail_ratio_nb(returns):
     return out
 
 
-@njit
+@njit(cache=True)
 def rolling_tail_ratio_nb(returns, window, minp):
-    """Rolling version of `tail_ratio_nb`."""
-
-    def _apply_func_nb(i, col, _returns):
-        return tail_ratio_1d_nb(_returns)
-
-    return generic_nb.rolling_apply_nb(
-        returns, window, minp, _apply_func_nb)
+    """Rolling version of `tail_ratio_nb`.
+
+    Uses `vectorbt.generic.nb.rolling_quantile_nb` instead of sorting each window."""
+    perc_95 = np.abs(generic_nb.rolling_quantile_nb(returns, window, 0.95, minp=minp))
+    perc_5 = np.abs(generic_nb.rolling_quantile_nb(returns, window, 0.05, minp=minp))
+    out = np.empty_like(perc_95)
+    for col in range(out.shape[1]):
+        for i in range(out.shape[0]):
+            if perc_5[i, col] == 0.:
+                out[i, col] = np.inf
+            else:
+                out[i, col] = perc_95[i, col] / perc_5[i, col]
+    return out
 
 
 @njit(cache=True)
@@ -514,15 +520,12 @@ def value_at_risk_nb(returns, cutoff=0.05):
     return out
 
 
-@njit
+@njit(cache=True)
 def rolling_value_at_risk_nb(returns, window, minp, cutoff=0.05):
-    """Rolling version of `value_at_risk_nb`."""
+    """Rolling version of `value_at_risk_nb`.
 
-    def _apply_func_nb(i, col, _returns, _cutoff):
-        return value_at_risk_1d_nb(_returns, _cutoff)
-
-    return generic_nb.rolling_apply_nb(
-        returns, window, minp, _apply_func_nb, cutoff)
+    Uses `vectorbt.generic.nb.rolling_quantile_nb` instead of sorting each window."""
+    return generic_nb.rolling_quantile_nb(returns, window, cutoff, minp=minp)
 
 
 @njit(cache=True)
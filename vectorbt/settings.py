@@ -44,8 +44,11 @@ __all__ = [
     'layout',
     'ohlcv',
     'array_wrapper',
+    'generic',
+    'mapped_array',
     'broadcasting',
     'caching',
+    'shm',
     'returns',
     'portfolio',
     'data',
@@ -221,6 +224,38 @@ __pdoc__['array_wrapper'] = f"""Parameters for array wrapper.
 ```
 """
 
+# Generic
+generic = Config(
+    dict(
+        parallel=False
+    ),
+    frozen=True
+)
+"""_"""
+
+__pdoc__['generic'] = f"""Parameters for generic accessors.
+
+```plaintext
+{json.dumps(generic, indent=2, default=str)}
+```
+"""
+
+# Mapped array
+mapped_array = Config(
+    dict(
+        parallel=False
+    ),
+    frozen=True
+)
+"""_"""
+
+__pdoc__['mapped_array'] = f"""Parameters for mapped array.
+
+```plaintext
+{json.dumps(mapped_array, indent=2, default=str)}
+```
+"""
+
 # Broadcasting
 broadcasting = Config(
     dict(
@@ -269,6 +304,26 @@ __pdoc__['caching'] = f"""Parameters for caching.
 See `vectorbt.utils.decorators.is_caching_enabled`.
 """
 
+# Shared memory
+shm = Config(
+    dict(
+        transport='shm',
+        min_nbytes=64 * 1024,
+        temp_dir=None
+    ),
+    frozen=True
+)
+"""_"""
+
+__pdoc__['shm'] = f"""Parameters for sharing arrays between processes.
+
+```plaintext
+{json.dumps(shm, indent=2, default=str)}
+```
+
+See `vectorbt.utils.shm.shared_arrays`.
+"""
+
 # Returns
 returns = Config(
     dict(
@@ -302,6 +357,9 @@ portfolio = Config(
         allow_partial=True,
         raise_reject=False,
         close_first=False,
+        sl_stop=0.,
+        sl_trail=False,
+        tp_stop=0.,
         accumulate=False,
         log=False,
         conflict_mode='ignore',
@@ -309,10 +367,18 @@ portfolio = Config(
         order_direction='all',
         cash_sharing=False,
         row_wise=False,
+        parallel=False,
+        n_chunks=None,
+        chunk_len=None,
         seed=None,
         freq=None,
         incl_unrealized=False,
-        use_filled_close=True
+        use_filled_close=True,
+        fill_state=False,
+        emit_trades=False,
+        use_sim_cache=False,
+        sim_cache_dir=None,
+        float_dtype='float64'
     ),
     frozen=True
 )
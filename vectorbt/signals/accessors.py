@@ -886,6 +886,46 @@ class SignalsAccessor(GenericAccessor):
         """`vectorbt.signals.nb.rank_nb` >= n."""
         return self.wrapper.wrap(self.rank(**kwargs).values >= n, **merge_dicts({}, wrap_kwargs))
 
+    # ############# Sparse ############# #
+
+    def to_sparse(self):
+        """Convert to `vectorbt.signals.enums.SparseSignals`.
+
+        See `vectorbt.signals.nb.to_sparse_nb`.
+
+        ## Example
+
+        ```python-repl
+        >>> sig.vbt.signals.to_sparse()
+        SparseSignals(shape=(5, 3), idxs=array([0, 0, 2, 4, 0, 1, 2]), col_lens=array([1, 3, 3]))
+        ```"""
+        return nb.to_sparse_nb(self.to_2d_array())
+
+    @classmethod
+    def from_sparse(cls, sparse, index=None, columns=None, name=None):
+        """Convert `vectorbt.signals.enums.SparseSignals` into a Series/DataFrame.
+
+        Returns a Series if `sparse` has one column and `columns` is None, otherwise a DataFrame.
+
+        See `vectorbt.signals.nb.from_sparse_nb`.
+
+        ## Example
+
+        ```python-repl
+        >>> pd.DataFrame.vbt.signals.from_sparse(
+        ...     sig.vbt.signals.to_sparse(), index=sig.index, columns=sig.columns)
+                        a      b      c
+        2020-01-01   True   True   True
+        2020-01-02  False  False   True
+        2020-01-03  False   True   True
+        2020-01-04  False  False  False
+        2020-01-05  False   True  False
+        ```"""
+        out = nb.from_sparse_nb(sparse)
+        if out.shape[1] == 1 and columns is None:
+            return pd.Series(out[:, 0], index=index, name=name)
+        return pd.DataFrame(out, index=index, columns=columns)
+
     # ############# Logical operations ############# #
 
     def AND(self, other, **kwargs):
@@ -6,7 +6,8 @@ from collections import namedtuple
 import json
 
 __all__ = [
-    'StopType'
+    'StopType',
+    'SparseSignals'
 ]
 
 __pdoc__ = {}
@@ -26,3 +27,17 @@ __pdoc__['StopType'] = f"""Stop type.
 {json.dumps(dict(zip(StopType._fields, StopType)), indent=2, default=str)}
 ```
 """
+
+SparseSignals = namedtuple('SparseSignals', [
+    'shape',
+    'idxs',
+    'col_lens'
+])
+
+__pdoc__['SparseSignals'] = """Sparse representation of a signal matrix.
+
+Stores the row indices of True values of each column in a compressed sparse column (CSC) layout,
+similar to the column map of `vectorbt.records.col_mapper.ColumnMapper`."""
+__pdoc__['SparseSignals.shape'] = "Shape of the dense matrix (two-dimensional)."
+__pdoc__['SparseSignals.idxs'] = "Sorted row indices of True values, column by column."
+__pdoc__['SparseSignals.col_lens'] = "Number of True values per column."
@@ -27,7 +27,7 @@ import numpy as np
 
 from vectorbt.utils.array import uniform_summing_to_one_nb, rescale_float_to_int_nb
 from vectorbt.base.reshape_fns import flex_select_auto_nb
-from vectorbt.signals.enums import StopType
+from vectorbt.signals.enums import StopType, SparseSignals
 
 
 # ############# Generation ############# #
@@ -976,3 +976,35 @@ def fshift_1d_nb(a, n):
 def fshift_nb(a, n):
     """2-dim version of `fshift_1d_nb`."""
     return fshift_1d_nb(a, n)
+
+
+# ############# Sparse ############# #
+
+@njit(cache=True)
+def to_sparse_nb(a):
+    """Convert a signal matrix into `vectorbt.signals.enums.SparseSignals`."""
+    col_lens = np.zeros(a.shape[1], dtype=np.int_)
+    for col in range(a.shape[1]):
+        for i in range(a.shape[0]):
+            if a[i, col]:
+                col_lens[col] += 1
+    idxs = np.empty(np.sum(col_lens), dtype=np.int_)
+    k = 0
+    for col in range(a.shape[1]):
+        for i in range(a.shape[0]):
+            if a[i, col]:
+                idxs[k] = i
+                k += 1
+    return SparseSignals((a.shape[0], a.shape[1]), idxs, col_lens)
+
+
+@njit(cache=True)
+def from_sparse_nb(sparse):
+    """Convert `vectorbt.signals.enums.SparseSignals` into a signal matrix."""
+    out = np.full(sparse.shape, False, dtype=np.bool_)
+    k = 0
+    for col in range(sparse.shape[1]):
+        for _ in range(sparse.col_lens[col]):
+            out[sparse.idxs[k], col] = True
+            k += 1
+    return out
@@ -130,6 +130,14 @@ def is_deep_equal(arg1, arg2, check_exact=False, **kwargs):
         else:
             assert_method(arg1, arg2, **__kwargs)
 
+    from vectorbt.records.columnar import ColumnarArray
+
+    # Records are equal regardless of their layout
+    if isinstance(arg1, ColumnarArray) and isinstance(arg2, np.ndarray):
+        arg1 = arg1.to_structured()
+    elif isinstance(arg1, np.ndarray) and isinstance(arg2, ColumnarArray):
+        arg2 = arg2.to_structured()
+
     try:
         safe_assert(type(arg1) == type(arg2))
         if isinstance(arg1, pd.Series):
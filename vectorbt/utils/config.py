@@ -245,6 +245,30 @@ class Configured(Pickleable):
         """Unpickle from a string."""
         return cls(**Config.loads(dumps, **kwargs))
 
+    def save(self, fname, format=None, **kwargs):
+        """Save to the disk.
+
+        If `format` is None, pickles the config into a single file (see `Pickleable.save`).
+        Otherwise, saves the config to a directory of columnar files with `format` being
+        `npy` or `parquet` (see `vectorbt.utils.store.save_store`)."""
+        if format is None:
+            return Pickleable.save(self, fname, **kwargs)
+        from vectorbt.utils.store import save_store
+
+        save_store(self.config, fname, format=format, **kwargs)
+
+    @classmethod
+    def load(cls, fname, mmap=False, **kwargs):
+        """Load from the disk and create new instance.
+
+        Directories created by `Configured.save` with a format are loaded with
+        `vectorbt.utils.store.load_store`. Set `mmap` to True to memory-map the arrays."""
+        from vectorbt.utils.store import is_store, load_store
+
+        if is_store(fname):
+            return cls(**load_store(fname, mmap=mmap))
+        return super().load(fname, **kwargs)
+
     def __eq__(self, other):
         """Objects are equal if their configs are equal."""
         if type(self) != type(other):
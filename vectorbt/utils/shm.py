@@ -0,0 +1,246 @@
+"""Utilities for sharing NumPy arrays between processes.
+
+Arguments sent to worker processes are normally pickled, which copies every array into each task.
+Instead, `shared_arrays` moves arrays out of the arguments once and replaces them with lightweight
+references. Workers call `attach_arrays` to turn the references back into arrays that are views into
+the same memory, without copying. The cost of sending arguments to a worker thus doesn't depend
+on the size of the arrays. Since many tasks attach the same memory, arrays are attached read-only
+by default.
+
+There are two transports:
+
+* `shm`: Arrays are copied into blocks of `multiprocessing.shared_memory` and referenced by `SharedArray`.
+* `mmap`: Arrays are saved as `.npy` files and referenced by `MmapArray`. Workers map the files
+    into memory in copy-on-write mode. Use it if `/dev/shm` is too small for the data.
+
+For defaults, see `vectorbt.settings.shm`. The `shm` transport requires Python 3.8+.
+
+Process pools should use `get_mp_context` rather than forking, see its documentation.
+
+Worker processes are usually reused across tasks, thus tasks should attach arrays using `call_attached`,
+which closes the blocks of shared memory attached by the task once it's done.
+
+```python-repl
+>>> import numpy as np
+>>> from vectorbt.utils.shm import shared_arrays, attach_arrays
+
+>>> with shared_arrays((np.arange(3), {'a': np.ones(2)}), min_nbytes=0) as shared:
+...     print(shared[0])
+...     print(attach_arrays(shared))
+SharedArray(name='psm_...', shape=(3,), dtype='<i8')
+(array([0, 1, 2]), {'a': array([1., 1.])})
+```"""
+
+import os
+import shutil
+import tempfile
+import multiprocessing
+from collections import namedtuple
+from contextlib import contextmanager
+import numpy as np
+
+SharedArray = namedtuple('SharedArray', ['name', 'shape', 'dtype'])
+"""Reference to an array stored in a block of shared memory."""
+
+MmapArray = namedtuple('MmapArray', ['path'])
+"""Reference to an array stored in a `.npy` file."""
+
+_attached = {}
+"""Blocks of shared memory attached in this process, keyed by name.
+
+Blocks must stay open as long as arrays are pointing into them."""
+
+
+def get_mp_context(mp_context=None):
+    """Get context of `multiprocessing`.
+
+    `mp_context` can be a context, the name of a start method, or None, in which case it
+    defaults to `forkserver` where available and `spawn` otherwise.
+
+    The default `fork` start method on Linux is unsafe once Numba has started its threading layer,
+    for example, by calling a function compiled with `parallel=True`: the forked process inherits
+    the state of the threading layer but not its threads, and may deadlock."""
+    if mp_context is None:
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            mp_context = 'forkserver'
+        else:
+            mp_context = 'spawn'
+    if isinstance(mp_context, str):
+        return multiprocessing.get_context(mp_context)
+    return mp_context
+
+
+def share_array(a):
+    """Copy array `a` into a new block of shared memory.
+
+    Returns `SharedArray` and the block, which must be closed and unlinked by the caller."""
+    from multiprocessing import shared_memory
+
+    a = np.asarray(a)
+    shm = shared_memory.SharedMemory(create=True, size=max(a.nbytes, 1))
+    shared_a = np.ndarray(a.shape, dtype=a.dtype, buffer=shm.buf)
+    shared_a[...] = a
+    return SharedArray(shm.name, a.shape, a.dtype.str), shm
+
+
+def mmap_array(a, dir_path):
+    """Save array `a` to a new `.npy` file in `dir_path`.
+
+    Returns `MmapArray`."""
+    fd, path = tempfile.mkstemp(suffix='.npy', dir=dir_path)
+    with os.fdopen(fd, 'wb') as f:
+        np.save(f, np.asarray(a))
+    return MmapArray(path)
+
+
+def attach_array(ref, readonly=True):
+    """Get array from `SharedArray` or `MmapArray` as a view into shared memory.
+
+    If `readonly` is False, the view of `SharedArray` is writable and changes are visible to every
+    process attached to the same block, while the view of `MmapArray` is copy-on-write."""
+    from multiprocessing import shared_memory
+
+    if isinstance(ref, MmapArray):
+        return np.load(ref.path, mmap_mode='r' if readonly else 'c')
+    if ref.name not in _attached:
+        _attached[ref.name] = shared_memory.SharedMemory(name=ref.name)
+    a = np.ndarray(ref.shape, dtype=ref.dtype, buffer=_attached[ref.name].buf)
+    if readonly:
+        a.flags.writeable = False
+    return a
+
+
+def _map_arrays(obj, func):
+    """Apply `func` on each array in `obj` and return a new object.
+
+    Traverses tuples (including named tuples), lists and dicts."""
+    if isinstance(obj, np.ndarray) and obj.dtype != object:
+        return func(obj)
+    if isinstance(obj, (SharedArray, MmapArray)):
+        return func(obj)
+    if isinstance(obj, tuple):
+        new_obj = tuple(_map_arrays(o, func) for o in obj)
+        if hasattr(obj, '_fields'):
+            return type(obj)(*new_obj)
+        return new_obj
+    if isinstance(obj, list):
+        return [_map_arrays(o, func) for o in obj]
+    if isinstance(obj, dict):
+        return {k: _map_arrays(v, func) for k, v in obj.items()}
+    return obj
+
+
+@contextmanager
+def shared_arrays(obj, transport=None, min_nbytes=None, temp_dir=None):
+    """Context manager that moves each array in `obj` into shared memory.
+
+    Yields `obj` with arrays replaced by `SharedArray` if `transport` is `shm`, or by `MmapArray`
+    if `transport` is `mmap`. Tuples, lists and dicts are traversed. Arrays with less than
+    `min_nbytes` bytes are kept as they are, since pickling them is cheap. Files of the `mmap`
+    transport are created in a new directory in `temp_dir`.
+
+    All blocks and files are freed upon exit, so workers must be done by then.
+
+    For defaults, see `vectorbt.settings.shm`."""
+    from vectorbt import settings
+
+    if transport is None:
+        transport = settings.shm['transport']
+    if min_nbytes is None:
+        min_nbytes = settings.shm['min_nbytes']
+    if temp_dir is None:
+        temp_dir = settings.shm['temp_dir']
+    if transport not in ('shm', 'mmap'):
+        raise ValueError(f"Transport '{transport}' is not supported")
+    blocks = []
+    dir_path = None
+
+    def _share(a):
+        nonlocal dir_path
+
+        if isinstance(a, (SharedArray, MmapArray)) or a.nbytes < min_nbytes:
+            return a
+        if transport == 'mmap':
+            if dir_path is None:
+                dir_path = tempfile.mkdtemp(prefix='vbt_mmap_', dir=temp_dir)
+            return mmap_array(a, dir_path)
+        ref, shm = share_array(a)
+        blocks.append(shm)
+        return ref
+
+    try:
+        yield _map_arrays(obj, _share)
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+        if dir_path is not None:
+            shutil.rmtree(dir_path, ignore_errors=True)
+
+
+def attach_arrays(obj, readonly=True):
+    """Replace each `SharedArray` and `MmapArray` in `obj` by an array attached with `attach_array`."""
+    return _map_arrays(
+        obj,
+        lambda a: attach_array(a, readonly=readonly) if isinstance(a, (SharedArray, MmapArray)) else a
+    )
+
+
+def detach_arrays(names=None):
+    """Close blocks of shared memory attached in this process.
+
+    `names` are the names of the blocks to close, defaults to all attached blocks.
+    Arrays pointing into these blocks must not be used anymore."""
+    if names is None:
+        names = list(_attached.keys())
+    for name in names:
+        if name not in _attached:
+            continue
+        try:
+            _attached[name].close()
+        except BufferError:
+            continue  # still referenced
+        del _attached[name]
+
+
+def _shared_names(obj):
+    """Get names of the blocks referenced by `SharedArray` in `obj`."""
+    names = []
+
+    def _collect(a):
+        if isinstance(a, SharedArray) and a.name not in names:
+            names.append(a.name)
+        return a
+
+    _map_arrays(obj, _collect)
+    return names
+
+
+def _copy_shared(obj, names):
+    """Replace each array in `obj` that points into one of the blocks `names` by its copy."""
+    def _copy(a):
+        for name in names:
+            block_a = np.frombuffer(_attached[name].buf, dtype=np.uint8)
+            shared = np.may_share_memory(a, block_a)
+            del block_a  # release the buffer
+            if shared:
+                return np.array(a)
+        return a
+
+    return _map_arrays(obj, _copy)
+
+
+def call_attached(func, args, kwargs, readonly=True):
+    """Call `func` with arrays in `args` and `kwargs` attached using `attach_arrays`.
+
+    Blocks of shared memory that weren't attached before the call are closed afterwards, even if
+    `func` raises. Arrays in the returned object that point into these blocks are copied first.
+    Tuples, lists and dicts in the returned object are traversed."""
+    names = [name for name in _shared_names((args, kwargs)) if name not in _attached]
+    try:
+        args, kwargs = attach_arrays((args, kwargs), readonly=readonly)
+        out = func(*args, **kwargs)
+        del args, kwargs
+        return _copy_shared(out, [name for name in names if name in _attached])
+    finally:
+        detach_arrays(names)
@@ -0,0 +1,216 @@
+"""Utilities for storing configs as directories of columnar files.
+
+`vectorbt.utils.config.Pickleable.save` pickles an object into a single blob that must be read
+back entirely, even if only a small part of it is needed. `save_store` instead writes each array
+of a config into its own file:
+
+* Structured arrays (such as records) and `vectorbt.records.columnar.ColumnarArray` are written
+    field by field: either as one `.npy` file per field (`npy` format) or as one Parquet file
+    (`parquet` format, requires `pyarrow`). Records with a `col` field also get a column index:
+    the number of records in each column and, if records aren't sorted by column, the indices
+    of records segmented by column.
+* Other NumPy arrays and the values of pandas objects are written as `.npy` files. Two-dimensional
+    arrays are written in column-major order, such that each column occupies a contiguous block.
+* Tuples (including named tuples), lists and dicts are traversed.
+* Instances of `vectorbt.utils.config.Pickleable` (such as the array wrapper) are pickled with their
+    own `dumps` method, everything else is pickled as it is. Both go into `meta.pkl`, together with
+    the index and columns of pandas objects.
+
+`load_store` reverses the process. If `mmap` is True, the files are memory-mapped: loading takes
+time proportional to the size of the metadata, and data is read from disk only as it's accessed.
+Memory-mapped files are returned as plain NumPy views rather than `np.memmap` instances, such that
+loaded objects can be compared with and pickled like any other object (pickling copies the data).
+Structured arrays are loaded as `vectorbt.records.columnar.ColumnarArray` with the column index attached.
+Thus, selecting a column of memory-mapped records reads only the records of that column.
+
+```python-repl
+>>> import numpy as np
+>>> import pandas as pd
+>>> from vectorbt.utils.store import save_store, load_store
+
+>>> save_store(dict(a=pd.Series([1., 2.], index=['x', 'y']), b='hello'), 'store')
+>>> load_store('store', mmap=True)
+{'a': x    1.0
+y    2.0
+dtype: float64, 'b': 'hello'}
+```"""
+
+import os
+import shutil
+from collections import namedtuple
+import dill
+import numpy as np
+import pandas as pd
+
+from vectorbt.utils.config import Pickleable, DumpTuple
+
+StoredArray = namedtuple('StoredArray', ['path'])
+"""Reference to an array stored in a `.npy` file."""
+
+StoredRecords = namedtuple('StoredRecords', ['path', 'format', 'dtype', 'col_lens', 'col_idxs'])
+"""Reference to records stored field by field.
+
+`col_lens` and `col_idxs` reference the column index as `StoredArray`, or are None."""
+
+StoredPandas = namedtuple('StoredPandas', ['values', 'index', 'columns', 'name'])
+"""Reference to a Series (`columns` is None) or a DataFrame with values stored as `StoredArray`."""
+
+META_FNAME = 'meta.pkl'
+"""Name of the file with the pickled metadata."""
+
+
+def _save_col_index(records_arr, base_path, key):
+    """Save the column index of records and return references to it."""
+    from vectorbt.records.columnar import ColumnarArray
+    from vectorbt.records import nb
+
+    if 'col' not in records_arr.dtype.names:
+        return None, None
+    if isinstance(records_arr, ColumnarArray) and records_arr.col_lens is not None:
+        col_lens = records_arr.col_lens
+        col_idxs = records_arr.col_idxs
+    else:
+        col_arr = records_arr['col']
+        col_lens = np.bincount(col_arr) if len(col_arr) > 0 else np.full(0, 0, dtype=np.int_)
+        if nb.is_col_sorted_nb(col_arr):
+            col_idxs = None
+        else:
+            col_idxs = np.argsort(col_arr, kind='stable')
+    np.save(os.path.join(base_path, key + '.col_lens.npy'), np.asarray(col_lens))
+    if col_idxs is None:
+        return StoredArray(key + '.col_lens.npy'), None
+    np.save(os.path.join(base_path, key + '.col_idxs.npy'), np.asarray(col_idxs))
+    return StoredArray(key + '.col_lens.npy'), StoredArray(key + '.col_idxs.npy')
+
+
+def _save_records(records_arr, base_path, key, format):
+    """Save a structured array or `vectorbt.records.columnar.ColumnarArray` field by field."""
+    col_index = _save_col_index(records_arr, base_path, key)
+    if format == 'npy':
+        os.mkdir(os.path.join(base_path, key))
+        for field in records_arr.dtype.names:
+            np.save(os.path.join(base_path, key, field + '.npy'), np.ascontiguousarray(records_arr[field]))
+        return StoredRecords(key, format, records_arr.dtype, *col_index)
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.table({field: records_arr[field] for field in records_arr.dtype.names})
+    pq.write_table(table, os.path.join(base_path, key + '.parquet'))
+    return StoredRecords(key + '.parquet', format, records_arr.dtype, *col_index)
+
+
+def _load_array(fname, mmap):
+    """Load a `.npy` file, memory-mapped in copy-on-write mode if `mmap` is True.
+
+    Returns a plain `np.ndarray` view of the memory map."""
+    return np.asarray(np.load(fname, mmap_mode='c' if mmap else None))
+
+
+def _load_records(ref, base_path, mmap):
+    """Load records as `vectorbt.records.columnar.ColumnarArray`."""
+    from vectorbt.records.columnar import ColumnarArray
+
+    path = os.path.join(base_path, ref.path)
+    col_index = {}
+    for k in ('col_lens', 'col_idxs'):
+        if getattr(ref, k) is not None:
+            col_index[k] = _load_array(os.path.join(base_path, getattr(ref, k).path), mmap)
+    if ref.format == 'npy':
+        fields = {
+            field: _load_array(os.path.join(path, field + '.npy'), mmap)
+            for field in ref.dtype.names
+        }
+        return ColumnarArray(fields, dtype=ref.dtype, **col_index)
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(path, memory_map=mmap)
+    fields = {
+        field: table.column(field).to_numpy().astype(ref.dtype[field], copy=False)
+        for field in ref.dtype.names
+    }
+    return ColumnarArray(fields, dtype=ref.dtype, **col_index)
+
+
+def save_store(config, path, format='npy', overwrite=False):
+    """Save `config` to a new directory `path`.
+
+    `format` can be `npy` or `parquet` and applies to records. Other arrays are always written
+    as `.npy` files. If `overwrite` is True, removes the directory if it already exists."""
+    from vectorbt.records.columnar import ColumnarArray
+
+    if format not in ('npy', 'parquet'):
+        raise ValueError(f"Format '{format}' is not supported")
+    path = str(path)
+    if os.path.exists(path):
+        if not overwrite:
+            raise FileExistsError(f"Path '{path}' already exists")
+        shutil.rmtree(path)
+    os.makedirs(path)
+
+    def _save(obj, key):
+        if isinstance(obj, ColumnarArray) \
+                or (isinstance(obj, np.ndarray) and obj.dtype.fields is not None):
+            return _save_records(obj, path, key, format)
+        if isinstance(obj, np.ndarray) and obj.dtype != object and obj.ndim > 0:
+            fname = key + '.npy'
+            np.save(os.path.join(path, fname), np.asfortranarray(obj) if obj.ndim == 2 else obj)
+            return StoredArray(fname)
+        if isinstance(obj, (pd.Series, pd.DataFrame)) and np.asarray(obj.values).dtype != object:
+            if isinstance(obj, pd.Series):
+                return StoredPandas(_save(obj.values, key), obj.index, None, obj.name)
+            return StoredPandas(_save(obj.values, key), obj.index, obj.columns, None)
+        if isinstance(obj, Pickleable):
+            return DumpTuple(cls=obj.__class__, dumps=obj.dumps())
+        if isinstance(obj, tuple):
+            new_obj = tuple(_save(o, f'{key}.{i}') for i, o in enumerate(obj))
+            if hasattr(obj, '_fields'):
+                return type(obj)(*new_obj)
+            return new_obj
+        if isinstance(obj, list):
+            return [_save(o, f'{key}.{i}') for i, o in enumerate(obj)]
+        if isinstance(obj, dict):
+            return {k: _save(v, f'{key}.{k}' if key else str(k)) for k, v in obj.items()}
+        return obj
+
+    meta = _save(dict(config), '')
+    with open(os.path.join(path, META_FNAME), 'wb') as f:
+        f.write(dill.dumps(meta))
+
+
+def load_store(path, mmap=False):
+    """Load a dict saved with `save_store` from directory `path`.
+
+    If `mmap` is True, arrays are memory-mapped in copy-on-write mode: they can be modified
+    in memory, but changes are never written back to disk."""
+    path = str(path)
+    with open(os.path.join(path, META_FNAME), 'rb') as f:
+        meta = dill.loads(f.read())
+
+    def _load(obj):
+        if isinstance(obj, DumpTuple):
+            return obj.cls.loads(obj.dumps)
+        if isinstance(obj, StoredRecords):
+            return _load_records(obj, path, mmap)
+        if isinstance(obj, StoredArray):
+            return _load_array(os.path.join(path, obj.path), mmap)
+        if isinstance(obj, StoredPandas):
+            if obj.columns is None:
+                return pd.Series(_load(obj.values), index=obj.index, name=obj.name, copy=False)
+            return pd.DataFrame(_load(obj.values), index=obj.index, columns=obj.columns, copy=False)
+        if isinstance(obj, tuple):
+            new_obj = tuple(_load(o) for o in obj)
+            if hasattr(obj, '_fields'):
+                return type(obj)(*new_obj)
+            return new_obj
+        if isinstance(obj, list):
+            return [_load(o) for o in obj]
+        if isinstance(obj, dict):
+            return {k: _load(v) for k, v in obj.items()}
+        return obj
+
+    return _load(meta)
+
+
+def is_store(path):
+    """Check whether `path` is a directory created by `save_store`."""
+    return os.path.isfile(os.path.join(str(path), META_FNAME))